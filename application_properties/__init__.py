@@ -7,6 +7,9 @@ https://stackoverflow.com/questions/44834/what-does-all-mean-in-python#When%20Av
 from application_properties.application_properties import (  # noqa F401
     ApplicationProperties,
 )
+from application_properties.application_properties_accessor import (  # noqa F401
+    ApplicationPropertiesAccessor,
+)
 from application_properties.application_properties_config_loader import (  # noqa F401
     ApplicationPropertiesConfigLoader,
 )
@@ -16,15 +19,52 @@ from application_properties.application_properties_facade import (  # noqa F401
 from application_properties.application_properties_json_loader import (  # noqa F401
     ApplicationPropertiesJsonLoader,
 )
+from application_properties.application_properties_key_pattern import (  # noqa F401
+    ApplicationPropertiesKeyPattern,
+)
 from application_properties.application_properties_loader_helper import (  # noqa F401
     ApplicationPropertiesLoaderHelper,
 )
+from application_properties.application_properties_lookup_result import (  # noqa F401
+    PropertyLookupResult,
+    PropertyLookupStatus,
+)
+from application_properties.application_properties_numeric_array import (  # noqa F401
+    PropertyNumericArray,
+)
+from application_properties.application_properties_property_spec import (  # noqa F401
+    PropertySpec,
+)
+from application_properties.application_properties_provenance import (  # noqa F401
+    PropertyProvenance,
+    PropertySource,
+    PropertySourceKind,
+)
+from application_properties.application_properties_schema import (  # noqa F401
+    ApplicationPropertiesSchema,
+)
 from application_properties.application_properties_toml_loader import (  # noqa F401
     ApplicationPropertiesTomlLoader,
 )
 from application_properties.application_properties_utilities import (  # noqa F401
     ApplicationPropertiesUtilities,
 )
+from application_properties.application_properties_validators import (  # noqa F401
+    AllOfValidator,
+    AnyOfValidator,
+    ApplicationPropertiesValidator,
+    ChoicesValidator,
+    LengthValidator,
+    PredicateValidator,
+    RangeValidator,
+    RegexValidator,
+)
+from application_properties.application_properties_view import (  # noqa F401
+    ApplicationPropertiesView,
+)
+from application_properties.application_properties_writer import (  # noqa F401
+    ApplicationPropertiesWriter,
+)
 from application_properties.application_properties_yaml_loader import (  # noqa F401
     ApplicationPropertiesYamlLoader,
 )
@@ -41,6 +81,7 @@ from application_properties.multisource_configuration_loader import (  # noqa F4
 
 __all__ = [
     "ApplicationProperties",
+    "ApplicationPropertiesAccessor",
     "ApplicationPropertiesUtilities",
     "ApplicationPropertiesFacade",
     "ApplicationPropertiesJsonLoader",
@@ -56,4 +97,23 @@ __all__ = [
     "LocalProjectConfigurationFile",
     "SpecifiedConfigurationFile",
     "ManuallySetProperties",
+    "PropertySpec",
+    "PropertyLookupResult",
+    "PropertyLookupStatus",
+    "PropertyNumericArray",
+    "PropertyProvenance",
+    "PropertySource",
+    "PropertySourceKind",
+    "ApplicationPropertiesSchema",
+    "ApplicationPropertiesKeyPattern",
+    "ApplicationPropertiesView",
+    "ApplicationPropertiesWriter",
+    "ApplicationPropertiesValidator",
+    "AllOfValidator",
+    "AnyOfValidator",
+    "ChoicesValidator",
+    "LengthValidator",
+    "PredicateValidator",
+    "RangeValidator",
+    "RegexValidator",
 ]
@@ -2,14 +2,74 @@
 Module that provides for an encapsulation of properties for an application.
 """
 
+# pylint: disable=too-many-lines
+
 import contextlib
 import copy
+import functools
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+import math
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from application_properties.application_properties_accessor import (
+    ApplicationPropertiesAccessor,
+)
+from application_properties.application_properties_binder import (
+    ApplicationPropertiesBinder,
+)
+from application_properties.application_properties_key_index import (
+    ApplicationPropertiesKeyIndexNode,
+)
+from application_properties.application_properties_key_pattern import (
+    ApplicationPropertiesKeyPattern,
+)
+from application_properties.application_properties_lookup_result import (
+    PropertyLookupResult,
+    PropertyLookupStatus,
+)
+from application_properties.application_properties_numeric_array import (
+    PropertyNumericArray,
+)
+from application_properties.application_properties_property_spec import PropertySpec
+from application_properties.application_properties_provenance import (
+    PropertyProvenance,
+    PropertySource,
+    PropertySourceKind,
+)
+from application_properties.application_properties_schema import (
+    ApplicationPropertiesSchema,
+)
+from application_properties.application_properties_store import (
+    IMMUTABLE_VALUE_TYPES,
+    ApplicationPropertiesStore,
+)
+from application_properties.application_properties_validators import (
+    ApplicationPropertiesValidator,
+)
+from application_properties.application_properties_view import ApplicationPropertiesView
 
 LOGGER = logging.getLogger(__name__)
 
+BoundClassT = TypeVar("BoundClassT")
+
 
+# pylint: disable=too-many-public-methods
 class ApplicationProperties:
     """
     Class that provides for an encapsulation of properties for an application.
@@ -21,6 +81,9 @@ class ApplicationProperties:
     __manual_property_type_string = "$"
     __manual_property_type_integer = "#"
     __manual_property_type_boolean = "!"
+    __missing_value = object()
+    __integer_typecodes = ("b", "B", "h", "H", "i", "I", "l", "L", "q", "Q")
+    __float_typecodes = ("f", "d")
 
     """
     Class to provide for a container of properties that belong to the application.
@@ -35,7 +98,10 @@ class ApplicationProperties:
         """
         Initializes an new instance of the ApplicationProperties class.
         """
-        self.__flat_property_map: Dict[str, Any] = {}
+        self.__store = ApplicationPropertiesStore()
+        self.__change_count = 0
+        self.__schema: Optional[ApplicationPropertiesSchema] = None
+        self.__is_frozen = False
         self.__strict_mode: bool = strict_mode
         self.__convert_untyped_if_possible: bool = convert_untyped_if_possible
         self.__allow_separator_in_keys = allow_separator_in_keys
@@ -52,18 +118,31 @@ class ApplicationProperties:
         """
         Number of properties that exist in the map.
         """
-        return len(self.property_names)
+        return len(self.__store.property_map)
 
     @property
     def property_names(self) -> List[str]:
         """
         List of each of the properties in the map.
         """
-        return [
-            next_item
-            for next_item in self.__flat_property_map
-            if not next_item.startswith(ApplicationProperties.__separator)
-        ]
+        return list(self.__store.property_map)
+
+    @property
+    def property_names_view(self) -> KeysView[str]:
+        """
+        Read-only view of each of the properties in the map that reflects any
+        later changes to the map without being rebuilt, including the storage
+        being replaced by `clear`, `publish`, or a change after `read_session`.
+        """
+        return KeysView(self.view())
+
+    @property
+    def change_count(self) -> int:
+        """
+        Gets the number of changes made to the properties in this instance, so that
+        anything derived from the properties can tell when it needs to be rebuilt.
+        """
+        return self.__change_count
 
     @property
     def strict_mode(self) -> bool:
@@ -76,6 +155,7 @@ class ApplicationProperties:
         """
         Sets strict mode to True to enable it.
         """
+        self.__verify_not_frozen()
         self.__strict_mode = True
 
     @property
@@ -89,32 +169,213 @@ class ApplicationProperties:
         """
         Sets convert_untyped_if_possible to True to enable it.
         """
+        self.__verify_not_frozen()
         self.__convert_untyped_if_possible = True
 
+    @property
+    def is_frozen(self) -> bool:
+        """
+        Gets whether the properties have been frozen against any further changes.
+        """
+        return self.__is_frozen
+
+    def freeze(self) -> "ApplicationProperties":
+        """
+        Freeze the properties against any further changes, returning this instance.
+        Once frozen, the properties can be shared between threads without locking,
+        and any mutable value, such as a list, is returned as a copy.
+
+        Reading a value still changes its reference count, so a prefork server
+        that loads the properties before forking should call `gc.freeze()` just
+        before forking, so that at least the garbage collector does not write to
+        the pages holding the stored values.
+        """
+        self.__is_frozen = True
+        return self
+
+    def snapshot(self) -> "ApplicationProperties":
+        """
+        Create a frozen copy of the properties, leaving this instance unchanged.
+
+        The copy has its own compact storage, so later changes to this instance
+        are not seen by the copy.  Immutable values are shared with the copy, and
+        any other value is copied.
+        """
+        new_properties = self.create_staging()
+        # pylint: disable=protected-access, unused-private-member
+        new_properties.__store = self.__store.copy()
+        # pylint: enable=protected-access, unused-private-member
+        return new_properties.freeze()
+
+    @property
+    def generation(self) -> int:
+        """
+        Gets the number of times that new properties have been published to this
+        instance using the `publish` function.
+        """
+        return self.__store.generation
+
+    def create_staging(self) -> "ApplicationProperties":
+        """
+        Create an empty instance with the same settings as this instance, to load
+        the next generation of properties into before calling `publish`.
+        """
+        staged_properties = ApplicationProperties(
+            self.__strict_mode,
+            self.__convert_untyped_if_possible,
+            self.__allow_separator_in_keys,
+        )
+        # pylint: disable=protected-access, unused-private-member
+        staged_properties.__schema = self.__schema
+        # pylint: enable=protected-access, unused-private-member
+        return staged_properties
+
+    def publish(self, staged_properties: "ApplicationProperties") -> None:
+        """
+        Replace all of the properties in this instance with the properties in the
+        staged instance, as a single change.  Readers of this instance see either
+        the old properties or the new properties, never a mix of the two.
+
+        The staged instance is frozen, as it now shares its storage with this instance.
+        """
+        self.__verify_not_frozen()
+        if not isinstance(staged_properties, ApplicationProperties):
+            raise ValueError(
+                "The staged_properties argument must be an ApplicationProperties instance."
+            )
+        if staged_properties is self:
+            raise ValueError("Properties cannot be published to themselves.")
+
+        # pylint: disable=protected-access
+        new_store = staged_properties.__store
+        new_schema = staged_properties.__schema
+        # pylint: enable=protected-access
+        staged_properties.freeze()
+        new_store.generation = self.__store.generation + 1
+        new_store.is_shared = True
+        self.__store = new_store
+        self.__schema = new_schema
+        self.__change_count += 1
+
+    def read_session(self) -> "ApplicationProperties":
+        """
+        Create a frozen instance that keeps reading from the current generation of
+        properties, even after a newer generation is published to this instance.
+        No properties are copied, so the session is cheap to create.  Instead, the
+        storage is copied before the next change to this instance.
+        """
+        session_properties = self.create_staging()
+        self.__store.is_shared = True
+        # pylint: disable=protected-access, unused-private-member
+        session_properties.__store = self.__store
+        # pylint: enable=protected-access, unused-private-member
+        return session_properties.freeze()
+
+    def __verify_not_frozen(self) -> None:
+        if self.__is_frozen:
+            raise ValueError("Frozen properties cannot be changed.")
+
+    def __verify_can_change_store(self) -> None:
+        """
+        Verify that the properties can be changed, first taking a copy of the
+        storage if it is shared with a read session, a published staging instance,
+        or a snapshot view, so that those never see the change.
+        """
+        self.__verify_not_frozen()
+        if self.__store.is_shared:
+            self.__store = self.__store.copy()
+
+    def __detach_value(self, property_value: Any) -> Any:
+        """
+        Frozen properties must not be changed through the values they return, so
+        any value that is not immutable is returned as a copy.
+        """
+        if self.__is_frozen:
+            return ApplicationProperties.__copy_if_mutable(property_value)
+        return property_value
+
+    @staticmethod
+    def __copy_if_mutable(property_value: Any) -> Any:
+        if isinstance(property_value, IMMUTABLE_VALUE_TYPES):
+            return property_value
+        return copy.deepcopy(property_value)
+
     def clear(self) -> None:
         """
         Clear the configuration map.
         """
-        self.__flat_property_map.clear()
+        self.__verify_not_frozen()
+        if self.__store.is_shared:
+            self.__store = self.__store.copy(with_properties=False)
+        else:
+            self.__store.clear()
+        self.__change_count += 1
+
+    @contextlib.contextmanager
+    def recording_source(
+        self,
+        source_kind: PropertySourceKind,
+        file_path: Optional[str] = None,
+        line_number: Optional[int] = None,
+    ) -> Iterator[None]:
+        """
+        Record the specified source as the source of every property set within
+        the `with` block, so that `property_source` and `explain` can report it.
+        """
+        if not isinstance(source_kind, PropertySourceKind):
+            raise ValueError(
+                "The source_kind argument must be a PropertySourceKind value."
+            )
+        store = self.__store
+        previous_source_id = store.current_source_id
+        store.current_source_id = store.intern_source(
+            PropertySource(source_kind, file_path, line_number)
+        )
+        try:
+            yield
+        finally:
+            # A shared store may have been copied before a change in the block.
+            self.__store.current_source_id = previous_source_id
+
+    def __set_flat_property(self, property_key: str, property_value: Any) -> None:
+        self.__change_count += 1
+        if self.__store.current_source_id or self.__store.property_sources:
+            self.__store.record_source(property_key)
+        self.__store.property_map[property_key] = property_value
+        self.__store.key_index.add(property_key)
+        self.__store.stale_digests.add(property_key)
+        self.__store.discard_values(property_key)
 
     def load_from_dict(
         self,
         config_map: Dict[Any, Any],
         clear_map: bool = True,
         allow_periods_in_keys: bool = False,
+        take_ownership: bool = False,
     ) -> None:
         """
         Load the properties from a provided dictionary.
+
+        If `take_ownership` is True, the caller is handing over a dictionary that
+        nothing else refers to, such as one freshly returned by a parser, and its
+        values are stored without being copied.  Otherwise, any values that are
+        not immutable are copied before being stored.
         """
 
+        self.__verify_not_frozen()
         if not isinstance(config_map, dict):
             raise ValueError("Specified parameter was not a dictionary.")
 
-        LOGGER.debug("Loading from dictionary: {%s}", str(config_map))
+        LOGGER.debug("Loading from dictionary: {%s}", config_map)
         if clear_map:
             self.clear()
+        else:
+            self.__verify_can_change_store()
         self.__scan_map(
-            config_map, "", allow_periods_in_keys and self.__allow_separator_in_keys
+            config_map,
+            "",
+            allow_periods_in_keys and self.__allow_separator_in_keys,
+            take_ownership,
         )
 
     @staticmethod
@@ -123,6 +384,12 @@ class ApplicationProperties:
         Given one part of a full key, verify that it is composed properly.
         """
 
+        if part_error := ApplicationProperties.__find_part_form_error(property_key):
+            raise ValueError(part_error)
+        return property_key
+
+    @staticmethod
+    def __find_part_form_error(property_key: str) -> Optional[str]:
         if (
             " " in property_key
             or "\t" in property_key
@@ -130,16 +397,14 @@ class ApplicationProperties:
             or ApplicationProperties.__assignment_operator in property_key
             or ApplicationProperties.__separator in property_key
         ):
-            raise ValueError(
+            return (
                 "Each part of the property key cannot contain a whitespace character, "
                 + f"a '{ApplicationProperties.__assignment_operator}' character, or "
                 + f"a '{ApplicationProperties.__separator}' character."
             )
         if not property_key:
-            raise ValueError(
-                "Each part of the property key must contain at least one character."
-            )
-        return property_key
+            return "Each part of the property key must contain at least one character."
+        return None
 
     @staticmethod
     def verify_full_key_form(
@@ -149,27 +414,61 @@ class ApplicationProperties:
         Given a full key, verify that it is composed properly.
         """
 
-        key_name = alternate_name or "Full property key"
+        _, key_error = ApplicationProperties.__normalize_full_key_form(
+            property_key, alternate_name or "Full property key"
+        )
+        if key_error:
+            raise ValueError(key_error)
+        return property_key
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def __normalize_full_key_form(
+        property_key: str, key_name: str
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Verify the full key, returning its normalized form and any error found.
+        As the same literal keys are looked up repeatedly, the results are memoized.
+        """
 
         if property_key.startswith(
             ApplicationProperties.__separator
         ) or property_key.endswith(ApplicationProperties.__separator):
-            raise ValueError(
-                f"{key_name} must not start or end with the '{ApplicationProperties.__separator}' character."
+            return (
+                property_key,
+                f"{key_name} must not start or end with the '{ApplicationProperties.__separator}' character.",
             )
         doubles = (
             f"{ApplicationProperties.__separator}{ApplicationProperties.__separator}"
         )
         doubles_index = property_key.find(doubles)
         if doubles_index != -1:
-            raise ValueError(
+            return (
+                property_key,
                 f"{key_name} cannot contain multiples of "
-                + f"the {ApplicationProperties.__separator} without any text between them."
+                + f"the {ApplicationProperties.__separator} without any text between them.",
             )
         split_key = property_key.split(ApplicationProperties.__separator)
         for next_key in split_key:
-            ApplicationProperties.verify_full_part_form(next_key)
-        return property_key
+            if part_error := ApplicationProperties.__find_part_form_error(next_key):
+                return property_key, part_error
+        return property_key.lower(), None
+
+    @staticmethod
+    def key_validation_cache_info() -> "functools._CacheInfo":
+        """
+        Gets the hit, miss, and size counters for the memoized key validation.
+        """
+        # pylint: disable=no-value-for-parameter
+        return ApplicationProperties.__normalize_full_key_form.cache_info()
+        # pylint: enable=no-value-for-parameter
+
+    @staticmethod
+    def clear_key_validation_cache() -> None:
+        """
+        Clears the memoized key validation results and counters.
+        """
+        ApplicationProperties.__normalize_full_key_form.cache_clear()
 
     @staticmethod
     def verify_manual_property_form(string_to_verify: str) -> str:
@@ -195,6 +494,7 @@ class ApplicationProperties:
         Manually set a property for the object.
         """
 
+        self.__verify_can_change_store()
         if not isinstance(combined_string, str):
             iterator = None
             try:
@@ -207,36 +507,218 @@ class ApplicationProperties:
                 self.set_manual_property(i)
             return
 
-        ApplicationProperties.verify_manual_property_form(combined_string)
+        property_key, composed_property_value, untyped_value = (
+            self.__parse_manual_property(combined_string)
+        )
+        self.__set_flat_property(property_key, composed_property_value)
+
+        # The manually set property is always a string.  If the string has no type
+        # information associated with it, it is eligible for conversion into one of
+        # the other types.  To denote that eligibility, the original string is also
+        # kept in a separate map of untyped values.
+        if untyped_value is not None:
+            self.__store.untyped_property_map[property_key] = untyped_value
+        LOGGER.debug(
+            "Adding configuration '%s' : {%s}",
+            property_key,
+            composed_property_value,
+        )
+
+    def set_manual_properties(self, combined_strings: Iterable[str]) -> None:
+        """
+        Manually set many properties for the object at once.  Every entry is
+        verified before any of them are set, and all malformed entries are
+        reported together.
+        """
+
+        self.__verify_can_change_store()
+        if isinstance(combined_strings, str):
+            raise ValueError("Manual properties must be an iterable of strings.")
+        try:
+            iterator = iter(combined_strings)
+        except TypeError as this_exception:
+            raise ValueError(
+                "Manual properties must be an iterable of strings."
+            ) from this_exception
+
+        parsed_properties: List[Tuple[str, Any, Optional[str]]] = []
+        collected_errors: List[str] = []
+        for next_string in iterator:
+            try:
+                parsed_properties.append(self.__parse_manual_property(next_string))
+            except ValueError as this_exception:
+                collected_errors.append(
+                    f"Manually set property '{next_string}' was not validly formed: {this_exception}"
+                )
+        if collected_errors:
+            raise ValueError("\n".join(collected_errors))
+
+        store = self.__store
+        property_map = store.property_map
+        untyped_property_map = store.untyped_property_map
+        add_to_index = store.key_index.add
+        is_recording_sources = bool(store.current_source_id or store.property_sources)
+        for property_key, composed_property_value, untyped_value in parsed_properties:
+            if is_recording_sources:
+                store.record_source(property_key)
+            if property_key not in property_map:
+                add_to_index(property_key)
+            # A key that is not present yet may still have a schema default cached.
+            store.discard_values(property_key)
+            property_map[property_key] = composed_property_value
+            if untyped_value is not None:
+                untyped_property_map[property_key] = untyped_value
+        store.stale_digests.update(
+            next_property[0] for next_property in parsed_properties
+        )
+        self.__change_count += 1
+        LOGGER.debug("Added %d manually set properties.", len(parsed_properties))
+
+    def set_property(self, property_name: str, property_value: Any) -> None:
+        """
+        Set a property to a value of any type.  Unlike `set_manual_property`, the
+        value is stored as it is given, instead of being parsed from a string.
+        """
+
+        self.__verify_can_change_store()
+        self.__set_flat_property(
+            *self.__prepare_typed_property(property_name, property_value)
+        )
+
+    def set_properties(self, property_values: Mapping[str, Any]) -> None:
+        """
+        Set many properties at once from a mapping of full property names to
+        values.  Every name and value is verified before any of them are set, and
+        all problems are reported together.
+        """
+
+        self.__verify_can_change_store()
+        if not isinstance(property_values, Mapping):
+            raise ValueError("The property_values argument must be a mapping.")
+
+        prepared_properties: List[Tuple[str, Any]] = []
+        collected_errors: List[str] = []
+        for property_name, property_value in property_values.items():
+            try:
+                prepared_properties.append(
+                    self.__prepare_typed_property(property_name, property_value)
+                )
+            except ValueError as this_exception:
+                collected_errors.append(str(this_exception))
+        if collected_errors:
+            raise ValueError("\n".join(collected_errors))
+
+        store = self.__store
+        property_map = store.property_map
+        add_to_index = store.key_index.add
+        is_recording_sources = bool(store.current_source_id or store.property_sources)
+        for property_key, property_value in prepared_properties:
+            if is_recording_sources:
+                store.record_source(property_key)
+            if property_key not in property_map:
+                add_to_index(property_key)
+            # A key that is not present yet may still have a schema default cached.
+            store.discard_values(property_key)
+            property_map[property_key] = property_value
+        store.stale_digests.update(
+            next_property[0] for next_property in prepared_properties
+        )
+        self.__change_count += 1
+
+    @staticmethod
+    def __prepare_typed_property(
+        property_name: str, property_value: Any
+    ) -> Tuple[str, Any]:
+        if not isinstance(property_name, str):
+            raise ValueError("The propertyName argument must be a string.")
+        property_key, key_error = ApplicationProperties.__normalize_full_key_form(
+            property_name, "Full property key"
+        )
+        if key_error:
+            raise ValueError(
+                f"Property name '{property_name}' is not valid: {key_error}"
+            )
+        if isinstance(property_value, dict):
+            raise ValueError(
+                f"The value for property '{property_key}' cannot be a dictionary."
+            )
+        if not isinstance(property_value, IMMUTABLE_VALUE_TYPES):
+            property_value = copy.deepcopy(property_value)
+        return property_key, property_value
+
+    def remove_property(self, property_name: str) -> bool:
+        """
+        Remove a property, returning whether it was present.
+        """
+
+        self.__verify_can_change_store()
+        if not isinstance(property_name, str):
+            raise ValueError("The propertyName argument must be a string.")
+        property_key = ApplicationProperties.__normalize_key_name(property_name)
+
+        store = self.__store
+        if not store.key_index.remove(property_key):
+            return False
+        del store.property_map[property_key]
+        store.discard_values(property_key)
+        if store.property_sources or store.overridden_values:
+            store.discard_sources(property_key)
+        self.__change_count += 1
+        return True
+
+    def remove_under(self, key_name: str) -> int:
+        """
+        Remove each of the properties at or under the specified key, returning
+        the number of properties removed.
+        """
+
+        self.__verify_can_change_store()
+        if not isinstance(key_name, str):
+            raise ValueError("The key_name argument must be a string.")
+        property_key = ApplicationProperties.__normalize_key_name(key_name)
+
+        store = self.__store
+        removed_keys = store.key_index.remove_under(property_key)
+        is_recording_sources = bool(store.property_sources or store.overridden_values)
+        for next_key in removed_keys:
+            del store.property_map[next_key]
+            store.discard_values(next_key)
+            if is_recording_sources:
+                store.discard_sources(next_key)
+        if removed_keys:
+            self.__change_count += 1
+        return len(removed_keys)
+
+    def __parse_manual_property(
+        self, combined_string: str
+    ) -> Tuple[str, Any, Optional[str]]:
+        """
+        Split a manual property into its normalized key, its typed value, and its
+        original value if that value is untyped.
+        """
+
+        if not isinstance(combined_string, str):
+            raise ValueError("Manual property form must be a string.")
         equals_index = combined_string.find(ApplicationProperties.__assignment_operator)
-        property_key = combined_string[:equals_index].lower()
-        property_value = combined_string[equals_index + 1 :]
-        composed_property_value: Any = property_value
+        if equals_index == -1:
+            raise ValueError(
+                "Manual property key and value must be separated by the '=' character."
+            )
+        property_key, key_error = ApplicationProperties.__normalize_full_key_form(
+            combined_string[:equals_index], "Full property key"
+        )
+        if key_error:
+            raise ValueError(key_error)
 
+        property_value = combined_string[equals_index + 1 :]
         if (
             property_value.startswith(
                 ApplicationProperties.__manual_property_type_prefix
             )
             and len(property_value) >= 2
         ):
-            composed_property_value = self.__adjust_property_type(property_value)
-
-        # This is a bit of a kludge, but it works consistently.  The manually set property
-        # is always a string.  If the string has no type information associatede with it,
-        # it is eligible for conversion into one of the other types.  To properly denote that
-        # the value did not have any type information, it is saved again in the dictionary
-        # with a prefix of the separator character, to denote eligibility.
-        else:
-            self.__flat_property_map[
-                f"{ApplicationProperties.__separator}{property_key}"
-            ] = property_value
-
-        self.__flat_property_map[property_key] = copy.deepcopy(composed_property_value)
-        LOGGER.debug(
-            "Adding configuration '%s' : {%s}",
-            property_key,
-            str(composed_property_value),
-        )
+            return property_key, self.__adjust_property_type(property_value), None
+        return property_key, property_value, property_value
 
     def __adjust_property_type(self, property_value: str) -> Any:
         composed_property_value: Any = None
@@ -271,11 +753,33 @@ class ApplicationProperties:
                 "The 'is_required' parameter cannot be set to 'True' with the 'default_value' parameter set to a value that is not None."
             )
 
-        ApplicationProperties.verify_full_key_form(property_name)
         effective_strict_mode = (
             self.__strict_mode if strict_mode is None else bool(strict_mode)
         )
-        return property_name.lower(), effective_strict_mode
+        return (
+            ApplicationProperties.__normalize_key_name(property_name),
+            effective_strict_mode,
+        )
+
+    @staticmethod
+    def __verify_property_type_and_default(
+        property_name: str, property_type: type, default_value: Any
+    ) -> None:
+        if not isinstance(property_type, type):
+            raise ValueError(
+                f"The property_type argument for '{property_name}' must be a type."
+            )
+
+        if default_value is not None:
+            is_eligible = isinstance(default_value, property_type)
+            if is_eligible and property_type == int and isinstance(default_value, bool):
+                is_eligible = False
+
+            if not is_eligible:
+                raise ValueError(
+                    f"The default value for property '{property_name}' must "
+                    + f"either be None or a '{property_type.__name__}' value."
+                )
 
     # pylint: disable=too-many-arguments
     def get_property(
@@ -294,27 +798,16 @@ class ApplicationProperties:
         property_name, new_strict_mode = self.__get_property_prolog(
             property_name, default_value, is_required, strict_mode
         )
-
-        if not isinstance(property_type, type):
-            raise ValueError(
-                f"The property_type argument for '{property_name}' must be a type."
-            )
-
-        if default_value is not None:
-            is_eligible = isinstance(default_value, property_type)
-            if is_eligible and property_type == int and isinstance(default_value, bool):
-                is_eligible = False
-
-            if not is_eligible:
-                raise ValueError(
-                    f"The default value for property '{property_name}' must "
-                    + f"either be None or a '{property_type.__name__}' value."
-                )
+        ApplicationProperties.__verify_property_type_and_default(
+            property_name, property_type, default_value
+        )
 
         property_value = default_value
         LOGGER.debug("property_name=%s", property_name)
-        if property_name in self.__flat_property_map:
+        store = self.__store
+        if property_name in store.property_map:
             property_value = self.__get_present_property(
+                store,
                 property_name,
                 property_value,
                 property_type,
@@ -325,77 +818,403 @@ class ApplicationProperties:
             raise ValueError(
                 f"A value for property '{property_name}' must be provided."
             )
-        return property_value
+        return self.__detach_value(property_value)
 
     # pylint: enable=too-many-arguments
 
-    def __get_present_property_value(
-        self, property_name: str, property_type: type
-    ) -> Tuple[bool, Any]:
-        found_value = self.__flat_property_map[property_name]
-        is_eligible = isinstance(found_value, property_type)
-        if is_eligible and property_type == int and isinstance(found_value, bool):
-            is_eligible = False
-
-        covertable_property_name = f"{ApplicationProperties.__separator}{property_name}"
-        if (
-            not is_eligible
-            and property_type != str
-            and self.__convert_untyped_if_possible
-            and covertable_property_name in self.__flat_property_map
-        ):
-            found_value = self.__flat_property_map[covertable_property_name]
-            # print(f"::{covertable_property_name}::{found_value}::")
-            if property_type == bool:
-                found_value = f"{ApplicationProperties.__manual_property_type_prefix}{ApplicationProperties.__manual_property_type_boolean}{found_value}"
-            else:
-                found_value = f"{ApplicationProperties.__manual_property_type_prefix}{ApplicationProperties.__manual_property_type_integer}{found_value}"
-            with contextlib.suppress(ValueError):
-                found_value = self.__adjust_property_type(found_value)
-                is_eligible = True
-            # print(f"::{covertable_property_name}::{found_value}::")
-        return is_eligible, found_value
-
-    # pylint: disable=too-many-arguments, broad-exception-caught
-    def __get_present_property(
+    def get_properties(
         self,
-        property_name: str,
-        property_value: Any,
-        property_type: type,
-        strict_mode: bool,
-        valid_value_fn: Optional[Callable[[Any], Any]],
-    ) -> Any:
-        is_eligible, found_value = self.__get_present_property_value(
-            property_name, property_type
+        property_specs: Iterable[Union[PropertySpec, Tuple[Any, ...]]],
+        strict_mode: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get many properties from the configuration in one pass, returning a
+        dictionary from each specified property name to its value.
+
+        Each specification is a `PropertySpec` or a tuple with the same fields.
+        Instead of stopping at the first problem, every problem found with the
+        specifications or, in strict mode, with the values is collected and
+        reported together in one `ValueError`.
+        """
+        effective_strict_mode = (
+            self.__strict_mode if strict_mode is None else bool(strict_mode)
         )
-        if not is_eligible and strict_mode:
-            raise ValueError(
-                f"The value for property '{property_name}' must be of type '{property_type.__name__}'."
-            )
-        if is_eligible and valid_value_fn:
+        store = self.__store
+        found_values: Dict[str, Any] = {}
+        collected_errors: List[str] = []
+        for next_spec in property_specs:
             try:
-                valid_value_fn(found_value)
-            except Exception as this_exception:
-                is_eligible = False
-                if strict_mode:
+                property_spec = (
+                    next_spec
+                    if isinstance(next_spec, PropertySpec)
+                    else PropertySpec(*next_spec)
+                )
+                found_values[property_spec.property_name] = self.__detach_value(
+                    self.__get_spec_property(
+                        store, property_spec, effective_strict_mode
+                    )
+                )
+            except (TypeError, ValueError) as this_exception:
+                collected_errors.append(str(this_exception))
+        if collected_errors:
+            raise ValueError("\n".join(collected_errors))
+        return found_values
+
+    @staticmethod
+    def compile_schema(
+        property_specs: Iterable[Union[PropertySpec, Tuple[Any, ...]]],
+    ) -> ApplicationPropertiesSchema:
+        """
+        Compile a schema from the specifications of the properties that the
+        application expects.  Each specification is verified once, here, and
+        every problem found is reported together in one `ValueError`.
+        """
+        verified_specs: Dict[str, PropertySpec] = {}
+        collected_errors: List[str] = []
+        for next_spec in property_specs:
+            try:
+                property_spec = (
+                    next_spec
+                    if isinstance(next_spec, PropertySpec)
+                    else PropertySpec(*next_spec)
+                )
+                if not isinstance(property_spec.property_name, str):
+                    raise ValueError("The propertyName argument must be a string.")
+                if (
+                    property_spec.is_required
+                    and property_spec.default_value is not None
+                ):
                     raise ValueError(
-                        f"The value for property '{property_name}' is not valid: {str(this_exception)}"
-                    ) from this_exception
-        if is_eligible:
-            property_value = found_value
-        return property_value
+                        f"The property '{property_spec.property_name}' cannot be required and have a default value."
+                    )
+                property_name = ApplicationProperties.__normalize_key_name(
+                    property_spec.property_name
+                )
+                ApplicationProperties.__verify_property_type_and_default(
+                    property_name,
+                    property_spec.property_type,
+                    property_spec.default_value,
+                )
+            except (TypeError, ValueError) as this_exception:
+                collected_errors.append(str(this_exception))
+                continue
+            if property_name in verified_specs:
+                collected_errors.append(
+                    f"The property '{property_name}' is specified more than once."
+                )
+            else:
+                verified_specs[property_name] = property_spec._replace(
+                    property_name=property_name
+                )
+        if collected_errors:
+            raise ValueError("\n".join(collected_errors))
+        return ApplicationPropertiesSchema(verified_specs)
 
-    # pylint: enable=too-many-arguments, broad-exception-caught
+    @property
+    def schema(self) -> Optional[ApplicationPropertiesSchema]:
+        """
+        Gets the schema that was last applied to the properties, if any.
+        """
+        return self.__schema
 
-    def get_boolean_property(
-        self,
-        property_name: str,
-        default_value: Optional[bool] = None,
-        is_required: bool = False,
-        strict_mode: Optional[bool] = None,
-    ) -> Optional[bool]:
+    def apply_schema(self, schema: ApplicationPropertiesSchema) -> List[str]:
         """
-        Get a boolean property from the configuration.
+        Check every property in the schema against the properties in one pass,
+        in strict mode, returning a description of each violation found.  Only if
+        there are no violations is the schema applied, so that the checked values
+        are returned by `get_declared_property` without being checked again.
+        """
+        self.__verify_can_change_store()
+        if not isinstance(schema, ApplicationPropertiesSchema):
+            raise ValueError(
+                "The schema argument must be an ApplicationPropertiesSchema instance."
+            )
+
+        store = self.__store
+        schema_values: Dict[str, Any] = {}
+        schema_violations: List[str] = []
+        for property_spec in schema.property_specs:
+            try:
+                schema_values[property_spec.property_name] = (
+                    self.__get_verified_spec_property(
+                        store, property_spec.property_name, property_spec, True
+                    )
+                )
+            except (TypeError, ValueError) as this_exception:
+                schema_violations.append(
+                    self.__describe_violation(
+                        store, property_spec.property_name, str(this_exception)
+                    )
+                )
+        if not schema_violations:
+            self.__schema = schema
+            store.schema_values = schema_values
+        return schema_violations
+
+    @staticmethod
+    def __describe_violation(
+        store: ApplicationPropertiesStore, property_key: str, violation: str
+    ) -> str:
+        if source_id := store.property_sources.get(property_key):
+            return f"{violation} (set from {store.sources[source_id]})"
+        return violation
+
+    def get_declared_property(self, property_name: str) -> Any:
+        """
+        Get the value of a property declared in the applied schema.  The value was
+        checked when the schema was applied, and is only checked again if the
+        property has changed since then.
+        """
+        if not isinstance(property_name, str):
+            raise ValueError("The propertyName argument must be a string.")
+        store = self.__store
+        found_value = store.schema_values.get(
+            property_name, ApplicationProperties.__missing_value
+        )
+        if found_value is not ApplicationProperties.__missing_value:
+            return self.__detach_value(found_value)
+
+        if self.__schema is None:
+            raise ValueError(
+                "A schema must be applied before getting a declared property."
+            )
+        property_spec = self.__schema.find_spec(
+            ApplicationProperties.__normalize_key_name(property_name)
+        )
+        if property_spec is None:
+            raise ValueError(
+                f"The property '{property_name}' is not declared in the schema."
+            )
+        found_value = self.__get_verified_spec_property(
+            store, property_spec.property_name, property_spec, True
+        )
+        store.schema_values[property_spec.property_name] = found_value
+        return self.__detach_value(found_value)
+
+    def bind(self, key_prefix: str, bound_class: Type[BoundClassT]) -> BoundClassT:
+        """
+        Create an instance of the dataclass `bound_class`, with each of its fields
+        set from the property with the same name under `key_prefix`.  Fields that
+        are themselves dataclasses are bound to the properties one level further down.
+
+        The plan for reading the properties is compiled once for each class and
+        prefix, so binding again after a reload is cheap.  Binding is always done
+        in strict mode, with every problem reported together in one `ValueError`.
+        """
+        if not isinstance(key_prefix, str):
+            raise ValueError("The key_prefix argument must be a string.")
+        if key_prefix:
+            key_prefix = ApplicationProperties.__normalize_key_name(key_prefix)
+        binding_plan = ApplicationPropertiesBinder.compile_plan(
+            key_prefix, cast(type, bound_class)
+        )
+        return cast(
+            BoundClassT,
+            binding_plan.build(
+                self.get_properties(binding_plan.property_specs, strict_mode=True)
+            ),
+        )
+
+    def __get_spec_property(
+        self,
+        store: ApplicationPropertiesStore,
+        property_spec: PropertySpec,
+        strict_mode: bool,
+    ) -> Any:
+        property_name, _ = self.__get_property_prolog(
+            property_spec.property_name,
+            property_spec.default_value,
+            property_spec.is_required,
+            strict_mode,
+        )
+        ApplicationProperties.__verify_property_type_and_default(
+            property_name, property_spec.property_type, property_spec.default_value
+        )
+        return self.__get_verified_spec_property(
+            store, property_name, property_spec, strict_mode
+        )
+
+    def __get_verified_spec_property(
+        self,
+        store: ApplicationPropertiesStore,
+        property_name: str,
+        property_spec: PropertySpec,
+        strict_mode: bool,
+    ) -> Any:
+        found_value = store.property_map.get(
+            property_name, ApplicationProperties.__missing_value
+        )
+        if found_value is not ApplicationProperties.__missing_value:
+            # An exact type match avoids treating a bool as an int.
+            # pylint: disable=unidiomatic-typecheck
+            if (
+                type(found_value) is property_spec.property_type
+                and not property_spec.valid_value_fn
+            ):
+                return found_value
+            # pylint: enable=unidiomatic-typecheck
+            return self.__get_present_property(
+                store,
+                property_name,
+                property_spec.default_value,
+                property_spec.property_type,
+                strict_mode,
+                property_spec.valid_value_fn,
+            )
+        if property_spec.is_required:
+            raise ValueError(
+                f"A value for property '{property_name}' must be provided."
+            )
+        return property_spec.default_value
+
+    # pylint: disable=too-many-arguments
+    def compile_accessor(
+        self,
+        property_name: str,
+        property_type: type,
+        default_value: Any = None,
+        valid_value_fn: Optional[Callable[[Any], Any]] = None,
+        is_required: bool = False,
+        strict_mode: Optional[Any] = None,
+    ) -> ApplicationPropertiesAccessor:
+        """
+        Compile a handle for repeatedly getting a property of a generic type from
+        the configuration.  The arguments are the same as for `get_property`, and
+        are validated once here, instead of on each call to the handle's `get`
+        function.
+        """
+
+        property_name, _ = self.__get_property_prolog(
+            property_name, default_value, is_required, strict_mode
+        )
+        ApplicationProperties.__verify_property_type_and_default(
+            property_name, property_type, default_value
+        )
+
+        def fetch_property_value() -> Any:
+            store = self.__store
+            found_value = store.property_map.get(
+                property_name, ApplicationProperties.__missing_value
+            )
+            if found_value is ApplicationProperties.__missing_value:
+                if is_required:
+                    raise ValueError(
+                        f"A value for property '{property_name}' must be provided."
+                    )
+                return default_value
+            # An exact type match avoids treating a bool as an int.
+            # pylint: disable=unidiomatic-typecheck
+            if type(found_value) is property_type and not valid_value_fn:
+                return self.__detach_value(found_value)
+            # pylint: enable=unidiomatic-typecheck
+            return self.__detach_value(
+                self.__get_present_property(
+                    store,
+                    property_name,
+                    default_value,
+                    property_type,
+                    self.__strict_mode if strict_mode is None else bool(strict_mode),
+                    valid_value_fn,
+                )
+            )
+
+        return ApplicationPropertiesAccessor(
+            property_name, property_type, fetch_property_value
+        )
+
+    # pylint: enable=too-many-arguments
+
+    def __get_present_property_value(
+        self, store: ApplicationPropertiesStore, property_name: str, property_type: type
+    ) -> Tuple[bool, Any]:
+        found_value = store.property_map[property_name]
+        is_eligible = isinstance(found_value, property_type)
+        if is_eligible and property_type == int and isinstance(found_value, bool):
+            is_eligible = False
+
+        if (
+            not is_eligible
+            and property_type != str
+            and self.__convert_untyped_if_possible
+            and property_name in store.untyped_property_map
+        ):
+            converted_values = store.converted_values.setdefault(property_name, {})
+            if (converted_value := converted_values.get(property_type)) is None:
+                converted_value = self.__convert_untyped_value(
+                    store.untyped_property_map[property_name], property_type
+                )
+                converted_values[property_type] = converted_value
+            is_eligible, found_value = converted_value
+        return is_eligible, found_value
+
+    def __convert_untyped_value(
+        self, untyped_value: str, property_type: type
+    ) -> Tuple[bool, Any]:
+        if property_type == bool:
+            found_value: Any = (
+                f"{ApplicationProperties.__manual_property_type_prefix}{ApplicationProperties.__manual_property_type_boolean}{untyped_value}"
+            )
+        else:
+            found_value = f"{ApplicationProperties.__manual_property_type_prefix}{ApplicationProperties.__manual_property_type_integer}{untyped_value}"
+        with contextlib.suppress(ValueError):
+            return True, self.__adjust_property_type(found_value)
+        return False, found_value
+
+    # pylint: disable=too-many-arguments, broad-exception-caught
+    def __get_present_property(
+        self,
+        store: ApplicationPropertiesStore,
+        property_name: str,
+        property_value: Any,
+        property_type: type,
+        strict_mode: bool,
+        valid_value_fn: Optional[Callable[[Any], Any]],
+    ) -> Any:
+        is_eligible, found_value = self.__get_present_property_value(
+            store, property_name, property_type
+        )
+        if not is_eligible and strict_mode:
+            raise ValueError(
+                f"The value for property '{property_name}' must be of type '{property_type.__name__}'."
+            )
+        if is_eligible and isinstance(valid_value_fn, ApplicationPropertiesValidator):
+            # Without strict mode, the reason that a value is not valid is not needed.
+            if not (strict_mode or valid_value_fn.remembers_results):
+                is_eligible = valid_value_fn.is_valid(found_value)
+            elif (
+                validation_error := self.__find_validation_error(
+                    store, property_name, property_type, found_value, valid_value_fn
+                )
+            ) is not None:
+                is_eligible = False
+                if strict_mode:
+                    raise ValueError(
+                        f"The value for property '{property_name}' is not valid: {validation_error}"
+                    )
+        elif is_eligible and valid_value_fn:
+            try:
+                valid_value_fn(found_value)
+            except Exception as this_exception:
+                is_eligible = False
+                if strict_mode:
+                    raise ValueError(
+                        f"The value for property '{property_name}' is not valid: {str(this_exception)}"
+                    ) from this_exception
+        if is_eligible:
+            property_value = found_value
+        return property_value
+
+    # pylint: enable=too-many-arguments, broad-exception-caught
+
+    def get_boolean_property(
+        self,
+        property_name: str,
+        default_value: Optional[bool] = None,
+        is_required: bool = False,
+        strict_mode: Optional[bool] = None,
+    ) -> Optional[bool]:
+        """
+        Get a boolean property from the configuration.
         """
         return cast(
             bool,
@@ -461,6 +1280,143 @@ class ApplicationProperties:
 
     # pylint: enable=too-many-arguments
 
+    def try_get_property(
+        self,
+        property_name: str,
+        property_type: type,
+        default_value: Any = None,
+        valid_value_fn: Optional[Callable[[Any], Any]] = None,
+    ) -> PropertyLookupResult:
+        """
+        Try to get an property of a generic type from the configuration, returning
+        the value and the reason code for it instead of raising an exception when
+        the property is missing, of the wrong type, or not valid.  Only problems
+        with the arguments themselves raise an exception.
+        """
+        if not isinstance(property_name, str):
+            raise ValueError("The propertyName argument must be a string.")
+        property_name = ApplicationProperties.__normalize_key_name(property_name)
+        ApplicationProperties.__verify_property_type_and_default(
+            property_name, property_type, default_value
+        )
+
+        store = self.__store
+        if property_name not in store.property_map:
+            return PropertyLookupResult(
+                PropertyLookupStatus.MISSING, default_value, property_name
+            )
+        is_eligible, found_value = self.__get_present_property_value(
+            store, property_name, property_type
+        )
+        if not is_eligible:
+            return PropertyLookupResult(
+                PropertyLookupStatus.WRONG_TYPE,
+                default_value,
+                property_name,
+                (property_type,),
+            )
+        if (
+            valid_value_fn is not None
+            and (
+                rejection := self.__find_rejection(
+                    store, property_name, property_type, found_value, valid_value_fn
+                )
+            )
+            is not None
+        ):
+            return PropertyLookupResult(
+                PropertyLookupStatus.NOT_VALID,
+                default_value,
+                property_name,
+                rejection,
+                found_value,
+            )
+        # The found result is built straight from its fields, as it is the most
+        # common result and the named tuple's constructor is written in Python.
+        return tuple.__new__(
+            PropertyLookupResult,
+            (
+                PropertyLookupStatus.FOUND,
+                self.__detach_value(found_value),
+                property_name,
+                None,
+                None,
+            ),
+        )
+
+    def try_get_boolean_property(
+        self, property_name: str, default_value: Optional[bool] = None
+    ) -> PropertyLookupResult:
+        """
+        Try to get a boolean property from the configuration, as with `try_get_property`.
+        """
+        return self.try_get_property(property_name, bool, default_value=default_value)
+
+    def try_get_integer_property(
+        self,
+        property_name: str,
+        default_value: Optional[int] = None,
+        valid_value_fn: Optional[Callable[[int], Any]] = None,
+    ) -> PropertyLookupResult:
+        """
+        Try to get an integer property from the configuration, as with `try_get_property`.
+        """
+        return self.try_get_property(
+            property_name,
+            int,
+            default_value=default_value,
+            valid_value_fn=valid_value_fn,
+        )
+
+    def try_get_string_property(
+        self,
+        property_name: str,
+        default_value: Optional[str] = None,
+        valid_value_fn: Optional[Callable[[str], Any]] = None,
+    ) -> PropertyLookupResult:
+        """
+        Try to get a string property from the configuration, as with `try_get_property`.
+        """
+        return self.try_get_property(
+            property_name,
+            str,
+            default_value=default_value,
+            valid_value_fn=valid_value_fn,
+        )
+
+    # pylint: disable=broad-exception-caught
+    def __find_rejection(
+        self,
+        store: ApplicationPropertiesStore,
+        property_name: str,
+        value_kind: Any,
+        found_value: Any,
+        valid_value_fn: Callable[[Any], Any],
+    ) -> Any:
+        """
+        Find whatever rejects the value of a property, without formatting any
+        message: the validator itself, the exception raised by a validation
+        function, or None if the value is valid.
+        """
+        if isinstance(valid_value_fn, ApplicationPropertiesValidator):
+            if valid_value_fn.remembers_results:
+                is_valid = (
+                    self.__find_validation_error(
+                        store, property_name, value_kind, found_value, valid_value_fn
+                    )
+                    is None
+                )
+            else:
+                is_valid = valid_value_fn.is_valid(found_value)
+            return None if is_valid else valid_value_fn
+        try:
+            valid_value_fn(found_value)
+        except Exception as this_exception:
+            return this_exception
+        return None
+
+    # pylint: enable=broad-exception-caught
+
     def __validate_string_list_default_value_elements(
         self, property_name: str, default_value: Optional[List[str]] = None
     ) -> None:
@@ -476,15 +1432,59 @@ class ApplicationProperties:
                 )
 
     # pylint: disable=too-many-arguments, broad-exception-caught
+    @staticmethod
+    def __find_validation_error(
+        store: ApplicationPropertiesStore,
+        property_name: str,
+        value_kind: Any,
+        found_value: Any,
+        validator: ApplicationPropertiesValidator,
+    ) -> Optional[str]:
+        """
+        Validate the value of a property with a declarative validator, remembering
+        the result until the property's value changes.  The kind of value is part
+        of the key, as the same property may be fetched as different types.
+        """
+        if not validator.remembers_results:
+            return validator.find_error(found_value)
+
+        # Results are keyed by the value of the validator, so that an equal
+        # validator created for each call still finds the remembered result.
+        if (validation_results := store.validation_results.get(property_name)) is None:
+            validation_results = store.validation_results[property_name] = {}
+        result_key = (validator, value_kind)
+        if (
+            remembered_result := validation_results.get(
+                result_key, ApplicationProperties.__missing_value
+            )
+        ) is not ApplicationProperties.__missing_value:
+            return cast(Optional[str], remembered_result)
+        validation_error = validator.find_error(found_value)
+        validation_results[result_key] = validation_error
+        return validation_error
+
     def __validate_parsed_list(
         self,
+        store: ApplicationPropertiesStore,
         property_name: str,
+        value_kind: Any,
         default_value: Optional[List[str]],
         parsed_list: List[str],
         valid_value_fn: Optional[Callable[[List[str]], Any]],
         strict_mode: bool,
     ) -> Optional[List[str]]:
-        if valid_value_fn is not None:
+        if isinstance(valid_value_fn, ApplicationPropertiesValidator):
+            if (
+                validation_error := self.__find_validation_error(
+                    store, property_name, value_kind, parsed_list, valid_value_fn
+                )
+            ) is not None:
+                if strict_mode:
+                    raise ValueError(
+                        f"The value for property '{property_name}' is not valid: {validation_error}"
+                    )
+                return default_value
+        elif valid_value_fn is not None:
             try:
                 valid_value_fn(parsed_list)
             except Exception as this_exception:
@@ -497,81 +1497,50 @@ class ApplicationProperties:
 
     # pylint: enable=too-many-arguments, broad-exception-caught
 
-    # pylint: disable=too-many-arguments
-    def __get_string_list_property_string(
-        self,
-        property_name: str,
-        delimiter: Optional[str],
-        default_value: Optional[List[str]],
-        valid_value_fn: Optional[Callable[[List[str]], Any]],
-        strict_mode: bool,
-    ) -> Optional[List[str]]:
-        if not isinstance(delimiter, str) or not delimiter:
-            raise ValueError("The delimiter argument must be a non-empty string.")
-        self.__validate_string_list_default_value_elements(property_name, default_value)
-
-        try:
-            raw_string_value = self.get_string_property(
-                property_name, None, None, False, strict_mode
-            )
-        except ValueError as this_exception:
-            assert "must be of type" in str(this_exception)
-            raise ValueError(
+    def __parse_string_list_string(
+        self, property_name: str, found_value: Any, delimiter: str, strict_mode: bool
+    ) -> Tuple[Optional[Tuple[str, ...]], Optional[str]]:
+        if not isinstance(found_value, str):
+            return None, (
                 f"The value for property '{property_name}' must be of type 'str' or type 'List[str]'."
-            ) from this_exception
-        if raw_string_value is None:
-            return default_value
+                if strict_mode
+                else None
+            )
 
         parsed_list: List[str] = []
-        for next_tag_part in raw_string_value.split(delimiter):
+        for next_tag_part in found_value.split(delimiter):
             if next_tag_part := next_tag_part.strip(" "):
                 parsed_list.append(next_tag_part)
-            elif strict_mode:
-                raise ValueError(
+            else:
+                return None, (
                     f"Configuration item '{property_name}' contains at least one empty element."
+                    if strict_mode
+                    else None
                 )
-            else:
-                return default_value
-        return self.__validate_parsed_list(
-            property_name, default_value, parsed_list, valid_value_fn, strict_mode
-        )
-
-    # pylint: enable=too-many-arguments
-
-    # pylint: disable=too-many-arguments
-    def __get_string_list_property_list(
-        self,
-        property_name: str,
-        default_value: Optional[List[str]],
-        found_value: List[str],
-        valid_value_fn: Optional[Callable[[List[str]], Any]],
-        strict_mode: bool,
-    ) -> Optional[List[str]]:
+        return tuple(parsed_list), None
 
+    def __parse_string_list_list(
+        self, property_name: str, found_value: List[Any], strict_mode: bool
+    ) -> Tuple[Optional[Tuple[str, ...]], Optional[str]]:
         parsed_list: List[str] = []
         for next_element in found_value:
             if not isinstance(next_element, str):
-                if strict_mode:
-                    raise ValueError(
-                        f"Configuration item '{property_name}' contains at least one non-string element: {next_element}."
-                    )
-                return default_value
+                return None, (
+                    f"Configuration item '{property_name}' contains at least one non-string element: {next_element}."
+                    if strict_mode
+                    else None
+                )
             if next_element := next_element.strip(" "):
                 parsed_list.append(next_element)
-            elif strict_mode:
-                raise ValueError(
+            else:
+                return None, (
                     f"Configuration item '{property_name}' contains at least one empty element."
+                    if strict_mode
+                    else None
                 )
-            else:
-                return default_value
-
-        return self.__validate_parsed_list(
-            property_name, default_value, parsed_list, valid_value_fn, strict_mode
-        )
-
-    # pylint: enable=too-many-arguments
+        return tuple(parsed_list), None
 
-    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-arguments, too-many-locals
     def get_string_list_property(
         self,
         property_name: str,
@@ -583,54 +1552,522 @@ class ApplicationProperties:
     ) -> Optional[List[str]]:
         """
         Get a list of strings property from the configuration.
+
+        The result of parsing each property is cached until that property is
+        changed, and each call returns a new copy of the cached list.
         """
         property_name, new_strict_mode = self.__get_property_prolog(
             property_name, default_value, is_required, strict_mode
         )
 
         # Just do enough checking that we can determine if we need to handle this as a list of strings.
-        found_value = self.__flat_property_map.get(property_name, None)
-        if found_value is None and is_required:
+        store = self.__store
+        found_value = store.property_map.get(
+            property_name, ApplicationProperties.__missing_value
+        )
+        is_missing = found_value is ApplicationProperties.__missing_value
+        if (is_missing or found_value is None) and is_required:
             raise ValueError(
                 f"A value for property '{property_name}' must be provided."
             )
 
-        # Either call the "list" processor or the "string" processor.
-        if isinstance(found_value, list):
-            return self.__get_string_list_property_list(
-                property_name,
-                default_value,
-                found_value,
-                valid_value_fn,
-                new_strict_mode,
+        # A list is used as is, while anything else is treated as a delimited string.
+        is_list = isinstance(found_value, list)
+        if not is_list:
+            if not isinstance(delimiter, str) or not delimiter:
+                raise ValueError("The delimiter argument must be a non-empty string.")
+            self.__validate_string_list_default_value_elements(
+                property_name, default_value
             )
-        return self.__get_string_list_property_string(
+            if is_missing:
+                return default_value
+
+        list_delimiter = None if is_list else delimiter
+        parsed_list, parse_error = self.__get_parsed_string_list(
+            store, property_name, found_value, list_delimiter, new_strict_mode
+        )
+        if parse_error:
+            raise ValueError(parse_error)
+        if parsed_list is None:
+            return default_value
+        return self.__validate_parsed_list(
+            store,
             property_name,
-            delimiter,
+            (list, list_delimiter),
             default_value,
+            list(parsed_list),
             valid_value_fn,
             new_strict_mode,
         )
 
+    # pylint: enable=too-many-arguments, too-many-locals
+
+    # pylint: disable=too-many-arguments
+    def __get_parsed_string_list(
+        self,
+        store: ApplicationPropertiesStore,
+        property_name: str,
+        found_value: Any,
+        delimiter: Optional[str],
+        strict_mode: bool,
+    ) -> Tuple[Optional[Tuple[str, ...]], Optional[str]]:
+        """
+        Parse the value of a property as a list of strings, using the delimiter
+        for a string value, or the list itself if the delimiter is None.
+        """
+        parsed_values = store.string_list_values.setdefault(property_name, {})
+        cache_key = (delimiter, strict_mode)
+        if (parsed_value := parsed_values.get(cache_key)) is None:
+            parsed_value = (
+                self.__parse_string_list_list(property_name, found_value, strict_mode)
+                if delimiter is None
+                else self.__parse_string_list_string(
+                    property_name, found_value, delimiter, strict_mode
+                )
+            )
+            parsed_values[cache_key] = parsed_value
+        return parsed_value
+
     # pylint: enable=too-many-arguments
 
+    def try_get_string_list_property(
+        self,
+        property_name: str,
+        delimiter: Optional[str] = None,
+        default_value: Optional[List[str]] = None,
+        valid_value_fn: Optional[Callable[[List[str]], Any]] = None,
+    ) -> PropertyLookupResult:
+        """
+        Try to get a list of strings property from the configuration, as with
+        `try_get_property`.  A value that cannot be parsed into a list of strings
+        is reported as not valid, with the reason that parsing failed.
+        """
+        property_name, _ = self.__get_property_prolog(
+            property_name, default_value, False, None
+        )
+
+        store = self.__store
+        found_value = store.property_map.get(
+            property_name, ApplicationProperties.__missing_value
+        )
+        is_list = isinstance(found_value, list)
+        if not is_list:
+            if not isinstance(delimiter, str) or not delimiter:
+                raise ValueError("The delimiter argument must be a non-empty string.")
+            self.__validate_string_list_default_value_elements(
+                property_name, default_value
+            )
+            if found_value is ApplicationProperties.__missing_value:
+                return PropertyLookupResult(
+                    PropertyLookupStatus.MISSING, default_value, property_name
+                )
+            if not isinstance(found_value, str):
+                return PropertyLookupResult(
+                    PropertyLookupStatus.WRONG_TYPE,
+                    default_value,
+                    property_name,
+                    (str, List[str]),
+                )
+
+        # The strict parse is cached with its reason, so the reason is formatted once.
+        list_delimiter = None if is_list else delimiter
+        parsed_list, parse_error = self.__get_parsed_string_list(
+            store, property_name, found_value, list_delimiter, True
+        )
+        if parsed_list is None:
+            return PropertyLookupResult(
+                PropertyLookupStatus.NOT_VALID,
+                default_value,
+                property_name,
+                parse_error,
+                found_value,
+            )
+        found_list = list(parsed_list)
+        if (
+            valid_value_fn is not None
+            and (
+                rejection := self.__find_rejection(
+                    store,
+                    property_name,
+                    (list, list_delimiter),
+                    found_list,
+                    valid_value_fn,
+                )
+            )
+            is not None
+        ):
+            return PropertyLookupResult(
+                PropertyLookupStatus.NOT_VALID,
+                default_value,
+                property_name,
+                rejection,
+                found_list,
+            )
+        return PropertyLookupResult(
+            PropertyLookupStatus.FOUND, found_list, property_name
+        )
+
     def property_names_under(self, key_name: str) -> List[str]:
         """
-        List of each of the properties in the map under the specified key.
+        List of each of the properties in the map at or under the specified key.
+        Only whole parts of the key are matched, so `plugins.md0` does not match
+        `plugins.md001.enabled`.
+        """
+        return self.__store.key_index.names_under(self.__normalize_key_name(key_name))
+
+    def view(
+        self, snapshot: bool = False, key_name: Optional[str] = None
+    ) -> ApplicationPropertiesView:
+        """
+        Create a read-only mapping view over the properties, or over the properties
+        under the specified key with their names relative to that key.
+
+        By default the view is live, and sees every later change to the properties,
+        including any published staged properties.  With `snapshot` set, the view
+        only sees the properties as they are now.  The view shares the storage,
+        which is marked as shared so that any instance using it takes a compact
+        copy of it before its next change.
+        """
+        if key_name is not None:
+            key_name = self.__normalize_key_name(key_name)
+        copy_value = (
+            ApplicationProperties.__copy_if_mutable
+            if snapshot or self.__is_frozen
+            else None
+        )
+        if not snapshot:
+            return ApplicationPropertiesView(
+                lambda: self.__store,
+                key_name,
+                ApplicationProperties.__separator,
+                copy_value,
+            )
+        bound_store = self.__store
+        bound_store.is_shared = True
+        return ApplicationPropertiesView(
+            lambda: bound_store, key_name, ApplicationProperties.__separator, copy_value
+        )
+
+    def get_section(self, key_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the properties under the specified key, or every property if no key
+        is specified, as nested dictionaries like those given to `load_from_dict`.
+        Any quoted key part containing the separator is unquoted again.
+
+        Each section is cached until a property in it is changed, and each call
+        returns a new copy of the nested dictionaries, sharing the stored values.
+        """
+        section_key = "" if key_name is None else self.__normalize_key_name(key_name)
+        store = self.__store
+        if (section_value := store.section_values.get(section_key)) is None:
+            section_node = (
+                store.key_index.find_node(section_key)
+                if section_key
+                else store.key_index.root
+            )
+            section_value = (
+                ApplicationProperties.__build_section(section_node, store.property_map)
+                if section_node
+                else {}
+            )
+            store.section_values[section_key] = section_value
+        return ApplicationProperties.__copy_section(section_value, self.__is_frozen)
+
+    def iterate_nested_properties(
+        self, key_name: Optional[str] = None
+    ) -> Iterator[Tuple[str, Tuple[str, ...], Any]]:
+        """
+        Iterate over the properties under the specified key, or every property if
+        no key is specified, with the unquoted parts of each name relative to that
+        key.  The parts at each level are in sorted order, so the properties come
+        in the same order as a nested dictionary sorted at every level, allowing
+        them to be written out as one without building it first.
+        """
+        section_key = "" if key_name is None else self.__normalize_key_name(key_name)
+        store = self.__store
+        section_node = (
+            store.key_index.find_node(section_key)
+            if section_key
+            else store.key_index.root
+        )
+        if not section_node:
+            return
+        property_map = store.property_map
+        nodes_to_visit = [
+            (
+                iter(ApplicationProperties.__sorted_children(section_node)),
+                cast(Tuple[str, ...], ()),
+            )
+        ]
+        while nodes_to_visit:
+            for next_part, next_node in nodes_to_visit[-1][0]:
+                next_parts = nodes_to_visit[-1][1] + (next_part,)
+                if not next_node.children:
+                    next_key = cast(str, next_node.property_key)
+                    yield next_key, next_parts, self.__detach_value(
+                        property_map[next_key]
+                    )
+                    continue
+                if next_node.property_key is not None:
+                    raise ValueError(
+                        f"The property '{next_node.property_key}' has both a value and properties under it, so it cannot be part of a section."
+                    )
+                nodes_to_visit.append(
+                    (
+                        iter(ApplicationProperties.__sorted_children(next_node)),
+                        next_parts,
+                    )
+                )
+                break
+            else:
+                nodes_to_visit.pop()
+
+    @staticmethod
+    def __sorted_children(
+        parent_node: ApplicationPropertiesKeyIndexNode,
+    ) -> List[Tuple[str, ApplicationPropertiesKeyIndexNode]]:
+        return sorted(
+            (
+                (ApplicationProperties.__unquote_key_part(next_segment), next_node)
+                for next_segment, next_node in parent_node.children.items()
+            ),
+            key=lambda next_child: next_child[0],
+        )
+
+    @staticmethod
+    def __unquote_key_part(key_part: str) -> str:
+        if (
+            len(key_part) > 1
+            and key_part[0] == key_part[-1] == "'"
+            and ApplicationProperties.__separator in key_part
+        ):
+            return key_part[1:-1]
+        return key_part
+
+    @staticmethod
+    def __build_section(
+        section_node: ApplicationPropertiesKeyIndexNode, property_map: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        section_value: Dict[str, Any] = {}
+        for next_segment, next_node in section_node.children.items():
+            next_segment = ApplicationProperties.__unquote_key_part(next_segment)
+            if not next_node.children:
+                section_value[next_segment] = property_map[
+                    cast(str, next_node.property_key)
+                ]
+            elif next_node.property_key is not None:
+                raise ValueError(
+                    f"The property '{next_node.property_key}' has both a value and properties under it, so it cannot be part of a section."
+                )
+            else:
+                section_value[next_segment] = ApplicationProperties.__build_section(
+                    next_node, property_map
+                )
+        return section_value
+
+    @staticmethod
+    def __copy_section(
+        section_value: Dict[str, Any], copy_values: bool
+    ) -> Dict[str, Any]:
+        # Stored values are never dictionaries, so each dictionary is a section.
+        return {
+            next_key: (
+                ApplicationProperties.__copy_section(next_value, copy_values)
+                if isinstance(next_value, dict)
+                else (
+                    ApplicationProperties.__copy_if_mutable(next_value)
+                    if copy_values
+                    else next_value
+                )
+            )
+            for next_key, next_value in section_value.items()
+        }
+
+    def property_names_matching(
+        self, key_pattern: Union[str, ApplicationPropertiesKeyPattern]
+    ) -> List[str]:
+        """
+        List of each of the properties in the map that match the pattern, such as
+        `plugins.*.enabled` or `rules.md0??.level`.  A segment of `*` matches any
+        one segment and a segment of `**` matches any number of segments.  Only
+        the parts of the key index that can match the pattern are visited.
+        """
+        if not isinstance(key_pattern, ApplicationPropertiesKeyPattern):
+            key_pattern = ApplicationPropertiesKeyPattern.compile_pattern(key_pattern)
+        return key_pattern.names_matching(self.__store.key_index)
+
+    def number_of_properties_under(self, key_name: str) -> int:
+        """
+        Number of properties in the map at or under the specified key.
+        """
+        return self.__store.key_index.count_under(self.__normalize_key_name(key_name))
+
+    def fingerprint(self, key_name: Optional[str] = None) -> str:
+        """
+        Fingerprint of the keys and values of every property at or under the
+        specified key, or of every property if no key is specified.  The
+        fingerprint is kept up to date as properties are changed, does not
+        depend on the order they were set in, and is stable across processes.
+        """
+        self.__store.refresh_digests()
+        key_digest = self.__store.key_index.digest_under(
+            None if key_name is None else self.__normalize_key_name(key_name)
+        )
+        return f"{key_digest:016x}"
+
+    def diff(
+        self, other_properties: "ApplicationProperties", key_name: Optional[str] = None
+    ) -> List[str]:
+        """
+        List of the names of the properties at or under the specified key, or of
+        any property if no key is specified, that are only present in one of the
+        two instances or have different values in each.  Only the parts of the
+        property tree with different fingerprints are visited.
+        """
+        if not isinstance(other_properties, ApplicationProperties):
+            raise ValueError(
+                "The other_properties argument must be an ApplicationProperties instance."
+            )
+        other_store = other_properties.__store  # pylint: disable=protected-access
+        self.__store.refresh_digests()
+        other_store.refresh_digests()
+        return self.__store.key_index.names_differing_under(
+            other_store.key_index,
+            None if key_name is None else self.__normalize_key_name(key_name),
+        )
+
+    def property_source(self, property_name: str) -> Optional[PropertySource]:
+        """
+        Get the source that set the current value of the property, or None if the
+        property is not present or was set directly.
+        """
+        if not isinstance(property_name, str):
+            raise ValueError("The propertyName argument must be a string.")
+        store = self.__store
+        return store.sources[
+            store.property_sources.get(
+                ApplicationProperties.__normalize_key_name(property_name), 0
+            )
+        ]
+
+    def explain(self, property_name: str) -> List[PropertyProvenance]:
         """
-        ApplicationProperties.verify_full_key_form(key_name)
+        Explain where the value of the property came from.  The current value and
+        its source are first, followed by each value that it overrode from a lower
+        layer, starting with the most recent.  If the property is not present, the
+        list is empty.
+        """
+        if not isinstance(property_name, str):
+            raise ValueError("The propertyName argument must be a string.")
+        property_key = ApplicationProperties.__normalize_key_name(property_name)
+        store = self.__store
+        if property_key not in store.property_map:
+            return []
+        sources = store.sources
         return [
-            next_key_name
-            for next_key_name in self.__flat_property_map
-            if next_key_name.startswith(key_name)
+            PropertyProvenance(
+                self.__detach_value(store.property_map[property_key]),
+                sources[store.property_sources.get(property_key, 0)],
+            )
+        ] + [
+            PropertyProvenance(self.__detach_value(next_value), sources[next_source_id])
+            for next_source_id, next_value in reversed(
+                store.overridden_values.get(property_key, ())
+            )
         ]
 
+    # pylint: disable=too-many-locals
+    def get_numeric_array(
+        self, key_name: str, typecode: str = "d"
+    ) -> PropertyNumericArray:
+        """
+        Extract the numbers in every property at or under the specified key, or in
+        the list-valued property with that key, into an `array.array` with the
+        specified type code in one pass.  A value that is not a number, or does not
+        fit the type code, is stored as zero and marked in the mask instead of
+        raising an exception.  Integer type codes only accept integers.
+        """
+        if (
+            typecode not in ApplicationProperties.__integer_typecodes
+            and typecode not in ApplicationProperties.__float_typecodes
+        ):
+            raise ValueError(
+                "The typecode argument must be one of the numeric array type codes."
+            )
+        key_name = self.__normalize_key_name(key_name)
+        store = self.__store
+        found_value = store.property_map.get(
+            key_name, ApplicationProperties.__missing_value
+        )
+        if isinstance(found_value, list):
+            property_names = tuple(
+                f"{key_name}[{value_index}]" for value_index in range(len(found_value))
+            )
+            found_values = found_value
+        else:
+            property_names = tuple(store.key_index.names_under(key_name))
+            property_map = store.property_map
+            found_values = [
+                property_map[next_property_name]
+                for next_property_name in property_names
+            ]
+
+        is_float_array = typecode in ApplicationProperties.__float_typecodes
+        accepted_types = (int, float) if is_float_array else (int,)
+        convert_names = (
+            store.untyped_property_map
+            if self.__convert_untyped_if_possible and found_values is not found_value
+            else {}
+        )
+        values = array(typecode)
+        valid_mask = array("b")
+        for next_property_name, next_value in zip(property_names, found_values):
+            # Checking the exact type excludes booleans, which are also integers.
+            is_valid = type(next_value) in accepted_types
+            if not is_valid and next_property_name in convert_names:
+                is_valid, next_value = self.__get_present_property_value(
+                    store, next_property_name, int
+                )
+            if is_valid:
+                try:
+                    values.append(next_value)
+                except OverflowError:
+                    is_valid = False
+                else:
+                    # A float that is too large for a single precision array is
+                    # stored as infinity instead of raising an exception.
+                    if (
+                        is_float_array
+                        and math.isinf(values[-1])
+                        and not math.isinf(next_value)
+                    ):
+                        values.pop()
+                        is_valid = False
+            if not is_valid:
+                values.append(0)
+            valid_mask.append(is_valid)
+        return PropertyNumericArray(property_names, values, valid_mask)
+
+    # pylint: enable=too-many-locals
+
+    @staticmethod
+    def __normalize_key_name(key_name: str) -> str:
+        normalized_key_name, key_error = (
+            ApplicationProperties.__normalize_full_key_form(
+                key_name, "Full property key"
+            )
+        )
+        if key_error:
+            raise ValueError(key_error)
+        return normalized_key_name
+
     # pylint: disable=too-many-boolean-expressions
     def __scan_map(
         self,
         config_map: Dict[Any, Any],
         current_prefix: str,
         allow_periods_in_keys: bool,
+        take_ownership: bool,
     ) -> None:
         for next_key, next_value in config_map.items():
             if not isinstance(next_key, str):
@@ -660,12 +2097,18 @@ class ApplicationProperties:
                     next_value,
                     f"{current_prefix}{next_key}{self.__separator}",
                     allow_periods_in_keys,
+                    take_ownership,
                 )
             else:
                 new_key = f"{current_prefix}{next_key}".lower()
-                self.__flat_property_map[new_key] = copy.deepcopy(next_value)
-                LOGGER.debug(
-                    "Adding configuration '%s' : {%s}", new_key, str(next_value)
-                )
+                if not (
+                    take_ownership or isinstance(next_value, IMMUTABLE_VALUE_TYPES)
+                ):
+                    next_value = copy.deepcopy(next_value)
+                self.__set_flat_property(new_key, next_value)
+                LOGGER.debug("Adding configuration '%s' : {%s}", new_key, next_value)
 
     # pylint: enable=too-many-boolean-expressions
+
+
+# pylint: enable=too-many-public-methods
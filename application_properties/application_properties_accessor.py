@@ -0,0 +1,49 @@
+"""
+Module to provide for a precompiled handle to a single property within an
+ApplicationProperties instance.
+"""
+
+from typing import Any, Callable
+
+
+class ApplicationPropertiesAccessor:
+    """
+    Class to provide for a precompiled handle to a single property within an
+    ApplicationProperties instance.  All argument and key validation is performed
+    once, when the handle is compiled, leaving only the lookup for each `get` call.
+    """
+
+    __slots__ = ("__property_name", "__property_type", "__fetch_fn")
+
+    def __init__(
+        self,
+        property_name: str,
+        property_type: type,
+        fetch_fn: Callable[[], Any],
+    ) -> None:
+        """
+        Initializes an new instance of the ApplicationPropertiesAccessor class.
+        """
+        self.__property_name = property_name
+        self.__property_type = property_type
+        self.__fetch_fn = fetch_fn
+
+    @property
+    def property_name(self) -> str:
+        """
+        Normalized name of the property that this accessor reads.
+        """
+        return self.__property_name
+
+    @property
+    def property_type(self) -> type:
+        """
+        Type of the property that this accessor reads.
+        """
+        return self.__property_type
+
+    def get(self) -> Any:
+        """
+        Get the current value of the property from the configuration.
+        """
+        return self.__fetch_fn()
@@ -0,0 +1,166 @@
+"""
+Module to provide for binding a subtree of properties to a dataclass.
+"""
+
+import dataclasses
+import functools
+import types
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from application_properties.application_properties_property_spec import PropertySpec
+
+
+# pylint: disable=too-few-public-methods
+class ApplicationPropertiesBindingPlan:
+    """
+    Class to provide for a compiled plan for binding a subtree of properties to a
+    dataclass.  The plan depends only on the class and the key prefix, so it is
+    built once and reused each time the same class is bound to the same prefix.
+    """
+
+    __slots__ = ("__bound_class", "__field_sources", "__property_specs")
+
+    def __init__(
+        self,
+        bound_class: type,
+        field_sources: List[
+            Tuple[
+                str,
+                Union[str, "ApplicationPropertiesBindingPlan"],
+                Optional[Callable[[], Any]],
+            ]
+        ],
+        property_specs: List[PropertySpec],
+    ) -> None:
+        """
+        Initializes an new instance of the ApplicationPropertiesBindingPlan class.
+        """
+        self.__bound_class = bound_class
+        self.__field_sources = field_sources
+        self.__property_specs = property_specs
+
+    @property
+    def property_specs(self) -> List[PropertySpec]:
+        """
+        Specifications for every property read by the plan, including the
+        properties of any nested dataclasses.
+        """
+        return self.__property_specs
+
+    def build(self, found_values: Dict[str, Any]) -> Any:
+        """
+        Create an instance of the bound class from the values found for the
+        plan's property specifications.
+        """
+        field_values: Dict[str, Any] = {}
+        for field_name, field_source, default_factory in self.__field_sources:
+            if isinstance(field_source, ApplicationPropertiesBindingPlan):
+                field_value = field_source.build(found_values)
+            else:
+                field_value = found_values[field_source]
+                if field_value is None and default_factory:
+                    field_value = default_factory()
+            field_values[field_name] = field_value
+        return self.__bound_class(**field_values)
+
+
+# pylint: enable=too-few-public-methods
+
+
+# pylint: disable=too-few-public-methods
+class ApplicationPropertiesBinder:
+    """
+    Class to provide for binding a subtree of properties to a dataclass.
+    """
+
+    __separator = "."
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def compile_plan(
+        key_prefix: str, bound_class: type
+    ) -> ApplicationPropertiesBindingPlan:
+        """
+        Compile the plan for binding the properties under `key_prefix` to the
+        fields of the dataclass `bound_class`.
+        """
+        if not (
+            isinstance(bound_class, type) and dataclasses.is_dataclass(bound_class)
+        ):
+            raise ValueError("The bound_class argument must be a dataclass type.")
+
+        type_hints = typing.get_type_hints(bound_class)
+        field_sources: List[
+            Tuple[
+                str,
+                Union[str, ApplicationPropertiesBindingPlan],
+                Optional[Callable[[], Any]],
+            ]
+        ] = []
+        property_specs: List[PropertySpec] = []
+        for next_field in dataclasses.fields(bound_class):
+            if not next_field.init:
+                continue
+            property_name = (
+                f"{key_prefix}{ApplicationPropertiesBinder.__separator}{next_field.name}"
+                if key_prefix
+                else next_field.name
+            )
+            field_type = ApplicationPropertiesBinder.__resolve_field_type(
+                property_name, type_hints[next_field.name]
+            )
+            if dataclasses.is_dataclass(field_type):
+                nested_plan = ApplicationPropertiesBinder.compile_plan(
+                    property_name, field_type
+                )
+                field_sources.append((next_field.name, nested_plan, None))
+                property_specs.extend(nested_plan.property_specs)
+                continue
+
+            default_factory: Optional[Callable[[], Any]] = None
+            if next_field.default_factory is not dataclasses.MISSING:
+                default_factory = next_field.default_factory
+            default_value = (
+                None
+                if next_field.default is dataclasses.MISSING
+                else next_field.default
+            )
+            field_sources.append((next_field.name, property_name, default_factory))
+            property_specs.append(
+                PropertySpec(
+                    property_name,
+                    field_type,
+                    default_value,
+                    None,
+                    next_field.default is dataclasses.MISSING
+                    and default_factory is None,
+                )
+            )
+        return ApplicationPropertiesBindingPlan(
+            bound_class, field_sources, property_specs
+        )
+
+    @staticmethod
+    def __resolve_field_type(property_name: str, field_type: Any) -> type:
+        field_origin = typing.get_origin(field_type)
+        if field_origin in (Union, types.UnionType):
+            field_arguments = [
+                next_argument
+                for next_argument in typing.get_args(field_type)
+                if next_argument is not types.NoneType
+            ]
+            if len(field_arguments) == 1:
+                return ApplicationPropertiesBinder.__resolve_field_type(
+                    property_name, field_arguments[0]
+                )
+        elif field_origin is not None and isinstance(field_origin, type):
+            return field_origin
+        elif isinstance(field_type, type):
+            return field_type
+        raise ValueError(
+            f"The type of the field for property '{property_name}' is not supported: {field_type}"
+        )
+
+
+# pylint: enable=too-few-public-methods
@@ -10,6 +10,7 @@ from application_properties.application_properties import ApplicationProperties
 from application_properties.application_properties_loader_helper import (
     ApplicationPropertiesLoaderHelper,
 )
+from application_properties.application_properties_provenance import PropertySourceKind
 
 
 # pylint: disable=too-few-public-methods
@@ -56,21 +57,24 @@ class ApplicationPropertiesConfigLoader:
 
         did_apply_one = False
         set_property_names: Set[str] = set()
-        for next_section_name in config_parser.sections():
-            (
-                did_apply_one,
-                did_have_one_error,
-            ) = ApplicationPropertiesConfigLoader.__next_section(
-                properties_object,
-                next_section_name,
-                configuration_file,
-                handle_error_fn,
-                section_header,
-                config_parser,
-                set_property_names,
-                did_have_one_error,
-                did_apply_one,
-            )
+        with properties_object.recording_source(
+            PropertySourceKind.INI, configuration_file
+        ):
+            for next_section_name in config_parser.sections():
+                (
+                    did_apply_one,
+                    did_have_one_error,
+                ) = ApplicationPropertiesConfigLoader.__next_section(
+                    properties_object,
+                    next_section_name,
+                    configuration_file,
+                    handle_error_fn,
+                    section_header,
+                    config_parser,
+                    set_property_names,
+                    did_have_one_error,
+                    did_apply_one,
+                )
         return did_apply_one and not did_have_one_error, did_have_one_error
 
     # pylint: enable=too-many-arguments
@@ -4,9 +4,21 @@ only exposes part of the properties tree.
 """
 
 import logging
-from typing import Any, Callable, List, Optional
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
-from application_properties.application_properties import ApplicationProperties
+from application_properties.application_properties import (
+    ApplicationProperties,
+    BoundClassT,
+)
+from application_properties.application_properties_accessor import (
+    ApplicationPropertiesAccessor,
+)
+from application_properties.application_properties_lookup_result import (
+    PropertyLookupResult,
+)
+from application_properties.application_properties_provenance import PropertyProvenance
+from application_properties.application_properties_view import ApplicationPropertiesView
 
 LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +29,9 @@ class ApplicationPropertiesFacade:
     only exposes part of the properties tree.
     """
 
+    __full_name_cache_size = 1024
+    __pattern_character = re.compile("[*?[]")
+
     def __init__(
         self, base_properties: ApplicationProperties, property_prefix: str
     ) -> None:
@@ -36,6 +51,52 @@ class ApplicationPropertiesFacade:
                 f"The property_prefix argument must end with the separator character '{base_properties.separator}'."
             )
         self.__property_prefix = property_prefix
+        self.__property_key = ApplicationProperties.verify_full_key_form(
+            property_prefix[: -len(base_properties.separator)], "Property prefix"
+        )
+        # Characters in the prefix that a pattern treats as wildcards are matched
+        # as themselves, as they may be part of a key.
+        self.__pattern_prefix = ApplicationPropertiesFacade.__pattern_character.sub(
+            "[\\g<0>]", property_prefix
+        )
+        self.__full_names: Dict[str, str] = {}
+        self.__cached_names: Tuple[int, Tuple[str, ...]] = (-1, ())
+
+    def __full_property_name(self, property_name: str) -> str:
+        """
+        Get the full name of the property in the base properties.  The full names
+        are remembered, so that each lookup of the same property in the base
+        properties uses the same string.
+        """
+        if not isinstance(property_name, str):
+            return f"{self.__property_prefix}{property_name}"
+        if (full_name := self.__full_names.get(property_name)) is None:
+            full_name = f"{self.__property_prefix}{property_name}"
+            if (
+                len(self.__full_names)
+                < ApplicationPropertiesFacade.__full_name_cache_size
+            ):
+                self.__full_names[property_name] = full_name
+        return full_name
+
+    @property
+    def property_prefix(self) -> str:
+        """
+        Prefix, ending with the separator, that this facade adds to each property name.
+        """
+        return self.__property_prefix
+
+    def sub_facade(self, property_prefix: str) -> "ApplicationPropertiesFacade":
+        """
+        Create a facade for the part of the properties tree under `property_prefix`,
+        relative to this facade.  The new facade works directly with the base
+        properties, instead of going through this facade.
+        """
+        if not isinstance(property_prefix, str):
+            raise ValueError("The property_prefix argument must be a string.")
+        return ApplicationPropertiesFacade(
+            self.__base_properties, f"{self.__property_prefix}{property_prefix}"
+        )
 
     # pylint: disable=too-many-arguments
     def get_property(
@@ -52,7 +113,7 @@ class ApplicationPropertiesFacade:
         """
 
         return self.__base_properties.get_property(
-            f"{self.__property_prefix}{property_name}",
+            self.__full_property_name(property_name),
             property_type,
             default_value=default_value,
             valid_value_fn=valid_value_fn,
@@ -72,7 +133,7 @@ class ApplicationPropertiesFacade:
         Get a boolean property from the configuration.
         """
         return self.__base_properties.get_boolean_property(
-            f"{self.__property_prefix}{property_name}",
+            self.__full_property_name(property_name),
             default_value=default_value,
             is_required=is_required,
         )
@@ -90,7 +151,7 @@ class ApplicationPropertiesFacade:
         Get an integer property from the configuration.
         """
         return self.__base_properties.get_integer_property(
-            f"{self.__property_prefix}{property_name}",
+            self.__full_property_name(property_name),
             default_value=default_value,
             valid_value_fn=valid_value_fn,
             is_required=is_required,
@@ -112,7 +173,7 @@ class ApplicationPropertiesFacade:
         Get a string property from the configuration.
         """
         return self.__base_properties.get_string_property(
-            f"{self.__property_prefix}{property_name}",
+            self.__full_property_name(property_name),
             default_value=default_value,
             valid_value_fn=valid_value_fn,
             is_required=is_required,
@@ -121,24 +182,179 @@ class ApplicationPropertiesFacade:
 
     # pylint: enable=too-many-arguments
 
+    def try_get_property(
+        self,
+        property_name: str,
+        property_type: type,
+        default_value: Any = None,
+        valid_value_fn: Optional[Callable[[Any], Any]] = None,
+    ) -> PropertyLookupResult:
+        """
+        Try to get an property of a generic type from the configuration, as with
+        `ApplicationProperties.try_get_property`.
+        """
+        return self.__base_properties.try_get_property(
+            self.__full_property_name(property_name),
+            property_type,
+            default_value=default_value,
+            valid_value_fn=valid_value_fn,
+        )
+
+    def try_get_boolean_property(
+        self, property_name: str, default_value: Optional[bool] = None
+    ) -> PropertyLookupResult:
+        """
+        Try to get a boolean property from the configuration.
+        """
+        return self.__base_properties.try_get_boolean_property(
+            self.__full_property_name(property_name), default_value=default_value
+        )
+
+    def try_get_integer_property(
+        self,
+        property_name: str,
+        default_value: Optional[int] = None,
+        valid_value_fn: Optional[Callable[[int], Any]] = None,
+    ) -> PropertyLookupResult:
+        """
+        Try to get an integer property from the configuration.
+        """
+        return self.__base_properties.try_get_integer_property(
+            self.__full_property_name(property_name),
+            default_value=default_value,
+            valid_value_fn=valid_value_fn,
+        )
+
+    def try_get_string_property(
+        self,
+        property_name: str,
+        default_value: Optional[str] = None,
+        valid_value_fn: Optional[Callable[[str], Any]] = None,
+    ) -> PropertyLookupResult:
+        """
+        Try to get a string property from the configuration.
+        """
+        return self.__base_properties.try_get_string_property(
+            self.__full_property_name(property_name),
+            default_value=default_value,
+            valid_value_fn=valid_value_fn,
+        )
+
+    # pylint: disable=too-many-arguments
+    def compile_accessor(
+        self,
+        property_name: str,
+        property_type: type,
+        default_value: Any = None,
+        valid_value_fn: Optional[Callable[[Any], Any]] = None,
+        is_required: bool = False,
+        strict_mode: Optional[Any] = None,
+    ) -> ApplicationPropertiesAccessor:
+        """
+        Compile a handle for repeatedly getting a property of a generic type from
+        the configuration, as with `ApplicationProperties.compile_accessor`.
+        """
+        return self.__base_properties.compile_accessor(
+            self.__full_property_name(property_name),
+            property_type,
+            default_value=default_value,
+            valid_value_fn=valid_value_fn,
+            is_required=is_required,
+            strict_mode=strict_mode,
+        )
+
+    # pylint: enable=too-many-arguments
+
+    def bind(self, key_prefix: str, bound_class: Type[BoundClassT]) -> BoundClassT:
+        """
+        Create an instance of the dataclass `bound_class`, with each of its fields
+        set from the property with the same name under `key_prefix`.  An empty
+        `key_prefix` binds the properties directly under the facade's prefix.
+        """
+        if not isinstance(key_prefix, str):
+            raise ValueError("The key_prefix argument must be a string.")
+        return self.__base_properties.bind(
+            (
+                f"{self.__property_prefix}{key_prefix}"
+                if key_prefix
+                else self.__property_key
+            ),
+            bound_class,
+        )
+
+    def view(self, snapshot: bool = False) -> ApplicationPropertiesView:
+        """
+        Create a read-only mapping view over the properties under the facade's
+        prefix, as with `ApplicationProperties.view`.
+        """
+        return self.__base_properties.view(snapshot, self.__property_key)
+
+    def get_section(self) -> Dict[str, Any]:
+        """
+        Get the properties under the facade's prefix as nested dictionaries, as
+        with `ApplicationProperties.get_section`.
+        """
+        return self.__base_properties.get_section(self.__property_key)
+
+    def fingerprint(self) -> str:
+        """
+        Fingerprint of the keys and values of every property under the facade's
+        prefix, as with `ApplicationProperties.fingerprint`.
+        """
+        return self.__base_properties.fingerprint(self.__property_key)
+
+    def explain(self, property_name: str) -> List[PropertyProvenance]:
+        """
+        Explain where the value of the property came from, as with
+        `ApplicationProperties.explain`.
+        """
+        return self.__base_properties.explain(self.__full_property_name(property_name))
+
     @property
     def property_names(self) -> List[str]:
         """
-        List of each of the properties in the map.
+        List of each of the properties in the map.  The names are remembered until
+        the base properties are changed.
         """
-        return [
-            next_property_name[len(self.__property_prefix) :]
-            for next_property_name in self.__base_properties.property_names
-            if next_property_name.startswith(self.__property_prefix)
-        ]
+        change_count = self.__base_properties.change_count
+        cached_change_count, cached_names = self.__cached_names
+        if cached_change_count != change_count:
+            prefix_length = len(self.__property_prefix)
+            cached_names = tuple(
+                next_property_name[prefix_length:]
+                for next_property_name in self.__base_properties.property_names_under(
+                    self.__property_key
+                )
+                if next_property_name != self.__property_key
+            )
+            self.__cached_names = (change_count, cached_names)
+        return list(cached_names)
 
     def property_names_under(self, key_name: str) -> List[str]:
         """
-        List of each of the properties in the map under the specified key.
+        List of each of the properties in the map at or under the specified key.
         """
         ApplicationProperties.verify_full_key_form(key_name)
+        prefix_length = len(self.__property_prefix)
+        return [
+            next_property_name[prefix_length:]
+            for next_property_name in self.__base_properties.property_names_under(
+                self.__full_property_name(key_name)
+            )
+        ]
+
+    def property_names_matching(self, key_pattern: str) -> List[str]:
+        """
+        List of each of the properties in the map that match the pattern, as with
+        `ApplicationProperties.property_names_matching`.  The pattern is relative
+        to the facade's prefix.
+        """
+        if not isinstance(key_pattern, str):
+            raise ValueError("The pattern argument must be a non-empty string.")
+        prefix_length = len(self.__property_prefix)
         return [
-            next_key_name
-            for next_key_name in self.property_names
-            if next_key_name.startswith(key_name)
+            next_property_name[prefix_length:]
+            for next_property_name in self.__base_properties.property_names_matching(
+                f"{self.__pattern_prefix}{key_pattern}"
+            )
         ]
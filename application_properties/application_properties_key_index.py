@@ -0,0 +1,336 @@
+"""
+Module to provide for a hierarchical index over the dotted property keys of an
+ApplicationProperties instance.
+"""
+
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+
+# pylint: disable=too-few-public-methods
+class ApplicationPropertiesKeyIndexNode:
+    """
+    Class to provide for a single node, or key segment, within the hierarchical index.
+    """
+
+    __slots__ = (
+        "children",
+        "property_key",
+        "property_count",
+        "property_digest",
+        "digest",
+    )
+
+    def __init__(self) -> None:
+        """
+        Initializes an new instance of the ApplicationPropertiesKeyIndexNode class.
+        """
+        self.children: Dict[str, "ApplicationPropertiesKeyIndexNode"] = {}
+        self.property_key: Optional[str] = None
+        self.property_count = 0
+        self.property_digest = 0
+        self.digest = 0
+
+
+# pylint: enable=too-few-public-methods
+
+
+class ApplicationPropertiesKeyIndex:
+    """
+    Class to provide for a hierarchical index over the dotted property keys of an
+    ApplicationProperties instance.  Each node in the index represents one segment
+    of a key, so prefix queries respect the separator boundaries and only visit the
+    part of the index under that prefix.
+
+    Each node also keeps a digest of the keys and values at or under it, being the
+    exclusive-or of the digest of each of those properties.  As that does not
+    depend on the order that properties are added, the digests of two indices
+    are equal if they hold the same properties, and a change to one property
+    only updates the digests of the nodes on the path to it.
+    """
+
+    __separator = "."
+    __quote_character = "'"
+
+    def __init__(self) -> None:
+        """
+        Initializes an new instance of the ApplicationPropertiesKeyIndex class.
+        """
+        self.__root = ApplicationPropertiesKeyIndexNode()
+
+    def __len__(self) -> int:
+        return self.__root.property_count
+
+    @property
+    def root(self) -> ApplicationPropertiesKeyIndexNode:
+        """
+        Node at the root of the index, representing all properties.
+        """
+        return self.__root
+
+    @staticmethod
+    def split_key(property_key: str) -> List[str]:
+        """
+        Split a full key into its segments, keeping any quoted segment that contains
+        the separator character together.  Only a segment that was wrapped in quotes
+        because it contains the separator is treated as quoted, so a key part may
+        still contain the quote character, as in `it's`.
+        """
+        split_segments = property_key.split(ApplicationPropertiesKeyIndex.__separator)
+        if ApplicationPropertiesKeyIndex.__quote_character not in property_key:
+            return split_segments
+
+        quote_character = ApplicationPropertiesKeyIndex.__quote_character
+        joined_segments: List[str] = []
+        segment_index = 0
+        while segment_index < len(split_segments):
+            next_segment = split_segments[segment_index]
+            if next_segment.startswith(quote_character) and not (
+                len(next_segment) > 1 and next_segment.endswith(quote_character)
+            ):
+                # Look for the segment that closes the quote, keeping the segments
+                # as they are if there is none.
+                for closing_index in range(segment_index + 1, len(split_segments)):
+                    if split_segments[closing_index].endswith(quote_character):
+                        joined_segments.append(
+                            ApplicationPropertiesKeyIndex.__separator.join(
+                                split_segments[segment_index : closing_index + 1]
+                            )
+                        )
+                        segment_index = closing_index + 1
+                        break
+                else:
+                    joined_segments.append(next_segment)
+                    segment_index += 1
+            else:
+                joined_segments.append(next_segment)
+                segment_index += 1
+        return joined_segments
+
+    def clear(self) -> None:
+        """
+        Remove every key from the index.
+        """
+        self.__root = ApplicationPropertiesKeyIndexNode()
+
+    @staticmethod
+    def compute_digest(property_key: str, property_value: Any) -> int:
+        """
+        Compute the digest of a single property from its full key and value.  The
+        digest is stable across processes, so it may be compared between them.
+        """
+        return int.from_bytes(
+            blake2b(
+                repr((property_key, property_value)).encode("utf-8", "surrogatepass"),
+                digest_size=8,
+            ).digest(),
+            "little",
+        )
+
+    def add(self, property_key: str, property_digest: Optional[int] = None) -> None:
+        """
+        Add the full key to the index, if it is not already present.  If a digest
+        is specified, it replaces the digest of the key's value.
+        """
+        current_node = self.__root
+        node_path = [current_node]
+        for next_segment in ApplicationPropertiesKeyIndex.split_key(property_key):
+            next_node = current_node.children.get(next_segment)
+            if next_node is None:
+                next_node = ApplicationPropertiesKeyIndexNode()
+                current_node.children[next_segment] = next_node
+            current_node = next_node
+            node_path.append(current_node)
+        if current_node.property_key is None:
+            current_node.property_key = property_key
+            for next_node in node_path:
+                next_node.property_count += 1
+        if property_digest is not None and (
+            digest_change := current_node.property_digest ^ property_digest
+        ):
+            for next_node in node_path:
+                next_node.digest ^= digest_change
+            current_node.property_digest = property_digest
+
+    def remove(self, property_key: str) -> bool:
+        """
+        Remove the full key from the index, returning whether it was present.
+        """
+        node_path = self.__find_node_path(property_key)
+        if not node_path or node_path[-1][1].property_key is None:
+            return False
+        removed_node = node_path[-1][1]
+        removed_digest = removed_node.property_digest
+        removed_node.property_key = None
+        removed_node.property_digest = 0
+        self.__remove_from_path(node_path, 1, removed_digest)
+        return True
+
+    def remove_under(self, key_prefix: str) -> List[str]:
+        """
+        Remove the full keys at or under the specified key prefix from the index,
+        returning the keys that were removed.
+        """
+        node_path = self.__find_node_path(key_prefix)
+        if not node_path:
+            return []
+        removed_node = node_path[-1][1]
+        removed_names = ApplicationPropertiesKeyIndex.names_under_node(removed_node)
+        self.__remove_from_path(
+            node_path, removed_node.property_count, removed_node.digest
+        )
+        return removed_names
+
+    def __find_node_path(
+        self, property_key: str
+    ) -> List[Tuple[str, ApplicationPropertiesKeyIndexNode]]:
+        """
+        Find the path of segments and nodes from the root to the node for the key,
+        or an empty list if the key is not in the index.
+        """
+        current_node = self.__root
+        node_path: List[Tuple[str, ApplicationPropertiesKeyIndexNode]] = []
+        for next_segment in ApplicationPropertiesKeyIndex.split_key(property_key):
+            next_node = current_node.children.get(next_segment)
+            if next_node is None:
+                return []
+            node_path.append((next_segment, next_node))
+            current_node = next_node
+        return node_path
+
+    def __remove_from_path(
+        self,
+        node_path: List[Tuple[str, ApplicationPropertiesKeyIndexNode]],
+        removed_count: int,
+        removed_digest: int,
+    ) -> None:
+        """
+        Take the removed keys off the count and digest of each node on the path,
+        and prune any node that no longer has any keys at or under it.
+        """
+        self.__root.property_count -= removed_count
+        self.__root.digest ^= removed_digest
+        parent_node = self.__root
+        for next_segment, next_node in node_path:
+            next_node.property_count -= removed_count
+            next_node.digest ^= removed_digest
+            if not next_node.property_count:
+                del parent_node.children[next_segment]
+                break
+            parent_node = next_node
+
+    def find_node(self, key_prefix: str) -> Optional[ApplicationPropertiesKeyIndexNode]:
+        """
+        Find the node for the full key or key prefix, if one exists.
+        """
+        current_node: Optional[ApplicationPropertiesKeyIndexNode] = self.__root
+        for next_segment in ApplicationPropertiesKeyIndex.split_key(key_prefix):
+            assert current_node is not None
+            current_node = current_node.children.get(next_segment)
+            if current_node is None:
+                break
+        return current_node
+
+    def count_under(self, key_prefix: str) -> int:
+        """
+        Count of the full keys at or under the specified key prefix.
+        """
+        found_node = self.find_node(key_prefix)
+        return found_node.property_count if found_node else 0
+
+    def names_under(self, key_prefix: str) -> List[str]:
+        """
+        List of the full keys at or under the specified key prefix.
+        """
+        found_node = self.find_node(key_prefix)
+        return (
+            ApplicationPropertiesKeyIndex.names_under_node(found_node)
+            if found_node
+            else []
+        )
+
+    @staticmethod
+    def names_under_node(start_node: ApplicationPropertiesKeyIndexNode) -> List[str]:
+        """
+        List of the full keys at or under the specified node.
+        """
+        collected_names: List[str] = []
+        nodes_to_visit = [start_node]
+        while nodes_to_visit:
+            current_node = nodes_to_visit.pop()
+            if current_node.property_key is not None:
+                collected_names.append(current_node.property_key)
+            nodes_to_visit.extend(reversed(current_node.children.values()))
+        return collected_names
+
+    def copy(self) -> "ApplicationPropertiesKeyIndex":
+        """
+        Create a copy of the index, without having to split each key again.
+        """
+        new_index = ApplicationPropertiesKeyIndex()
+        nodes_to_copy = [(self.__root, new_index.root)]
+        while nodes_to_copy:
+            source_node, target_node = nodes_to_copy.pop()
+            target_node.property_key = source_node.property_key
+            target_node.property_count = source_node.property_count
+            target_node.property_digest = source_node.property_digest
+            target_node.digest = source_node.digest
+            for next_segment, next_child in source_node.children.items():
+                new_child = ApplicationPropertiesKeyIndexNode()
+                target_node.children[next_segment] = new_child
+                nodes_to_copy.append((next_child, new_child))
+        return new_index
+
+    def digest_under(self, key_prefix: Optional[str] = None) -> int:
+        """
+        Digest of the keys and values at or under the specified key prefix, or of
+        the entire index if no prefix is specified.
+        """
+        found_node = self.__root if key_prefix is None else self.find_node(key_prefix)
+        return found_node.digest if found_node else 0
+
+    def names_differing_under(
+        self, other_index: "ApplicationPropertiesKeyIndex", key_prefix: Optional[str]
+    ) -> List[str]:
+        """
+        List of the full keys at or under the specified key prefix that are only
+        in one of the indices, or have a different digest in each.  Any part of
+        the indices with matching digests is skipped without being visited.
+        """
+        if key_prefix is None:
+            nodes_to_compare: List[
+                Tuple[
+                    Optional[ApplicationPropertiesKeyIndexNode],
+                    Optional[ApplicationPropertiesKeyIndexNode],
+                ]
+            ] = [(self.__root, other_index.root)]
+        else:
+            nodes_to_compare = [
+                (self.find_node(key_prefix), other_index.find_node(key_prefix))
+            ]
+        differing_names: List[str] = []
+        while nodes_to_compare:
+            this_node, other_node = nodes_to_compare.pop()
+            if this_node is None or other_node is None:
+                if only_node := this_node or other_node:
+                    differing_names.extend(
+                        ApplicationPropertiesKeyIndex.names_under_node(only_node)
+                    )
+                continue
+            if this_node.digest == other_node.digest:
+                continue
+            if (
+                this_node.property_key != other_node.property_key
+                or this_node.property_digest != other_node.property_digest
+            ):
+                differing_names.append(
+                    cast(str, this_node.property_key or other_node.property_key)
+                )
+            for next_segment, next_child in this_node.children.items():
+                nodes_to_compare.append(
+                    (next_child, other_node.children.get(next_segment))
+                )
+            for next_segment, next_child in other_node.children.items():
+                if next_segment not in this_node.children:
+                    nodes_to_compare.append((None, next_child))
+        return sorted(differing_names)
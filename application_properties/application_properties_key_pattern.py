@@ -0,0 +1,221 @@
+"""
+Module to provide for a compiled pattern that matches the dotted property keys
+of an ApplicationProperties instance, one segment at a time.
+"""
+
+import fnmatch
+import functools
+import re
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from application_properties.application_properties_key_index import (
+    ApplicationPropertiesKeyIndex,
+    ApplicationPropertiesKeyIndexNode,
+)
+
+MatchState = Tuple[
+    bool,
+    FrozenSet[int],
+    Dict[str, FrozenSet[int]],
+    Tuple[Tuple[Callable[[str], Any], FrozenSet[int]], ...],
+]
+
+
+class ApplicationPropertiesKeyPattern:
+    """
+    Class to provide for a compiled pattern that matches the dotted property keys
+    of an ApplicationProperties instance, one segment at a time.  A segment of `*`
+    matches any one segment, a segment of `**` matches any number of segments,
+    including none, and any other segment may use `*`, `?`, and `[...]` to match
+    within that segment, as with `fnmatch`.
+
+    Patterns are compiled with `compile_pattern`, which remembers recently used
+    patterns, and matched against the key index so that only the branches that
+    can match are visited.
+    """
+
+    __slots__ = ("__pattern", "__segments", "__match_states")
+
+    __literal_segment = 0
+    __single_segment = 1
+    __many_segments = 2
+
+    def __init__(self, pattern: str, segments: Tuple[Tuple[int, Any], ...]) -> None:
+        """
+        Initializes an new instance of the ApplicationPropertiesKeyPattern class.
+        """
+        self.__pattern = pattern
+        self.__segments = segments
+        self.__match_states: Dict[FrozenSet[int], MatchState] = {}
+
+    @property
+    def pattern(self) -> str:
+        """
+        Normalized form of the pattern that was compiled.
+        """
+        return self.__pattern
+
+    @staticmethod
+    def compile_pattern(pattern: str) -> "ApplicationPropertiesKeyPattern":
+        """
+        Compile the pattern, or return the remembered compiled form of a pattern
+        that was recently used.
+        """
+        if not isinstance(pattern, str) or not pattern:
+            raise ValueError("The pattern argument must be a non-empty string.")
+        # pylint: disable=no-value-for-parameter
+        compiled_pattern, pattern_error = (
+            ApplicationPropertiesKeyPattern.__compile_normalized_pattern(
+                pattern.lower()
+            )
+        )
+        # pylint: enable=no-value-for-parameter
+        if pattern_error:
+            raise ValueError(pattern_error)
+        assert compiled_pattern is not None
+        return compiled_pattern
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def __compile_normalized_pattern(
+        pattern: str,
+    ) -> Tuple[Optional["ApplicationPropertiesKeyPattern"], Optional[str]]:
+        compiled_segments: List[Tuple[int, Any]] = []
+        for next_segment in ApplicationPropertiesKeyIndex.split_key(pattern):
+            if not next_segment:
+                return None, f"Pattern '{pattern}' must not contain an empty segment."
+            if next_segment == "**":
+                if (
+                    compiled_segments
+                    and compiled_segments[-1][0]
+                    == ApplicationPropertiesKeyPattern.__many_segments
+                ):
+                    continue
+                compiled_segments.append(
+                    (ApplicationPropertiesKeyPattern.__many_segments, None)
+                )
+            elif next_segment == "*":
+                compiled_segments.append(
+                    (ApplicationPropertiesKeyPattern.__single_segment, None)
+                )
+            elif any(next_character in next_segment for next_character in "*?["):
+                compiled_segments.append(
+                    (
+                        ApplicationPropertiesKeyPattern.__single_segment,
+                        re.compile(fnmatch.translate(next_segment)).match,
+                    )
+                )
+            else:
+                compiled_segments.append(
+                    (ApplicationPropertiesKeyPattern.__literal_segment, next_segment)
+                )
+        return ApplicationPropertiesKeyPattern(pattern, tuple(compiled_segments)), None
+
+    def __add_skipped_segments(self, segment_indices: Set[int]) -> FrozenSet[int]:
+        """
+        Add the index after each `**` segment, as those may match no segments.
+        """
+        for next_index in sorted(segment_indices):
+            if (
+                next_index < len(self.__segments)
+                and self.__segments[next_index][0]
+                == ApplicationPropertiesKeyPattern.__many_segments
+            ):
+                segment_indices.add(next_index + 1)
+        return frozenset(segment_indices)
+
+    def __find_match_state(self, segment_indices: FrozenSet[int]) -> MatchState:
+        """
+        Find how to move from a node to its children when the node has matched
+        up to each of the pattern segments in the set.  Each state is worked out
+        once, and the pattern remembers it for later matches.
+        """
+        if (match_state := self.__match_states.get(segment_indices)) is not None:
+            return match_state
+
+        any_indices: Set[int] = set()
+        literal_indices: Dict[str, Set[int]] = {}
+        matcher_indices: List[Tuple[Callable[[str], Any], FrozenSet[int]]] = []
+        for next_index in segment_indices:
+            if next_index == len(self.__segments):
+                continue
+            segment_kind, segment_matcher = self.__segments[next_index]
+            if segment_kind == ApplicationPropertiesKeyPattern.__many_segments:
+                any_indices.add(next_index)
+            elif segment_kind == ApplicationPropertiesKeyPattern.__literal_segment:
+                literal_indices.setdefault(segment_matcher, set()).add(next_index + 1)
+            elif segment_matcher is None:
+                any_indices.add(next_index + 1)
+            else:
+                matcher_indices.append(
+                    (segment_matcher, self.__add_skipped_segments({next_index + 1}))
+                )
+        match_state = (
+            len(self.__segments) in segment_indices,
+            self.__add_skipped_segments(any_indices),
+            {
+                next_segment: self.__add_skipped_segments(next_indices)
+                for next_segment, next_indices in literal_indices.items()
+            },
+            tuple(matcher_indices),
+        )
+        self.__match_states[segment_indices] = match_state
+        return match_state
+
+    def names_matching(self, key_index: ApplicationPropertiesKeyIndex) -> List[str]:
+        """
+        List of the full keys in the index that match the pattern, in the order
+        that the index holds them.  Each node of the index is visited at most
+        once, and only the children named by literal segments are visited when
+        nothing else in the pattern can match there.
+        """
+        find_match_state = self.__find_match_state
+        root_node = key_index.root
+        root_state = find_match_state(self.__add_skipped_segments({0}))
+        matched_names: List[str] = []
+        if root_state[0] and root_node.property_key is not None:
+            matched_names.append(root_node.property_key)
+
+        # Each level of the walk is an iterator over the children to visit and
+        # the state to visit them in, so that leaves never need to be pushed.
+        children_to_visit = [self.__iterate_children(root_node, root_state)]
+        while children_to_visit:
+            for next_child, next_state in children_to_visit[-1]:
+                if next_state[0] and next_child.property_key is not None:
+                    matched_names.append(next_child.property_key)
+                if next_child.children:
+                    children_to_visit.append(
+                        self.__iterate_children(next_child, next_state)
+                    )
+                    break
+            else:
+                children_to_visit.pop()
+        return matched_names
+
+    def __iterate_children(
+        self, current_node: ApplicationPropertiesKeyIndexNode, match_state: MatchState
+    ) -> Iterator[Tuple[ApplicationPropertiesKeyIndexNode, MatchState]]:
+        """
+        Iterate over the children of the node that may match the rest of the
+        pattern, with the state to visit each of them in.
+        """
+        find_match_state = self.__find_match_state
+        _, any_indices, literal_indices, matcher_indices = match_state
+        if not any_indices and not matcher_indices:
+            for next_segment, next_indices in literal_indices.items():
+                if (next_child := current_node.children.get(next_segment)) is not None:
+                    yield next_child, find_match_state(next_indices)
+        elif not literal_indices and not matcher_indices:
+            any_state = find_match_state(any_indices)
+            for next_child in current_node.children.values():
+                yield next_child, any_state
+        else:
+            for next_segment, next_child in current_node.children.items():
+                next_indices = any_indices
+                if (found_indices := literal_indices.get(next_segment)) is not None:
+                    next_indices = next_indices | found_indices
+                for segment_matcher, matched_indices in matcher_indices:
+                    if segment_matcher(next_segment):
+                        next_indices = next_indices | matched_indices
+                if next_indices:
+                    yield next_child, find_match_state(next_indices)
@@ -0,0 +1,99 @@
+"""
+Module to provide for the result of trying to get a property from an
+ApplicationProperties instance without raising an exception.
+"""
+
+from enum import Enum
+from typing import Any, NamedTuple, Optional, Tuple
+
+from application_properties.application_properties_validators import (
+    ApplicationPropertiesValidator,
+)
+
+
+class PropertyLookupStatus(Enum):
+    """
+    Reason code for the result of trying to get a property.
+    """
+
+    FOUND = 0
+    """
+    The property was present and its value is returned.
+    """
+    MISSING = 1
+    """
+    The property was not present, so the default value is returned.
+    """
+    WRONG_TYPE = 2
+    """
+    The property's value was not of the requested type, so the default value is returned.
+    """
+    NOT_VALID = 3
+    """
+    The property's value was not valid, so the default value is returned.
+    """
+
+
+class PropertyLookupResult(NamedTuple):
+    """
+    Class to provide for the result of trying to get a property.  Only the
+    status and value are decided during the lookup, with any description of a
+    problem only formatted when the `reason` is asked for.
+    """
+
+    status: PropertyLookupStatus
+    """
+    Reason code for the result.
+    """
+    value: Any
+    """
+    Value of the property, or the default value if the property was not found.
+    """
+    property_name: str
+    """
+    Normalized name of the property.
+    """
+    detail: Any = None
+    """
+    Requested types for `WRONG_TYPE`, or the exception, validator, or message
+    that rejected the value for `NOT_VALID`.
+    """
+    rejected_value: Any = None
+    """
+    Value that was rejected by a validator, for `NOT_VALID`.
+    """
+
+    @property
+    def is_found(self) -> bool:
+        """
+        Gets whether the property was present and its value returned.
+        """
+        return self.status is PropertyLookupStatus.FOUND
+
+    @property
+    def reason(self) -> Optional[str]:
+        """
+        Gets a description of why the property's value was not returned, or
+        None if it was.
+        """
+        if self.status is PropertyLookupStatus.FOUND:
+            return None
+        if self.status is PropertyLookupStatus.MISSING:
+            return f"A value for property '{self.property_name}' was not found."
+        if self.status is PropertyLookupStatus.WRONG_TYPE:
+            expected_types: Tuple[Any, ...] = self.detail or ()
+            type_names = " or type ".join(
+                (
+                    f"'{next_type.__name__}'"
+                    if isinstance(next_type, type)
+                    else f"'{str(next_type).replace('typing.', '')}'"
+                )
+                for next_type in expected_types
+            )
+            return f"The value for property '{self.property_name}' must be of type {type_names}."
+        validation_error = (
+            self.detail.find_error(self.rejected_value)
+            if isinstance(self.detail, ApplicationPropertiesValidator)
+            else str(self.detail)
+        )
+        return f"The value for property '{self.property_name}' is not valid: {validation_error}"
@@ -0,0 +1,46 @@
+"""
+Module to provide for the numeric values extracted in bulk from an
+ApplicationProperties instance.
+"""
+
+from array import array
+from typing import Any, Iterator, NamedTuple, Tuple
+
+
+class PropertyNumericArray(NamedTuple):
+    """
+    Class to provide for the numeric values extracted in bulk from an
+    ApplicationProperties instance, in columnar form.  The three columns have the
+    same length, with the entry at each index describing the same source value.
+    """
+
+    property_names: Tuple[str, ...]
+    """
+    Name of the property for each value.  Elements of a list-valued property are
+    named with their index, as in `rules.weights[0]`.
+    """
+    values: "array[Any]"
+    """
+    Each numeric value, with zero in place of any value that is not valid.
+    """
+    valid_mask: "array[int]"
+    """
+    One for each value that is valid, and zero for each value that is not.
+    """
+
+    @property
+    def is_all_valid(self) -> bool:
+        """
+        Gets whether every value was valid.
+        """
+        return all(self.valid_mask)
+
+    def invalid_property_names(self) -> Iterator[str]:
+        """
+        Iterate over the names of the properties whose values were not valid.
+        """
+        return (
+            next_name
+            for next_name, is_valid in zip(self.property_names, self.valid_mask)
+            if not is_valid
+        )
@@ -0,0 +1,35 @@
+"""
+Module to provide for the specification of a single property to get from an
+ApplicationProperties instance.
+"""
+
+from typing import Any, Callable, NamedTuple, Optional
+
+
+class PropertySpec(NamedTuple):
+    """
+    Class to provide for the specification of a single property to get from an
+    ApplicationProperties instance.  Any tuple with the same fields, in the same
+    order, may be used in place of this class.
+    """
+
+    property_name: str
+    """
+    Full name of the property.
+    """
+    property_type: type
+    """
+    Type that the property's value must have.
+    """
+    default_value: Any = None
+    """
+    Value to use if the property is not present or its value is not usable.
+    """
+    valid_value_fn: Optional[Callable[[Any], Any]] = None
+    """
+    Optional function that raises an exception if the property's value is not valid.
+    """
+    is_required: bool = False
+    """
+    Whether the property must be present.
+    """
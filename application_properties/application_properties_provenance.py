@@ -0,0 +1,63 @@
+"""
+Module to provide for a record of where the properties of an ApplicationProperties
+instance came from.
+"""
+
+from enum import Enum
+from typing import Any, NamedTuple, Optional
+
+
+class PropertySourceKind(Enum):
+    """
+    Kind of source that a property was set from.
+    """
+
+    JSON = 1
+    YAML = 2
+    TOML = 3
+    INI = 4
+    MANUAL = 5
+
+
+class PropertySource(NamedTuple):
+    """
+    Class to provide for a source that properties were set from.  Each source is
+    kept once by the properties, no matter how many properties it set.
+    """
+
+    kind: PropertySourceKind
+    """
+    Kind of source that the properties were set from.
+    """
+    file_path: Optional[str] = None
+    """
+    Path of the file that the properties were read from, if any.
+    """
+    line_number: Optional[int] = None
+    """
+    Line within the file that the properties were read from, if the source knows it.
+    """
+
+    def __str__(self) -> str:
+        if self.kind == PropertySourceKind.MANUAL:
+            return "manually set properties"
+        description = f"{self.kind.name} file '{self.file_path}'"
+        if self.line_number is not None:
+            description += f" at line {self.line_number}"
+        return description
+
+
+class PropertyProvenance(NamedTuple):
+    """
+    Class to provide for one of the values that was set for a property, and the
+    source that set it.
+    """
+
+    value: Any
+    """
+    Value that was set for the property.
+    """
+    source: Optional[PropertySource]
+    """
+    Source that set the value, or None if the value was set directly.
+    """
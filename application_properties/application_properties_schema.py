@@ -0,0 +1,49 @@
+"""
+Module to provide for a compiled schema of the properties that an application
+expects to find within an ApplicationProperties instance.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from application_properties.application_properties_property_spec import PropertySpec
+
+
+class ApplicationPropertiesSchema:
+    """
+    Class to provide for a compiled schema of the properties that an application
+    expects to find within an ApplicationProperties instance.  The specifications
+    are verified once, when the schema is compiled with `compile_schema`, and the
+    schema may then be applied to any number of ApplicationProperties instances.
+    """
+
+    __slots__ = ("__property_specs", "__ordered_specs")
+
+    def __init__(self, property_specs: Dict[str, PropertySpec]) -> None:
+        """
+        Initializes an new instance of the ApplicationPropertiesSchema class.
+        """
+        self.__property_specs = dict(property_specs)
+        self.__ordered_specs = tuple(self.__property_specs.values())
+
+    def __len__(self) -> int:
+        return len(self.__ordered_specs)
+
+    @property
+    def property_specs(self) -> Tuple[PropertySpec, ...]:
+        """
+        Specification of each property in the schema, in the order they were given.
+        """
+        return self.__ordered_specs
+
+    @property
+    def property_names(self) -> List[str]:
+        """
+        List of the normalized names of each property in the schema.
+        """
+        return list(self.__property_specs)
+
+    def find_spec(self, property_name: str) -> Optional[PropertySpec]:
+        """
+        Find the specification for the normalized property name, if it is in the schema.
+        """
+        return self.__property_specs.get(property_name)
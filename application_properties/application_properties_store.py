@@ -0,0 +1,225 @@
+"""
+Module to provide for the storage behind an ApplicationProperties instance.
+"""
+
+import copy
+import datetime
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from application_properties.application_properties_key_index import (
+    ApplicationPropertiesKeyIndex,
+)
+from application_properties.application_properties_provenance import PropertySource
+
+IMMUTABLE_VALUE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    type(None),
+    datetime.date,
+    datetime.time,
+)
+"""
+Types of the values that can be shared between stores, and returned from a
+frozen instance, without being copied.
+"""
+
+
+# pylint: disable=too-few-public-methods, too-many-instance-attributes
+class ApplicationPropertiesStore:
+    """
+    Class to provide for the storage behind an ApplicationProperties instance,
+    kept together so that it can be copied or replaced as a single unit.
+    """
+
+    __slots__ = (
+        "property_map",
+        "untyped_property_map",
+        "key_index",
+        "converted_values",
+        "string_list_values",
+        "validation_results",
+        "schema_values",
+        "section_values",
+        "stale_digests",
+        "digest_lock",
+        "sources",
+        "source_ids",
+        "current_source_id",
+        "property_sources",
+        "overridden_values",
+        "generation",
+        "is_shared",
+    )
+
+    def __init__(self) -> None:
+        """
+        Initializes an new instance of the ApplicationPropertiesStore class.
+        """
+        self.property_map: Dict[str, Any] = {}
+        self.untyped_property_map: Dict[str, str] = {}
+        self.key_index = ApplicationPropertiesKeyIndex()
+        self.converted_values: Dict[str, Dict[type, Tuple[bool, Any]]] = {}
+        self.string_list_values: Dict[
+            str,
+            Dict[
+                Tuple[Optional[str], bool],
+                Tuple[Optional[Tuple[str, ...]], Optional[str]],
+            ],
+        ] = {}
+        self.validation_results: Dict[str, Dict[Tuple[Any, Any], Optional[str]]] = {}
+        self.schema_values: Dict[str, Any] = {}
+        self.section_values: Dict[str, Dict[str, Any]] = {}
+        self.stale_digests: Set[str] = set()
+        self.digest_lock = threading.Lock()
+        self.sources: List[Optional[PropertySource]] = [None]
+        self.source_ids: Dict[PropertySource, int] = {}
+        self.current_source_id = 0
+        self.property_sources: Dict[str, int] = {}
+        self.overridden_values: Dict[str, List[Tuple[int, Any]]] = {}
+        self.generation = 0
+        self.is_shared = False
+
+    def clear(self) -> None:
+        """
+        Remove every property from the store.
+        """
+        self.property_map.clear()
+        self.untyped_property_map.clear()
+        self.key_index.clear()
+        self.converted_values.clear()
+        self.string_list_values.clear()
+        self.validation_results.clear()
+        self.schema_values.clear()
+        self.section_values.clear()
+        self.stale_digests.clear()
+        self.property_sources.clear()
+        self.overridden_values.clear()
+
+    def discard_values(self, property_key: str) -> None:
+        """
+        Discard the untyped value and any cached values for the property, leaving
+        the property itself in place.
+        """
+        self.untyped_property_map.pop(property_key, None)
+        self.converted_values.pop(property_key, None)
+        self.string_list_values.pop(property_key, None)
+        self.validation_results.pop(property_key, None)
+        self.schema_values.pop(property_key, None)
+        if self.section_values:
+            self.discard_sections(property_key)
+
+    def intern_source(self, property_source: PropertySource) -> int:
+        """
+        Get the id of the source, adding it to the sources if it is new.  Each
+        property only keeps the id of its source, so that no matter how many
+        properties a source sets, the source itself is only kept once.
+        """
+        source_id = self.source_ids.get(property_source)
+        if source_id is None:
+            source_id = len(self.sources)
+            self.sources.append(property_source)
+            self.source_ids[property_source] = source_id
+        return source_id
+
+    def record_source(self, property_key: str) -> None:
+        """
+        Record the current source as the source of the property that is about to
+        be set.  If the property already has a value from a different source, that
+        value is kept as overridden by the new one.
+        """
+        source_id = self.current_source_id
+        previous_source_id = self.property_sources.get(property_key, 0)
+        if previous_source_id != source_id and property_key in self.property_map:
+            self.overridden_values.setdefault(property_key, []).append(
+                (previous_source_id, self.property_map[property_key])
+            )
+        if source_id:
+            self.property_sources[property_key] = source_id
+        elif previous_source_id:
+            del self.property_sources[property_key]
+
+    def discard_sources(self, property_key: str) -> None:
+        """
+        Discard the recorded sources for a property that was removed.
+        """
+        self.property_sources.pop(property_key, None)
+        self.overridden_values.pop(property_key, None)
+
+    def discard_sections(self, property_key: str) -> None:
+        """
+        Discard any cached section that the property is part of.  A section is
+        cached for a key, or for the empty key if it is every property, and only
+        holds the properties under that key.
+        """
+        stale_keys = [
+            next_section_key
+            for next_section_key in self.section_values
+            if not next_section_key
+            or property_key == next_section_key
+            or property_key.startswith(f"{next_section_key}.")
+        ]
+        for next_section_key in stale_keys:
+            del self.section_values[next_section_key]
+
+    def copy(self, with_properties: bool = True) -> "ApplicationPropertiesStore":
+        """
+        Create a compact copy of the store.  Immutable values are shared with the
+        copy, while any other value is copied, so that changing a value returned
+        from one store in place does not change the other.  Without the properties,
+        the copy only keeps the generation and the known sources, as a cleared store.
+        """
+        new_store = ApplicationPropertiesStore()
+        new_store.generation = self.generation
+        new_store.sources = list(self.sources)
+        new_store.source_ids = dict(self.source_ids)
+        new_store.current_source_id = self.current_source_id
+        if not with_properties:
+            return new_store
+        new_store.property_map = {
+            next_key: (
+                next_value
+                if isinstance(next_value, IMMUTABLE_VALUE_TYPES)
+                else copy.deepcopy(next_value)
+            )
+            for next_key, next_value in self.property_map.items()
+        }
+        new_store.untyped_property_map = dict(self.untyped_property_map)
+        new_store.key_index = self.key_index.copy()
+        new_store.stale_digests = set(self.stale_digests)
+        new_store.property_sources = dict(self.property_sources)
+        new_store.overridden_values = {
+            next_key: list(next_values)
+            for next_key, next_values in self.overridden_values.items()
+        }
+        return new_store
+
+    def refresh_digests(self) -> None:
+        """
+        Bring the digests in the key index up to date for each property that was
+        set since they were last refreshed.  Digests are only computed when they
+        are needed, so that setting properties stays as cheap as possible.  As a
+        frozen store may be shared between threads, refreshing is done under a lock.
+        """
+        if not self.stale_digests:
+            return
+        property_map = self.property_map
+        compute_digest = ApplicationPropertiesKeyIndex.compute_digest
+        add_to_index = self.key_index.add
+        with self.digest_lock:
+            for next_property_key in self.stale_digests:
+                # Properties removed after they were set are no longer in the index.
+                if next_property_key in property_map:
+                    add_to_index(
+                        next_property_key,
+                        compute_digest(
+                            next_property_key, property_map[next_property_key]
+                        ),
+                    )
+            self.stale_digests.clear()
+
+
+# pylint: enable=too-few-public-methods, too-many-instance-attributes
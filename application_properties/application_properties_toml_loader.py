@@ -11,6 +11,7 @@ from application_properties.application_properties import ApplicationProperties
 from application_properties.application_properties_loader_helper import (
     ApplicationPropertiesLoaderHelper,
 )
+from application_properties.application_properties_provenance import PropertySourceKind
 
 
 # pylint: disable=too-few-public-methods
@@ -96,11 +97,15 @@ class ApplicationPropertiesTomlLoader:
                 )
             if configuration_map:
                 try:
-                    properties_object.load_from_dict(
-                        configuration_map,
-                        clear_map=clear_property_map,
-                        allow_periods_in_keys=True,
-                    )
+                    with properties_object.recording_source(
+                        PropertySourceKind.TOML, configuration_file
+                    ):
+                        properties_object.load_from_dict(
+                            configuration_map,
+                            clear_map=clear_property_map,
+                            allow_periods_in_keys=True,
+                            take_ownership=True,
+                        )
                     did_apply_map = True
                 except ValueError as this_exception:
                     formatted_error = (
@@ -0,0 +1,292 @@
+"""
+Module to provide for declarative validators that may be used as the
+`valid_value_fn` argument when getting a property.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, FrozenSet, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ApplicationPropertiesValidator(ABC):
+    """
+    Base class for validators that can be compared and hashed.  As the result of
+    a validator only depends on its fields and the value being validated, an
+    ApplicationProperties instance can remember the result for each property and
+    only validate that property again once its value changes.
+    """
+
+    remembers_results: ClassVar[bool] = True
+    """
+    Whether the result of this validator is remembered for each property.  Simple
+    comparisons are quicker to repeat than to look up.
+    """
+
+    def __call__(self, value_to_validate: Any) -> None:
+        if (validation_error := self.find_error(value_to_validate)) is not None:
+            raise ValueError(validation_error)
+
+    @abstractmethod
+    def find_error(self, value_to_validate: Any) -> Optional[str]:
+        """
+        Validate the value, returning a description of why it is not valid, or
+        None if it is valid.
+        """
+
+    def is_valid(self, value_to_validate: Any) -> bool:
+        """
+        Validate the value, without describing why it is not valid.
+        """
+        return self.find_error(value_to_validate) is None
+
+    def __and__(
+        self, other_validator: "ApplicationPropertiesValidator"
+    ) -> "AllOfValidator":
+        return AllOfValidator((self, other_validator))
+
+    def __or__(
+        self, other_validator: "ApplicationPropertiesValidator"
+    ) -> "AnyOfValidator":
+        return AnyOfValidator((self, other_validator))
+
+
+@dataclass(frozen=True)
+class RangeValidator(ApplicationPropertiesValidator):
+    """
+    Validator that requires a value to be within an inclusive range.
+    """
+
+    remembers_results: ClassVar[bool] = False
+
+    minimum: Any = None
+    """
+    Smallest allowed value, or None for no lower bound.
+    """
+    maximum: Any = None
+    """
+    Largest allowed value, or None for no upper bound.
+    """
+
+    def find_error(self, value_to_validate: Any) -> Optional[str]:
+        try:
+            if self.minimum is not None and value_to_validate < self.minimum:
+                return f"Value {value_to_validate!r} is less than the minimum of {self.minimum!r}."
+            if self.maximum is not None and value_to_validate > self.maximum:
+                return f"Value {value_to_validate!r} is greater than the maximum of {self.maximum!r}."
+        except TypeError:
+            return f"Value {value_to_validate!r} cannot be compared to the range."
+        return None
+
+    def is_valid(self, value_to_validate: Any) -> bool:
+        try:
+            return (self.minimum is None or value_to_validate >= self.minimum) and (
+                self.maximum is None or value_to_validate <= self.maximum
+            )
+        except TypeError:
+            return False
+
+
+@dataclass(frozen=True)
+class ChoicesValidator(ApplicationPropertiesValidator):
+    """
+    Validator that requires a value to be one of a fixed set of choices.
+    """
+
+    remembers_results: ClassVar[bool] = False
+
+    choices: Tuple[Any, ...]
+    """
+    Allowed values, in the order that they are reported.
+    """
+    __choice_set: FrozenSet[Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "choices", tuple(self.choices))
+        object.__setattr__(
+            self, "_ChoicesValidator__choice_set", frozenset(self.choices)
+        )
+
+    def find_error(self, value_to_validate: Any) -> Optional[str]:
+        try:
+            if value_to_validate in self.__choice_set:
+                return None
+        except TypeError:
+            if value_to_validate in self.choices:
+                return None
+        choice_list = ", ".join(repr(next_choice) for next_choice in self.choices)
+        return f"Value {value_to_validate!r} is not one of: {choice_list}."
+
+    def is_valid(self, value_to_validate: Any) -> bool:
+        try:
+            return value_to_validate in self.__choice_set
+        except TypeError:
+            return value_to_validate in self.choices
+
+
+@dataclass(frozen=True)
+class RegexValidator(ApplicationPropertiesValidator):
+    """
+    Validator that requires a string value to fully match a regular expression.
+    """
+
+    pattern: str
+    """
+    Regular expression that the whole value must match.
+    """
+    flags: int = 0
+    """
+    Flags to compile the regular expression with.
+    """
+    __compiled_pattern: "re.Pattern[str]" = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_RegexValidator__compiled_pattern",
+            re.compile(self.pattern, self.flags),
+        )
+
+    def find_error(self, value_to_validate: Any) -> Optional[str]:
+        if not isinstance(value_to_validate, str):
+            return f"Value {value_to_validate!r} must be a string to match the pattern '{self.pattern}'."
+        if self.__compiled_pattern.fullmatch(value_to_validate):
+            return None
+        return (
+            f"Value {value_to_validate!r} does not match the pattern '{self.pattern}'."
+        )
+
+
+@dataclass(frozen=True)
+class LengthValidator(ApplicationPropertiesValidator):
+    """
+    Validator that requires the length of a value to be within an inclusive range.
+    """
+
+    remembers_results: ClassVar[bool] = False
+
+    minimum: Optional[int] = None
+    """
+    Smallest allowed length, or None for no lower bound.
+    """
+    maximum: Optional[int] = None
+    """
+    Largest allowed length, or None for no upper bound.
+    """
+
+    def find_error(self, value_to_validate: Any) -> Optional[str]:
+        try:
+            value_length = len(value_to_validate)
+        except TypeError:
+            return f"Value {value_to_validate!r} does not have a length."
+        if self.minimum is not None and value_length < self.minimum:
+            return f"Value {value_to_validate!r} is shorter than the minimum length of {self.minimum}."
+        if self.maximum is not None and value_length > self.maximum:
+            return f"Value {value_to_validate!r} is longer than the maximum length of {self.maximum}."
+        return None
+
+    def is_valid(self, value_to_validate: Any) -> bool:
+        try:
+            value_length = len(value_to_validate)
+        except TypeError:
+            return False
+        return (self.minimum is None or value_length >= self.minimum) and (
+            self.maximum is None or value_length <= self.maximum
+        )
+
+
+@dataclass(frozen=True)
+class PredicateValidator(ApplicationPropertiesValidator):
+    """
+    Validator that requires a predicate to return True for a value.  The
+    predicate must only depend on the value, as its result is remembered.
+    """
+
+    predicate: Callable[[Any], bool]
+    """
+    Function that returns True if the value is valid.
+    """
+    description: str
+    """
+    Description of a valid value, used when reporting a value that is not valid.
+    """
+
+    def find_error(self, value_to_validate: Any) -> Optional[str]:
+        if self.predicate(value_to_validate):
+            return None
+        return f"Value {value_to_validate!r} is not {self.description}."
+
+
+@dataclass(frozen=True)
+class AllOfValidator(ApplicationPropertiesValidator):
+    """
+    Validator that requires a value to pass every one of a group of validators.
+    """
+
+    validators: Tuple[ApplicationPropertiesValidator, ...]
+    """
+    Validators that the value must pass, checked in order.
+    """
+    __hash_value: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "validators", tuple(self.validators))
+        object.__setattr__(
+            self,
+            "remembers_results",
+            any(next_validator.remembers_results for next_validator in self.validators),
+        )
+        # Remembered results are keyed by the validator, so its hash is kept
+        # instead of hashing every part of the group for each lookup.
+        object.__setattr__(
+            self, "_AllOfValidator__hash_value", hash((type(self), self.validators))
+        )
+
+    def __hash__(self) -> int:
+        return self.__hash_value
+
+    def find_error(self, value_to_validate: Any) -> Optional[str]:
+        for next_validator in self.validators:
+            if (
+                validation_error := next_validator.find_error(value_to_validate)
+            ) is not None:
+                return validation_error
+        return None
+
+
+@dataclass(frozen=True)
+class AnyOfValidator(ApplicationPropertiesValidator):
+    """
+    Validator that requires a value to pass at least one of a group of validators.
+    """
+
+    validators: Tuple[ApplicationPropertiesValidator, ...]
+    """
+    Validators that the value may pass, checked in order.
+    """
+    __hash_value: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "validators", tuple(self.validators))
+        object.__setattr__(
+            self,
+            "remembers_results",
+            any(next_validator.remembers_results for next_validator in self.validators),
+        )
+        object.__setattr__(
+            self, "_AnyOfValidator__hash_value", hash((type(self), self.validators))
+        )
+
+    def __hash__(self) -> int:
+        return self.__hash_value
+
+    def find_error(self, value_to_validate: Any) -> Optional[str]:
+        validation_errors = []
+        for next_validator in self.validators:
+            if (
+                validation_error := next_validator.find_error(value_to_validate)
+            ) is None:
+                return None
+            validation_errors.append(validation_error)
+        return " ".join(validation_errors)
@@ -0,0 +1,78 @@
+"""
+Module to provide for a read-only mapping view over the properties of an
+ApplicationProperties instance.
+"""
+
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+from application_properties.application_properties_store import (
+    ApplicationPropertiesStore,
+)
+
+
+class ApplicationPropertiesView(Mapping[str, Any]):
+    """
+    Class to provide for a read-only mapping view over the properties of an
+    ApplicationProperties instance, created with `ApplicationProperties.view`.
+    Lookups go straight to the storage behind the properties, so nothing is copied,
+    and the keys are the normalized property names.  A view of the properties under
+    a key uses the names relative to that key.  A view that must not be changed
+    through its values, such as a snapshot view, copies any mutable value it returns.
+    """
+
+    __slots__ = ("__get_store", "__key_name", "__key_prefix", "__copy_value")
+
+    def __init__(
+        self,
+        get_store: Callable[[], ApplicationPropertiesStore],
+        key_name: Optional[str] = None,
+        separator: str = ".",
+        copy_value: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        """
+        Initializes an new instance of the ApplicationPropertiesView class.
+        """
+        self.__get_store = get_store
+        self.__key_name = key_name
+        self.__key_prefix = f"{key_name}{separator}" if key_name else ""
+        self.__copy_value = copy_value
+
+    def __getitem__(self, property_name: str) -> Any:
+        if self.__key_prefix and isinstance(property_name, str):
+            property_value = self.__get_store().property_map[
+                f"{self.__key_prefix}{property_name}"
+            ]
+        else:
+            property_value = self.__get_store().property_map[property_name]
+        return (
+            self.__copy_value(property_value) if self.__copy_value else property_value
+        )
+
+    def __contains__(self, property_name: object) -> bool:
+        if self.__key_prefix and isinstance(property_name, str):
+            return (
+                f"{self.__key_prefix}{property_name}" in self.__get_store().property_map
+            )
+        return property_name in self.__get_store().property_map
+
+    def __iter__(self) -> Iterator[str]:
+        store = self.__get_store()
+        if not self.__key_name:
+            return iter(store.property_map)
+        prefix_length = len(self.__key_prefix)
+        return (
+            next_property_name[prefix_length:]
+            for next_property_name in store.key_index.names_under(self.__key_name)
+            if next_property_name != self.__key_name
+        )
+
+    def __len__(self) -> int:
+        store = self.__get_store()
+        if not self.__key_name:
+            return len(store.property_map)
+        return store.key_index.count_under(self.__key_name) - (
+            self.__key_name in store.property_map
+        )
+
+    def __repr__(self) -> str:
+        return f"ApplicationPropertiesView({dict(self.items())!r})"
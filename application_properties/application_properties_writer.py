@@ -0,0 +1,343 @@
+"""
+Module to provide for a manner to write the properties of an ApplicationProperties
+object out as a JSON, YAML, TOML, or ini-type config file.
+"""
+
+import datetime
+import json
+import math
+import re
+from typing import Any, Iterator, Optional, TextIO, Tuple
+
+from application_properties.application_properties import ApplicationProperties
+
+
+class ApplicationPropertiesWriter:
+    """
+    Class to provide for a manner to write the properties of an ApplicationProperties
+    object out as a JSON, YAML, TOML, or ini-type config file.
+
+    Each writer streams the properties out in sorted order at each level, straight
+    from the properties object, without building a nested dictionary first.  The
+    output can be read back by the matching loader, with each key part containing
+    the separator needing the properties object to allow separators in keys.
+    """
+
+    __indent = "  "
+    __toml_bare_key = re.compile("[A-Za-z0-9_-]+")
+    __toml_escapes = {
+        '"': '\\"',
+        "\\": "\\\\",
+        "\b": "\\b",
+        "\t": "\\t",
+        "\n": "\\n",
+        "\f": "\\f",
+        "\r": "\\r",
+    }
+    __yaml_escaped_character = re.compile(
+        "[^\t\n\r\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]"
+    )
+    __ini_typed_string = "$$"
+    __ini_typed_integer = "$#"
+    __ini_typed_boolean = "$!"
+
+    @staticmethod
+    def __iterate_changes(
+        properties_object: ApplicationProperties, key_name: Optional[str]
+    ) -> Iterator[Tuple[int, Tuple[str, ...], str, Tuple[str, ...], Any]]:
+        """
+        Iterate over each property with the number of enclosing sections of the
+        previous property that are closed before it, the sections opened for it,
+        its full name, and the parts and value of its name.
+        """
+        open_sections: Tuple[str, ...] = ()
+        for (
+            property_key,
+            key_parts,
+            property_value,
+        ) in properties_object.iterate_nested_properties(key_name):
+            parent_parts = key_parts[:-1]
+            shared_count = 0
+            for open_part, parent_part in zip(open_sections, parent_parts):
+                if open_part != parent_part:
+                    break
+                shared_count += 1
+            yield (
+                len(open_sections) - shared_count,
+                parent_parts[shared_count:],
+                property_key,
+                key_parts,
+                property_value,
+            )
+            open_sections = parent_parts
+
+    @staticmethod
+    def write_json(
+        properties_object: ApplicationProperties,
+        output_stream: TextIO,
+        key_name: Optional[str] = None,
+    ) -> None:
+        """
+        Write the properties, or the properties under the specified key, as a
+        JSON object that can be loaded with `ApplicationPropertiesJsonLoader`.
+        """
+        indent = ApplicationPropertiesWriter.__indent
+        open_depth = 0
+        needs_separator = False
+        output_stream.write("{")
+        for (
+            close_count,
+            opened_parts,
+            property_key,
+            key_parts,
+            property_value,
+        ) in ApplicationPropertiesWriter.__iterate_changes(properties_object, key_name):
+            for _ in range(close_count):
+                output_stream.write(f"\n{indent * open_depth}}}")
+                open_depth -= 1
+            for next_part in opened_parts:
+                open_depth += 1
+                output_stream.write(
+                    f"{',' if needs_separator else ''}\n{indent * open_depth}{json.dumps(next_part)}: {{"
+                )
+                needs_separator = False
+            try:
+                formatted_value = json.dumps(property_value)
+            except TypeError as this_exception:
+                raise ValueError(
+                    f"The value for property '{property_key}' cannot be written as JSON."
+                ) from this_exception
+            output_stream.write(
+                f"{',' if needs_separator else ''}\n{indent * (open_depth + 1)}{json.dumps(key_parts[-1])}: {formatted_value}"
+            )
+            needs_separator = True
+        for _ in range(open_depth):
+            output_stream.write(f"\n{indent * open_depth}}}")
+            open_depth -= 1
+        output_stream.write("\n}\n" if needs_separator else "}\n")
+
+    @staticmethod
+    def write_yaml(
+        properties_object: ApplicationProperties,
+        output_stream: TextIO,
+        key_name: Optional[str] = None,
+    ) -> None:
+        """
+        Write the properties, or the properties under the specified key, as a
+        YAML document that can be loaded with `ApplicationPropertiesYamlLoader`.
+        Sections are written as block mappings, and each key and value is written
+        in the JSON-compatible flow style.
+        """
+        indent = ApplicationPropertiesWriter.__indent
+        did_write_property = False
+        for (
+            _,
+            opened_parts,
+            property_key,
+            key_parts,
+            property_value,
+        ) in ApplicationPropertiesWriter.__iterate_changes(properties_object, key_name):
+            opened_depth = len(key_parts) - 1 - len(opened_parts)
+            for next_part in opened_parts:
+                output_stream.write(
+                    f"{indent * opened_depth}{ApplicationPropertiesWriter.__format_yaml_string(next_part)}:\n"
+                )
+                opened_depth += 1
+            formatted_value = ApplicationPropertiesWriter.__format_yaml_value(
+                property_key, property_value
+            )
+            output_stream.write(
+                f"{indent * opened_depth}{ApplicationPropertiesWriter.__format_yaml_string(key_parts[-1])}: {formatted_value}\n"
+            )
+            did_write_property = True
+        if not did_write_property:
+            output_stream.write("{}\n")
+
+    @staticmethod
+    def __format_yaml_string(string_value: str) -> str:
+        # Characters that YAML does not allow, or would fold as line breaks, are
+        # escaped, as JSON only escapes the control characters.
+        return ApplicationPropertiesWriter.__yaml_escaped_character.sub(
+            lambda next_match: f"\\u{ord(next_match.group()):04x}",
+            json.dumps(string_value, ensure_ascii=False),
+        )
+
+    # pylint: disable=too-many-return-statements
+    @staticmethod
+    def __format_yaml_value(property_key: str, property_value: Any) -> str:
+        if property_value is None:
+            return "null"
+        if isinstance(property_value, bool):
+            return "true" if property_value else "false"
+        if isinstance(property_value, int):
+            return str(property_value)
+        if isinstance(property_value, float):
+            if math.isnan(property_value):
+                return ".nan"
+            if math.isinf(property_value):
+                return ".inf" if property_value > 0 else "-.inf"
+            # Without a decimal point, YAML reads an exponent form as a string.
+            formatted_value = repr(property_value)
+            if "." not in formatted_value:
+                formatted_value = formatted_value.replace("e", ".0e")
+            return formatted_value
+        if isinstance(property_value, str):
+            return ApplicationPropertiesWriter.__format_yaml_string(property_value)
+        if isinstance(property_value, list):
+            return f"[{', '.join(ApplicationPropertiesWriter.__format_yaml_value(property_key, next_value) for next_value in property_value)}]"
+        if isinstance(property_value, dict) and all(
+            isinstance(next_key, str) for next_key in property_value
+        ):
+            return (
+                "{"
+                + ", ".join(
+                    f"{ApplicationPropertiesWriter.__format_yaml_string(next_key)}: {ApplicationPropertiesWriter.__format_yaml_value(property_key, next_value)}"
+                    for next_key, next_value in property_value.items()
+                )
+                + "}"
+            )
+        raise ValueError(
+            f"The value for property '{property_key}' cannot be written as YAML."
+        )
+
+    # pylint: enable=too-many-return-statements
+
+    @staticmethod
+    def write_toml(
+        properties_object: ApplicationProperties,
+        output_stream: TextIO,
+        key_name: Optional[str] = None,
+    ) -> None:
+        """
+        Write the properties, or the properties under the specified key, as a
+        TOML document that can be loaded with `ApplicationPropertiesTomlLoader`.
+        Each property is written with a dotted key, so no tables are needed.
+        """
+        for (
+            property_key,
+            key_parts,
+            property_value,
+        ) in properties_object.iterate_nested_properties(key_name):
+            formatted_key = ".".join(
+                (
+                    next_part
+                    if ApplicationPropertiesWriter.__toml_bare_key.fullmatch(next_part)
+                    else ApplicationPropertiesWriter.__format_toml_string(next_part)
+                )
+                for next_part in key_parts
+            )
+            formatted_value = ApplicationPropertiesWriter.__format_toml_value(
+                property_key, property_value
+            )
+            output_stream.write(f"{formatted_key} = {formatted_value}\n")
+
+    @staticmethod
+    def __format_toml_string(string_value: str) -> str:
+        escapes = ApplicationPropertiesWriter.__toml_escapes
+        return (
+            '"'
+            + "".join(
+                escapes.get(next_character)
+                or (
+                    f"\\u{ord(next_character):04x}"
+                    if next_character < " " or next_character == "\x7f"
+                    else next_character
+                )
+                for next_character in string_value
+            )
+            + '"'
+        )
+
+    # pylint: disable=too-many-return-statements
+    @staticmethod
+    def __format_toml_value(property_key: str, property_value: Any) -> str:
+        if isinstance(property_value, bool):
+            return "true" if property_value else "false"
+        if isinstance(property_value, int):
+            return str(property_value)
+        if isinstance(property_value, float):
+            if math.isnan(property_value):
+                return "nan"
+            if math.isinf(property_value):
+                return "inf" if property_value > 0 else "-inf"
+            return repr(property_value)
+        if isinstance(property_value, str):
+            return ApplicationPropertiesWriter.__format_toml_string(property_value)
+        if isinstance(property_value, (datetime.date, datetime.time)):
+            return property_value.isoformat()
+        if isinstance(property_value, list):
+            return f"[{', '.join(ApplicationPropertiesWriter.__format_toml_value(property_key, next_value) for next_value in property_value)}]"
+        if isinstance(property_value, dict) and all(
+            isinstance(next_key, str) for next_key in property_value
+        ):
+            return (
+                "{"
+                + ", ".join(
+                    f"{ApplicationPropertiesWriter.__format_toml_string(next_key)} = {ApplicationPropertiesWriter.__format_toml_value(property_key, next_value)}"
+                    for next_key, next_value in property_value.items()
+                )
+                + "}"
+            )
+        raise ValueError(
+            f"The value for property '{property_key}' cannot be written as TOML."
+        )
+
+    # pylint: enable=too-many-return-statements
+
+    @staticmethod
+    def write_ini(
+        properties_object: ApplicationProperties,
+        output_stream: TextIO,
+        key_name: Optional[str] = None,
+    ) -> None:
+        """
+        Write the properties, or the properties under the specified key, as an
+        ini-type config file that can be loaded with `ApplicationPropertiesConfigLoader`.
+        The first part of each name is its section, and integer, boolean, and
+        string values are written with the same `$#`, `$!`, and `$$` prefixes used
+        for manually set properties, except for strings that are safe to leave as is.
+        """
+        current_section: Optional[str] = None
+        for (
+            property_key,
+            key_parts,
+            property_value,
+        ) in properties_object.iterate_nested_properties(key_name):
+            if len(key_parts) < 2 or any("." in next_part for next_part in key_parts):
+                raise ValueError(
+                    f"The name of property '{property_key}' cannot be written as an ini section and item."
+                )
+            if key_parts[0] != current_section:
+                if current_section is not None:
+                    output_stream.write("\n")
+                current_section = key_parts[0]
+                output_stream.write(f"[{current_section}]\n")
+            formatted_value = ApplicationPropertiesWriter.__format_ini_value(
+                property_key, property_value
+            )
+            output_stream.write(f"{'.'.join(key_parts[1:])} = {formatted_value}\n")
+
+    @staticmethod
+    def __format_ini_value(property_key: str, property_value: Any) -> str:
+        if isinstance(property_value, bool):
+            return f"{ApplicationPropertiesWriter.__ini_typed_boolean}{'true' if property_value else 'false'}"
+        if isinstance(property_value, int):
+            return f"{ApplicationPropertiesWriter.__ini_typed_integer}{property_value}"
+        if (
+            isinstance(property_value, str)
+            and "\n" not in property_value
+            and "\r" not in property_value
+            and property_value == property_value.rstrip()
+        ):
+            # A string is left as is unless the loader would change or type it.
+            escaped_value = property_value.replace("%", "%%")
+            if (
+                escaped_value
+                and not escaped_value.startswith("$")
+                and escaped_value == escaped_value.lstrip()
+            ):
+                return escaped_value
+            return f"{ApplicationPropertiesWriter.__ini_typed_string}{escaped_value}"
+        raise ValueError(
+            f"The value for property '{property_key}' cannot be written as an ini value."
+        )
@@ -22,6 +22,10 @@ from application_properties.application_properties_json_loader import (
 from application_properties.application_properties_loader_helper import (
     ApplicationPropertiesLoaderHelper,
 )
+from application_properties.application_properties_provenance import PropertySourceKind
+from application_properties.application_properties_schema import (
+    ApplicationPropertiesSchema,
+)
 from application_properties.application_properties_toml_loader import (
     ApplicationPropertiesTomlLoader,
 )
@@ -489,19 +493,16 @@ class ManuallySetProperties(BaseConfigurationSource):
 
         did_apply = did_error = False
         if self.manual_properties:
-            last_next_item = ""
+            LOGGER.debug(
+                "Attempting to set %d manual properties.",
+                len(self.manual_properties),
+            )
             try:
-                for next_item in self.manual_properties:
-                    last_next_item = next_item
-                    LOGGER.debug(
-                        "Attempting to set manual property '%s'.",
-                        next_item,
-                    )
-                    application_properties.set_manual_property(next_item)
+                with application_properties.recording_source(PropertySourceKind.MANUAL):
+                    application_properties.set_manual_properties(self.manual_properties)
                 did_apply = True
             except ValueError as this_exception:
-                formatted_error = f"Manually set property '{last_next_item}' was not validly formed: {this_exception}"
-                handle_error_fn(formatted_error, this_exception)
+                handle_error_fn(str(this_exception), this_exception)
                 did_error = True
 
         return did_apply, did_error
@@ -678,14 +679,20 @@ class MultisourceConfigurationLoader:
         self,
         application_properties: ApplicationProperties,
         handle_error_fn: Optional[Callable[[str, Optional[Exception]], None]] = None,
+        schema: Optional[ApplicationPropertiesSchema] = None,
     ) -> bool:
         """
         Process any registered configuration sources, stopping at the first sign of
-        error.
+        error.  Once every source has been applied, the configuration is checked
+        against the schema, if there is one, in a single pass.
 
         Args:
             application_properties: Instance of `ApplicationProperties` to apply the configuration to.
             handle_error_fn: Function to call if there are any errors when applying the configuration.
+            schema: Schema to check the configuration against.  If not provided, the
+                schema already applied to `application_properties`, if any, is used.
+        Returns:
+            True if any errors occurred, otherwise False.
         """
         guaranteed_handle_error_fn: Callable[[str, Optional[Exception]], None] = (
             ApplicationPropertiesLoaderHelper.set_error_handler_if_not_set(
@@ -699,4 +706,41 @@ class MultisourceConfigurationLoader:
             )
             if did_error:
                 return True
-        return False
+
+        if schema is None:
+            schema = application_properties.schema
+        if schema is None:
+            return False
+        schema_violations = application_properties.apply_schema(schema)
+        for next_violation in schema_violations:
+            guaranteed_handle_error_fn(
+                f"Configuration does not match the schema: {next_violation}", None
+            )
+        return bool(schema_violations)
+
+    def reload(
+        self,
+        application_properties: ApplicationProperties,
+        handle_error_fn: Optional[Callable[[str, Optional[Exception]], None]] = None,
+        schema: Optional[ApplicationPropertiesSchema] = None,
+    ) -> bool:
+        """
+        Process any registered configuration sources into a new, empty set of
+        properties and, only if there were no errors, publish them to the
+        `application_properties` instance as a single change.  Readers of that
+        instance never see an empty or partially loaded configuration, and a
+        failed reload leaves the previous configuration in place.
+
+        Args:
+            application_properties: Instance of `ApplicationProperties` to publish the configuration to.
+            handle_error_fn: Function to call if there are any errors when applying the configuration.
+            schema: Schema to check the configuration against, as with `process`.
+        Returns:
+            True if any errors occurred, otherwise False.
+        """
+        staged_properties = application_properties.create_staging()
+        if did_error := self.process(staged_properties, handle_error_fn, schema):
+            LOGGER.debug("Reload failed, keeping the current configuration.")
+        else:
+            application_properties.publish(staged_properties)
+        return did_error
@@ -0,0 +1,45 @@
+"""
+Benchmark comparing `get_integer_property` calls against compiled accessors.
+
+Run with `python -m benchmarks.benchmark_compiled_accessor` from the project root.
+"""
+
+import timeit
+
+from application_properties import ApplicationProperties
+
+KEY_COUNT = 300
+REPEAT_COUNT = 200
+
+
+def main() -> None:
+    """
+    Time reading every key through the getter and through a compiled accessor.
+    """
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"section": {f"key{index}": index for index in range(KEY_COUNT)}}
+    )
+    key_names = [f"section.key{index}" for index in range(KEY_COUNT)]
+    accessors = [
+        application_properties.compile_accessor(next_key, int, -1)
+        for next_key in key_names
+    ]
+
+    def read_with_getter() -> None:
+        for next_key in key_names:
+            application_properties.get_integer_property(next_key, -1)
+
+    def read_with_accessor() -> None:
+        for next_accessor in accessors:
+            next_accessor.get()
+
+    getter_time = timeit.timeit(read_with_getter, number=REPEAT_COUNT)
+    accessor_time = timeit.timeit(read_with_accessor, number=REPEAT_COUNT)
+    print(f"get_integer_property: {getter_time:.4f}s")
+    print(f"compiled accessor:    {accessor_time:.4f}s")
+    print(f"speedup:              {getter_time / accessor_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
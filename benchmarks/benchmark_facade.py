@@ -0,0 +1,52 @@
+"""
+Benchmark for listing and getting properties through nested facades over a
+large set of properties.
+
+Run with `python -m benchmarks.benchmark_facade` from the project root.
+"""
+
+import timeit
+
+from application_properties import ApplicationProperties, ApplicationPropertiesFacade
+
+PLUGIN_COUNT = 1_000
+SETTING_COUNT = 20
+REPEAT_COUNT = 2_000
+
+
+def main() -> None:
+    """
+    Time listing the properties of a plugin facade, getting a property through
+    the facade, and getting it through a compiled accessor.
+    """
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "plugins": {
+                f"plugin{plugin_index}": {
+                    f"setting{setting_index}": setting_index
+                    for setting_index in range(SETTING_COUNT)
+                }
+                for plugin_index in range(PLUGIN_COUNT)
+            }
+        }
+    )
+    plugins_facade = ApplicationPropertiesFacade(application_properties, "plugins.")
+    plugin_facade = plugins_facade.sub_facade("plugin500.")
+    accessor = plugin_facade.compile_accessor("setting5", int)
+
+    list_time = timeit.timeit(lambda: plugin_facade.property_names, number=REPEAT_COUNT)
+    get_time = timeit.timeit(
+        lambda: plugin_facade.get_integer_property("setting5"), number=REPEAT_COUNT
+    )
+    accessor_time = timeit.timeit(accessor.get, number=REPEAT_COUNT)
+    print(f"{PLUGIN_COUNT * SETTING_COUNT} properties, {REPEAT_COUNT} calls each:")
+    print(f"  property_names:       {list_time * 1e6 / REPEAT_COUNT:7.2f}us per call")
+    print(f"  get_integer_property: {get_time * 1e6 / REPEAT_COUNT:7.2f}us per call")
+    print(
+        f"  compiled accessor:    {accessor_time * 1e6 / REPEAT_COUNT:7.2f}us per call"
+    )
+
+
+if __name__ == "__main__":
+    main()
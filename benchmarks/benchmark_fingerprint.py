@@ -0,0 +1,122 @@
+"""
+Benchmark comparing fingerprinting and diffing properties by serializing every
+key against the digests kept in the key index.
+
+Run with `python -m benchmarks.benchmark_fingerprint [size ...]` from the project root.
+"""
+
+import hashlib
+import itertools
+import json
+import sys
+import timeit
+from typing import Any, Dict, Iterator, List
+
+from application_properties import ApplicationProperties
+
+DEFAULT_SIZES = [10_000, 100_000]
+REPEAT_COUNT = 5
+PLUGIN_SIZE = 10
+CHANGE_VALUES = itertools.count(-1, -1)
+
+
+def build_properties(property_count: int) -> ApplicationProperties:
+    """
+    Build properties with `property_count` keys, grouped into small plugins.
+    """
+    config_map: Dict[str, Any] = {"plugins": {}}
+    for plugin_index in range(property_count // PLUGIN_SIZE):
+        config_map["plugins"][f"md{plugin_index:07}"] = {
+            f"value{value_index}": value_index for value_index in range(PLUGIN_SIZE)
+        }
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    return application_properties
+
+
+def serialized_fingerprint(properties: ApplicationProperties) -> str:
+    """
+    Fingerprint the properties by serializing every key and value.
+    """
+    return hashlib.blake2b(
+        json.dumps(
+            {
+                next_name: properties.get_property(next_name, object)
+                for next_name in sorted(properties.property_names_view)
+            }
+        ).encode(),
+        digest_size=8,
+    ).hexdigest()
+
+
+def serialized_diff(
+    properties: ApplicationProperties, other_properties: ApplicationProperties
+) -> List[str]:
+    """
+    Diff the properties by comparing the value of every key.
+    """
+    return sorted(
+        next_name
+        for next_name in set(properties.property_names_view)
+        | set(other_properties.property_names_view)
+        if properties.get_property(next_name, object)
+        != other_properties.get_property(next_name, object)
+    )
+
+
+def main(property_sizes: List[int]) -> None:
+    """
+    Time fingerprinting after one change, and diffing against a snapshot.
+    """
+    for property_count in property_sizes:
+        application_properties = build_properties(property_count)
+        application_properties.fingerprint()
+        original_properties = application_properties.snapshot()
+
+        def change_and_fingerprint(
+            properties: ApplicationProperties = application_properties,
+            change_values: Iterator[int] = CHANGE_VALUES,
+        ) -> None:
+            properties.set_property("plugins.md0000001.value1", next(change_values))
+            properties.fingerprint()
+
+        def change_and_serialize(
+            properties: ApplicationProperties = application_properties,
+            change_values: Iterator[int] = CHANGE_VALUES,
+        ) -> None:
+            properties.set_property("plugins.md0000001.value1", next(change_values))
+            serialized_fingerprint(properties)
+
+        serialize_time = min(
+            timeit.repeat(change_and_serialize, number=1, repeat=REPEAT_COUNT)
+        )
+        digest_time = min(
+            timeit.repeat(change_and_fingerprint, number=1, repeat=REPEAT_COUNT)
+        )
+        print(
+            f"{property_count:>9} keys fingerprint: serialize {serialize_time * 1000:.3f}ms, "
+            + f"digest {digest_time * 1000:.3f}ms"
+        )
+
+        def compare_diff(
+            properties: ApplicationProperties = application_properties,
+            other_properties: ApplicationProperties = original_properties,
+        ) -> None:
+            serialized_diff(properties, other_properties)
+
+        def digest_diff(
+            properties: ApplicationProperties = application_properties,
+            other_properties: ApplicationProperties = original_properties,
+        ) -> None:
+            properties.diff(other_properties)
+
+        serialize_time = min(timeit.repeat(compare_diff, number=1, repeat=REPEAT_COUNT))
+        digest_time = min(timeit.repeat(digest_diff, number=1, repeat=REPEAT_COUNT))
+        print(
+            f"{property_count:>9} keys diff:        compare {serialize_time * 1000:.3f}ms, "
+            + f"digest {digest_time * 1000:.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main([int(next_size) for next_size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,65 @@
+"""
+Benchmark comparing individual getter calls against one `get_properties` call.
+
+Run with `python -m benchmarks.benchmark_get_properties` from the project root.
+"""
+
+import timeit
+
+from application_properties import ApplicationProperties, PropertySpec
+
+KEY_COUNT = 300
+REPEAT_COUNT = 200
+
+
+def main() -> None:
+    """
+    Time reading a set of mixed properties one at a time and all at once.
+    """
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "section": {
+                f"key{index}": [index, f"value{index}", index % 2 == 0][index % 3]
+                for index in range(KEY_COUNT)
+            }
+        }
+    )
+    property_types = [int, str, bool]
+    property_defaults = [-1, "", False]
+    property_specs = [
+        PropertySpec(
+            f"section.key{index}",
+            property_types[index % 3],
+            property_defaults[index % 3],
+        )
+        for index in range(KEY_COUNT)
+    ]
+
+    def read_one_at_a_time() -> None:
+        for next_spec in property_specs:
+            if next_spec.property_type is int:
+                application_properties.get_integer_property(
+                    next_spec.property_name, next_spec.default_value
+                )
+            elif next_spec.property_type is str:
+                application_properties.get_string_property(
+                    next_spec.property_name, next_spec.default_value
+                )
+            else:
+                application_properties.get_boolean_property(
+                    next_spec.property_name, next_spec.default_value
+                )
+
+    def read_all_at_once() -> None:
+        application_properties.get_properties(property_specs)
+
+    loop_time = timeit.timeit(read_one_at_a_time, number=REPEAT_COUNT)
+    batch_time = timeit.timeit(read_all_at_once, number=REPEAT_COUNT)
+    print(f"individual getters: {loop_time:.4f}s")
+    print(f"get_properties:     {batch_time:.4f}s")
+    print(f"speedup:            {loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
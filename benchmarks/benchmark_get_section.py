@@ -0,0 +1,95 @@
+"""
+Benchmark comparing rebuilding a plugin's section by scanning every property
+name against `get_section`, both the first time and once it is cached.
+
+Run with `python -m benchmarks.benchmark_get_section [size ...]` from the project root.
+"""
+
+import functools
+import sys
+import timeit
+from typing import Any, Dict, List
+
+from application_properties import ApplicationProperties
+
+DEFAULT_SIZES = [10_000, 100_000]
+REPEAT_COUNT = 20
+PLUGIN_SIZE = 10
+SECTION_KEY = "plugins.md0000001"
+
+
+def build_properties(property_count: int) -> ApplicationProperties:
+    """
+    Build properties with `property_count` keys, grouped into small plugins.
+    """
+    config_map: Dict[str, Any] = {"plugins": {}}
+    for plugin_index in range(property_count // PLUGIN_SIZE):
+        config_map["plugins"][f"md{plugin_index:07}"] = {
+            "options": {
+                f"value{value_index}": value_index for value_index in range(PLUGIN_SIZE)
+            }
+        }
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    return application_properties
+
+
+def rebuild_by_scan(properties: ApplicationProperties) -> Dict[str, Any]:
+    """
+    Rebuild the section by scanning every property name, as was needed before.
+    """
+    section_prefix = f"{SECTION_KEY}."
+    section_value: Dict[str, Any] = {}
+    for next_name in properties.property_names_view:
+        if next_name.startswith(section_prefix):
+            *parent_parts, last_part = next_name[len(section_prefix) :].split(".")
+            parent_value = section_value
+            for next_part in parent_parts:
+                parent_value = parent_value.setdefault(next_part, {})
+            parent_value[last_part] = properties.get_property(next_name, object)
+    return section_value
+
+
+def main(property_sizes: List[int]) -> None:
+    """
+    Time getting one plugin's section at each size.
+    """
+    for property_count in property_sizes:
+        application_properties = build_properties(property_count)
+
+        def first_get_section(
+            properties: ApplicationProperties = application_properties,
+        ) -> None:
+            properties.set_property(f"{SECTION_KEY}.options.value0", 0)
+            properties.get_section(SECTION_KEY)
+
+        def cached_get_section(
+            properties: ApplicationProperties = application_properties,
+        ) -> None:
+            properties.get_section(SECTION_KEY)
+
+        assert rebuild_by_scan(application_properties) == (
+            application_properties.get_section(SECTION_KEY)
+        )
+        scan_time = min(
+            timeit.repeat(
+                functools.partial(rebuild_by_scan, application_properties),
+                number=1,
+                repeat=REPEAT_COUNT,
+            )
+        )
+        first_time = min(
+            timeit.repeat(first_get_section, number=1, repeat=REPEAT_COUNT)
+        )
+        cached_time = min(
+            timeit.repeat(cached_get_section, number=1, repeat=REPEAT_COUNT)
+        )
+        print(
+            f"{property_count:>9} keys: scan {scan_time * 1000:.3f}ms, "
+            + f"get_section {first_time * 1000:.3f}ms, "
+            + f"cached {cached_time * 1000:.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main([int(next_size) for next_size in sys.argv[1:]] or DEFAULT_SIZES)
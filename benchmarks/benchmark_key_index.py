@@ -0,0 +1,74 @@
+"""
+Benchmark comparing a linear prefix scan over every property name against the
+hierarchical key index used by `property_names_under`.
+
+Run with `python -m benchmarks.benchmark_key_index [size ...]` from the project root.
+"""
+
+import sys
+import timeit
+from typing import Any, Dict, List
+
+from application_properties import ApplicationProperties
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+REPEAT_COUNT = 20
+PLUGIN_SIZE = 10
+
+
+def build_properties(property_count: int) -> ApplicationProperties:
+    """
+    Build properties with `property_count` keys, grouped into small plugins.
+    """
+    config_map: Dict[str, Any] = {"plugins": {}}
+    for plugin_index in range(property_count // PLUGIN_SIZE):
+        config_map["plugins"][f"md{plugin_index:07}"] = {
+            f"value{value_index}": value_index for value_index in range(PLUGIN_SIZE)
+        }
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    return application_properties
+
+
+def main(property_sizes: List[int]) -> None:
+    """
+    Time the enumeration and counting of one plugin's keys at each size.
+    """
+    for property_count in property_sizes:
+        application_properties = build_properties(property_count)
+        key_prefix = "plugins.md0000001"
+
+        def linear_scan(
+            prefix: str = key_prefix,
+            properties: ApplicationProperties = application_properties,
+        ) -> None:
+            _ = [
+                next_name
+                for next_name in properties.property_names_view
+                if next_name.startswith(prefix)
+            ]
+
+        def indexed_lookup(
+            prefix: str = key_prefix,
+            properties: ApplicationProperties = application_properties,
+        ) -> None:
+            _ = properties.property_names_under(prefix)
+
+        def indexed_count(
+            prefix: str = key_prefix,
+            properties: ApplicationProperties = application_properties,
+        ) -> None:
+            _ = properties.number_of_properties_under(prefix)
+
+        scan_time = timeit.timeit(linear_scan, number=REPEAT_COUNT) / REPEAT_COUNT
+        lookup_time = timeit.timeit(indexed_lookup, number=REPEAT_COUNT) / REPEAT_COUNT
+        count_time = timeit.timeit(indexed_count, number=REPEAT_COUNT) / REPEAT_COUNT
+        print(
+            f"{property_count:>9} keys: linear scan {scan_time * 1e6:10.1f}us, "
+            + f"index names {lookup_time * 1e6:8.1f}us, "
+            + f"index count {count_time * 1e6:8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main([int(next_arg) for next_arg in sys.argv[1:]] or DEFAULT_SIZES)
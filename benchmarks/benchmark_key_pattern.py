@@ -0,0 +1,76 @@
+"""
+Benchmark comparing a regular expression over every property name against
+matching a segment-aware pattern with `property_names_matching`.
+
+Run with `python -m benchmarks.benchmark_key_pattern [size ...]` from the project root.
+"""
+
+import re
+import sys
+import timeit
+from typing import Any, Dict, List
+
+from application_properties import ApplicationProperties
+
+DEFAULT_SIZES = [10_000, 100_000]
+REPEAT_COUNT = 20
+PLUGIN_SIZE = 10
+PATTERNS = [
+    ("plugins.md000012?.value1", "plugins\\.md000012[^.]\\.value1"),
+    ("plugins.*.value1", "plugins\\.[^.]+\\.value1"),
+    ("**.value1", "(.+\\.)?value1"),
+]
+
+
+def build_properties(property_count: int) -> ApplicationProperties:
+    """
+    Build properties with `property_count` keys, grouped into small plugins.
+    """
+    config_map: Dict[str, Any] = {"plugins": {}}
+    for plugin_index in range(property_count // PLUGIN_SIZE):
+        config_map["plugins"][f"md{plugin_index:07}"] = {
+            f"value{value_index}": value_index for value_index in range(PLUGIN_SIZE)
+        }
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    return application_properties
+
+
+def main(property_sizes: List[int]) -> None:
+    """
+    Time each pattern against a full scan of the property names at each size.
+    """
+    for property_count in property_sizes:
+        application_properties = build_properties(property_count)
+        for key_pattern, regular_expression in PATTERNS:
+            compiled_expression = re.compile(regular_expression)
+
+            def full_scan(
+                properties: ApplicationProperties = application_properties,
+                expression: "re.Pattern[str]" = compiled_expression,
+            ) -> List[str]:
+                return [
+                    next_name
+                    for next_name in properties.property_names_view
+                    if expression.fullmatch(next_name)
+                ]
+
+            def pattern_match(
+                properties: ApplicationProperties = application_properties,
+                pattern: str = key_pattern,
+            ) -> List[str]:
+                return properties.property_names_matching(pattern)
+
+            assert sorted(full_scan()) == sorted(pattern_match())
+            scan_time = min(timeit.repeat(full_scan, number=1, repeat=REPEAT_COUNT))
+            match_time = min(
+                timeit.repeat(pattern_match, number=1, repeat=REPEAT_COUNT)
+            )
+            print(
+                f"{property_count:>9} keys {key_pattern:<26} scan {scan_time * 1000:.3f}ms, "
+                + f"pattern {match_time * 1000:.3f}ms, speedup {scan_time / match_time:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main([int(next_size) for next_size in sys.argv[1:]] or DEFAULT_SIZES)
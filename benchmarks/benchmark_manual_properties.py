@@ -0,0 +1,59 @@
+"""
+Benchmark comparing setting a large batch of manual properties one at a time
+with `set_manual_property` against setting them together with
+`set_manual_properties`.
+
+Run with `python -m benchmarks.benchmark_manual_properties` from the project root.
+"""
+
+import sys
+import timeit
+from typing import List
+
+from application_properties import ApplicationProperties
+
+ENTRY_COUNT = 100_000
+REPEAT_COUNT = 3
+
+
+def build_entries(entry_count: int) -> List[str]:
+    """
+    Build a list of manual properties, mixing untyped and typed values.
+    """
+    return [
+        (
+            f"section{next_index // 100}.item{next_index % 100}=$#{next_index}"
+            if next_index % 2
+            else f"section{next_index // 100}.item{next_index % 100}={next_index}"
+        )
+        for next_index in range(entry_count)
+    ]
+
+
+def main() -> None:
+    """
+    Compare the per-item and bulk paths for the same batch of entries.
+    """
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRY_COUNT
+    entries = build_entries(entry_count)
+
+    def set_each_property() -> None:
+        application_properties = ApplicationProperties()
+        for next_entry in entries:
+            application_properties.set_manual_property(next_entry)
+
+    def set_all_properties() -> None:
+        application_properties = ApplicationProperties()
+        application_properties.set_manual_properties(entries)
+
+    ApplicationProperties.clear_key_validation_cache()
+    each_time = min(timeit.repeat(set_each_property, number=1, repeat=REPEAT_COUNT))
+    ApplicationProperties.clear_key_validation_cache()
+    all_time = min(timeit.repeat(set_all_properties, number=1, repeat=REPEAT_COUNT))
+    print(f"set_manual_property   x{entry_count}: {each_time:.3f}s")
+    print(f"set_manual_properties x{entry_count}: {all_time:.3f}s")
+    print(f"speedup: {each_time / all_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark comparing reading a table of numbers under a prefix one property at a
+time against extracting it with `get_numeric_array`.
+
+Run with `python -m benchmarks.benchmark_numeric_array` from the project root.
+"""
+
+import timeit
+from typing import List, Optional
+
+from application_properties import ApplicationProperties
+
+RULE_COUNT = 1_000
+REPEAT_COUNT = 200
+TRIAL_COUNT = 5
+
+
+def main() -> None:
+    """
+    Compare building the list of numbers by hand against one bulk extraction.
+    """
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "thresholds": {
+                f"md{rule_index:04}": rule_index for rule_index in range(RULE_COUNT)
+            }
+        }
+    )
+
+    def read_by_hand() -> List[Optional[int]]:
+        return [
+            application_properties.get_integer_property(next_property_name)
+            for next_property_name in application_properties.property_names_under(
+                "thresholds"
+            )
+        ]
+
+    by_hand_time = min(
+        timeit.repeat(read_by_hand, number=REPEAT_COUNT, repeat=TRIAL_COUNT)
+    )
+    bulk_time = min(
+        timeit.repeat(
+            lambda: application_properties.get_numeric_array("thresholds", "q"),
+            number=REPEAT_COUNT,
+            repeat=TRIAL_COUNT,
+        )
+    )
+    print(
+        f"{RULE_COUNT} integers: by hand {by_hand_time:.3f}s, "
+        + f"get_numeric_array {bulk_time:.3f}s, "
+        + f"speedup {by_hand_time / bulk_time:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
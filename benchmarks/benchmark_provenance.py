@@ -0,0 +1,101 @@
+"""
+Benchmark measuring the memory and time that recording the source of every
+property adds when loading a large configuration, and the cost of overriding
+part of it from a second layer.
+
+Run with `python -m benchmarks.benchmark_provenance [size ...]` from the project root.
+"""
+
+import functools
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from application_properties import ApplicationProperties, PropertySourceKind
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+PLUGIN_SIZE = 10
+OVERRIDE_EVERY = 100
+
+
+def build_config_map(property_count: int) -> Dict[str, Any]:
+    """
+    Build a configuration with `property_count` keys, grouped into small plugins.
+    """
+    config_map: Dict[str, Any] = {"plugins": {}}
+    for plugin_index in range(property_count // PLUGIN_SIZE):
+        config_map["plugins"][f"md{plugin_index:07}"] = {
+            f"value{value_index}": value_index for value_index in range(PLUGIN_SIZE)
+        }
+    return config_map
+
+
+def load_layers(
+    config_map: Dict[str, Any],
+    manual_properties: List[str],
+    source_kinds: Optional[Tuple[PropertySourceKind, PropertySourceKind]],
+) -> ApplicationProperties:
+    """
+    Load the configuration as a file layer, then apply the manual properties
+    over it, recording the sources if any source kinds are given.
+    """
+    application_properties = ApplicationProperties()
+    if source_kinds:
+        with application_properties.recording_source(source_kinds[0], "big.json"):
+            application_properties.load_from_dict(config_map)
+        with application_properties.recording_source(source_kinds[1]):
+            application_properties.set_manual_properties(manual_properties)
+    else:
+        application_properties.load_from_dict(config_map)
+        application_properties.set_manual_properties(manual_properties)
+    return application_properties
+
+
+def measure(load_function: Callable[[], ApplicationProperties]) -> Tuple[int, float]:
+    """
+    Measure the memory kept by the loaded properties, and the time to load them.
+    """
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        loaded_properties = load_function()
+        load_time = time.perf_counter() - start_time
+        kept_memory = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del loaded_properties
+    return kept_memory, load_time
+
+
+def main(property_sizes: List[int]) -> None:
+    """
+    Compare loading with and without recording sources at each size.
+    """
+    for property_count in property_sizes:
+        config_map = build_config_map(property_count)
+        manual_properties = [
+            f"plugins.md{plugin_index:07}.value0=$#-1"
+            for plugin_index in range(0, property_count // PLUGIN_SIZE, OVERRIDE_EVERY)
+        ]
+        plain_memory, plain_time = measure(
+            functools.partial(load_layers, config_map, manual_properties, None)
+        )
+        tracked_memory, tracked_time = measure(
+            functools.partial(
+                load_layers,
+                config_map,
+                manual_properties,
+                (PropertySourceKind.JSON, PropertySourceKind.MANUAL),
+            )
+        )
+        print(
+            f"{property_count:>9} keys: plain {plain_memory / 1024 / 1024:.1f}MiB "
+            + f"{plain_time:.2f}s, tracked {tracked_memory / 1024 / 1024:.1f}MiB "
+            + f"{tracked_time:.2f}s, "
+            + f"{(tracked_memory - plain_memory) / property_count:.1f} bytes/key"
+        )
+
+
+if __name__ == "__main__":
+    main([int(next_size) for next_size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,72 @@
+"""
+Benchmark comparing getting properties declared in an applied schema against
+getting the same properties with the checking getters.
+
+Run with `python -m benchmarks.benchmark_schema` from the project root.
+"""
+
+import timeit
+
+from application_properties import ApplicationProperties, PropertySpec, RangeValidator
+
+PROPERTY_COUNT = 50
+REPEAT_COUNT = 2_000
+
+
+def main() -> None:
+    """
+    Time reading every declared property with `get_property` and with
+    `get_declared_property`, and time applying the schema once.
+    """
+    property_specs = [
+        PropertySpec(
+            f"plugin.setting{next_index}",
+            int,
+            valid_value_fn=RangeValidator(0, PROPERTY_COUNT),
+        )
+        for next_index in range(PROPERTY_COUNT)
+    ]
+    schema = ApplicationProperties.compile_schema(property_specs)
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "plugin": {
+                f"setting{next_index}": next_index
+                for next_index in range(PROPERTY_COUNT)
+            }
+        }
+    )
+
+    apply_time = timeit.timeit(
+        lambda: application_properties.apply_schema(schema), number=REPEAT_COUNT
+    )
+
+    def read_with_getters() -> None:
+        for next_spec in property_specs:
+            application_properties.get_property(
+                next_spec.property_name,
+                next_spec.property_type,
+                valid_value_fn=next_spec.valid_value_fn,
+                strict_mode=True,
+            )
+
+    def read_declared() -> None:
+        for next_spec in property_specs:
+            application_properties.get_declared_property(next_spec.property_name)
+
+    getter_time = timeit.timeit(read_with_getters, number=REPEAT_COUNT)
+    declared_time = timeit.timeit(read_declared, number=REPEAT_COUNT)
+    print(
+        f"apply_schema ({PROPERTY_COUNT} properties): {apply_time * 1e6 / REPEAT_COUNT:8.2f}us"
+    )
+    print(
+        f"get_property          x{PROPERTY_COUNT}: {getter_time * 1e6 / REPEAT_COUNT:8.2f}us"
+    )
+    print(
+        f"get_declared_property x{PROPERTY_COUNT}: {declared_time * 1e6 / REPEAT_COUNT:8.2f}us"
+    )
+    print(f"speedup: {getter_time / declared_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
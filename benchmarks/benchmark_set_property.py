@@ -0,0 +1,99 @@
+"""
+Benchmark comparing setting typed values with `set_property` and
+`set_properties` against formatting them as strings for
+`set_manual_property` and `set_manual_properties`, along with the cost of
+removing them again.
+
+Run with `python -m benchmarks.benchmark_set_property` from the project root.
+"""
+
+import sys
+import timeit
+from typing import Any, Dict, List
+
+from application_properties import ApplicationProperties
+
+ENTRY_COUNT = 100_000
+SECTION_SIZE = 100
+REPEAT_COUNT = 3
+
+
+def build_values(entry_count: int) -> Dict[str, Any]:
+    """
+    Build a map of full property names to integer, boolean, and string values.
+    """
+    built_values: Dict[str, Any] = {}
+    for next_index in range(entry_count):
+        property_name = (
+            f"section{next_index // SECTION_SIZE}.item{next_index % SECTION_SIZE}"
+        )
+        if next_index % 3 == 0:
+            built_values[property_name] = next_index
+        elif next_index % 3 == 1:
+            built_values[property_name] = next_index % 2 == 0
+        else:
+            built_values[property_name] = f"value{next_index}"
+    return built_values
+
+
+def format_manual_property(property_name: str, property_value: Any) -> str:
+    """
+    Format a typed value as a manual property string, with its type tag.
+    """
+    if isinstance(property_value, bool):
+        return f"{property_name}=$!{property_value}"
+    if isinstance(property_value, int):
+        return f"{property_name}=$#{property_value}"
+    return f"{property_name}=$${property_value}"
+
+
+def main() -> None:
+    """
+    Compare the typed and string paths for the same set of values.
+    """
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRY_COUNT
+    property_values = build_values(entry_count)
+
+    def set_each_manual_property() -> None:
+        application_properties = ApplicationProperties()
+        for property_name, property_value in property_values.items():
+            application_properties.set_manual_property(
+                format_manual_property(property_name, property_value)
+            )
+
+    def set_each_property() -> None:
+        application_properties = ApplicationProperties()
+        for property_name, property_value in property_values.items():
+            application_properties.set_property(property_name, property_value)
+
+    def set_manual_properties() -> None:
+        manual_properties: List[str] = [
+            format_manual_property(property_name, property_value)
+            for property_name, property_value in property_values.items()
+        ]
+        ApplicationProperties().set_manual_properties(manual_properties)
+
+    def set_properties() -> None:
+        ApplicationProperties().set_properties(property_values)
+
+    for description, timed_fn in [
+        ("set_manual_property per entry", set_each_manual_property),
+        ("set_property per entry", set_each_property),
+        ("set_manual_properties", set_manual_properties),
+        ("set_properties", set_properties),
+    ]:
+        best_time = min(timeit.repeat(timed_fn, number=1, repeat=REPEAT_COUNT))
+        print(f"{description:<30} x{entry_count}: {best_time:.3f}s")
+
+    application_properties = ApplicationProperties()
+    application_properties.set_properties(property_values)
+    remove_time = timeit.timeit(
+        lambda: application_properties.remove_under("section5"), number=1
+    )
+    print(
+        f"{'remove_under one section':<30} x{SECTION_SIZE}: {remove_time * 1e3:.3f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
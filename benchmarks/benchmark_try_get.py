@@ -0,0 +1,88 @@
+"""
+Benchmark comparing getting a property in strict mode, catching the exception
+for a missing, wrongly typed, or invalid value, against trying to get the same
+property without any exception being raised.
+
+Run with `python -m benchmarks.benchmark_try_get` from the project root.
+"""
+
+import timeit
+from typing import Any, Callable
+
+from application_properties import ApplicationProperties, RangeValidator
+
+REPEAT_COUNT = 100_000
+TRIAL_COUNT = 5
+
+
+def check_range(value: int) -> None:
+    """
+    Validation function that only accepts values from 1 to 100.
+    """
+    if not 1 <= value <= 100:
+        raise ValueError("Value is out of range.")
+
+
+def main() -> None:
+    """
+    Compare raising and catching an exception against returning a result.
+    """
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"good": 50, "wrong_type": "50", "bad_range": 500}
+    )
+
+    def time_call(called_fn: Callable[[], Any]) -> float:
+        return min(timeit.repeat(called_fn, number=REPEAT_COUNT, repeat=TRIAL_COUNT))
+
+    def get_with_except(property_name: str, valid_value_fn: Any) -> Any:
+        try:
+            return application_properties.get_integer_property(
+                property_name,
+                -1,
+                valid_value_fn=valid_value_fn,
+                is_required=False,
+                strict_mode=True,
+            )
+        except ValueError:
+            return -1
+
+    def get_required_with_except(property_name: str) -> Any:
+        try:
+            return application_properties.get_integer_property(
+                property_name, is_required=True
+            )
+        except ValueError:
+            return -1
+
+    for case_name, property_name, valid_value_fn in [
+        ("found", "good", check_range),
+        ("wrong type", "wrong_type", None),
+        ("not valid (function)", "bad_range", check_range),
+        ("not valid (validator)", "bad_range", RangeValidator(1, 100)),
+    ]:
+        except_time = time_call(
+            lambda name=property_name, fn=valid_value_fn: get_with_except(name, fn)
+        )
+        try_time = time_call(
+            lambda name=property_name, fn=valid_value_fn: application_properties.try_get_integer_property(
+                name, -1, valid_value_fn=fn
+            )
+        )
+        print(
+            f"{case_name:<22} get/except {except_time:.3f}s, try_get {try_time:.3f}s, "
+            + f"speedup {except_time / try_time:.2f}x"
+        )
+
+    except_time = time_call(lambda: get_required_with_except("missing"))
+    try_time = time_call(
+        lambda: application_properties.try_get_integer_property("missing", -1)
+    )
+    print(
+        f"{'missing':<22} get/except {except_time:.3f}s, try_get {try_time:.3f}s, "
+        + f"speedup {except_time / try_time:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
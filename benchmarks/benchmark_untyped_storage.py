@@ -0,0 +1,92 @@
+"""
+Benchmark measuring the memory held by the storage of an ApplicationProperties
+instance after loading untyped INI entries, and the time to enumerate the
+names of its properties.
+
+Run with `python -m benchmarks.benchmark_untyped_storage` from the project root.
+To compare against another version of the storage, such as the one that kept
+untyped values in the same map under a `.` prefix, run this file with that
+version first on the `PYTHONPATH`, for example from a `git worktree` of it.
+"""
+
+import gc
+import os
+import tempfile
+import timeit
+import tracemalloc
+from typing import Tuple
+
+from application_properties import (
+    ApplicationProperties,
+    ApplicationPropertiesConfigLoader,
+)
+
+ENTRY_COUNT = 20_000
+SECTION_SIZE = 100
+REPEAT_COUNT = 20
+
+
+def write_ini_file() -> str:
+    """
+    Write an INI file with `ENTRY_COUNT` untyped entries.
+    """
+    with tempfile.NamedTemporaryFile(
+        "wt", suffix=".ini", delete=False, encoding="utf-8"
+    ) as outfile:
+        for section_index in range(ENTRY_COUNT // SECTION_SIZE):
+            outfile.write(f"[section{section_index}]\n")
+            for item_index in range(SECTION_SIZE):
+                outfile.write(f"item{item_index} = {item_index}\n")
+        return outfile.name
+
+
+def load_with_memory(ini_file_name: str) -> Tuple[ApplicationProperties, int]:
+    """
+    Load the INI file into new properties, returning them along with the memory
+    still allocated once loading is done.
+    """
+    gc.collect()
+    tracemalloc.start()
+    application_properties = ApplicationProperties()
+    ApplicationPropertiesConfigLoader.load_and_set(
+        application_properties, ini_file_name
+    )
+    gc.collect()
+    allocated_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return application_properties, allocated_size
+
+
+def main() -> None:
+    """
+    Measure the storage of the properties for a set of untyped entries.
+    """
+    ini_file_name = write_ini_file()
+    try:
+        application_properties, allocated_size = load_with_memory(ini_file_name)
+        load_time = timeit.timeit(
+            lambda: ApplicationPropertiesConfigLoader.load_and_set(
+                ApplicationProperties(), ini_file_name
+            ),
+            number=1,
+        )
+    finally:
+        os.remove(ini_file_name)
+    assert application_properties.number_of_properties == ENTRY_COUNT
+
+    names_time = timeit.timeit(
+        lambda: application_properties.property_names, number=REPEAT_COUNT
+    )
+    count_time = timeit.timeit(
+        lambda: application_properties.number_of_properties, number=REPEAT_COUNT
+    )
+    print(f"loading {ENTRY_COUNT} INI entries: {load_time:.3f}s")
+    print(f"memory held after loading: {allocated_size / 1024:8.1f}KiB")
+    print(
+        f"property_names {names_time / REPEAT_COUNT * 1e3:6.2f}ms, "
+        + f"number_of_properties {count_time / REPEAT_COUNT * 1e6:6.2f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark comparing getting a property with a lambda as its `valid_value_fn`
+against getting it with the equivalent declarative validator.
+
+Run with `python -m benchmarks.benchmark_validators` from the project root.
+"""
+
+import re
+import timeit
+from typing import Any, Callable
+
+from application_properties import (
+    ApplicationProperties,
+    ChoicesValidator,
+    LengthValidator,
+    PredicateValidator,
+    RangeValidator,
+    RegexValidator,
+)
+
+REPEAT_COUNT = 100_000
+TRIAL_COUNT = 5
+NAME_PATTERN = re.compile("[a-z]+(\\.[a-z]+)*")
+
+
+def check_range(value: int) -> None:
+    """
+    Lambda-style check equivalent to `RangeValidator(1, 100)`.
+    """
+    if not 1 <= value <= 100:
+        raise ValueError("Value is out of range.")
+
+
+def check_choices(value: str) -> None:
+    """
+    Lambda-style check equivalent to `ChoicesValidator(("debug", "info", "warning"))`.
+    """
+    if value not in ("debug", "info", "warning"):
+        raise ValueError("Value is not a valid choice.")
+
+
+def check_pattern(value: str) -> None:
+    """
+    Lambda-style check equivalent to `RegexValidator("[a-z]+(\\.[a-z]+)*")`.
+    """
+    if not NAME_PATTERN.fullmatch(value):
+        raise ValueError("Value does not match.")
+
+
+def check_module_name(value: str) -> None:
+    """
+    Lambda-style check equivalent to `MODULE_NAME_VALIDATOR`.
+    """
+    check_pattern(value)
+    if len(value) > 64:
+        raise ValueError("Value is too long.")
+    if any(next_part in RESERVED_NAMES for next_part in value.split(".")):
+        raise ValueError("Value uses a reserved name.")
+
+
+RESERVED_NAMES = frozenset(("and", "class", "def", "import", "return"))
+MODULE_NAME_VALIDATOR = (
+    RegexValidator("[a-z]+(\\.[a-z]+)*")
+    & LengthValidator(maximum=64)
+    & PredicateValidator(
+        lambda value: not any(
+            next_part in RESERVED_NAMES for next_part in value.split(".")
+        ),
+        "free of reserved names",
+    )
+)
+
+
+def main() -> None:
+    """
+    Compare a callable and a declarative validator for a few common checks.
+    """
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "level": 50,
+            "log": "info",
+            "name": "some.module.name",
+            "bad_level": 500,
+            "bad_log": "verbose",
+            "bad_name": "Some.Module.Name",
+        }
+    )
+
+    def time_get(
+        property_name: str, property_type: type, valid_value_fn: Callable[[Any], Any]
+    ) -> float:
+        return min(
+            timeit.repeat(
+                lambda: application_properties.get_property(
+                    property_name, property_type, valid_value_fn=valid_value_fn
+                ),
+                number=REPEAT_COUNT,
+                repeat=TRIAL_COUNT,
+            )
+        )
+
+    for property_name, property_type, callable_fn, validator in [
+        ("level", int, check_range, RangeValidator(1, 100)),
+        ("log", str, check_choices, ChoicesValidator(("debug", "info", "warning"))),
+        ("name", str, check_pattern, RegexValidator("[a-z]+(\\.[a-z]+)*")),
+        ("bad_level", int, check_range, RangeValidator(1, 100)),
+        ("bad_log", str, check_choices, ChoicesValidator(("debug", "info", "warning"))),
+        ("bad_name", str, check_pattern, RegexValidator("[a-z]+(\\.[a-z]+)*")),
+        ("name", str, check_module_name, MODULE_NAME_VALIDATOR),
+    ]:
+        callable_time = time_get(property_name, property_type, callable_fn)
+        validator_time = time_get(property_name, property_type, validator)
+        print(
+            f"{property_name:<9} {type(validator).__name__:<17} callable {callable_time:.3f}s, "
+            + f"validator {validator_time:.3f}s, "
+            + f"speedup {callable_time / validator_time:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark comparing copying the properties into a dictionary by hand against
+handing out a read-only view of them.
+
+Run with `python -m benchmarks.benchmark_view [size ...]` from the project root.
+"""
+
+import sys
+import timeit
+from typing import Any, Dict, List, Mapping
+
+from application_properties import ApplicationProperties
+
+DEFAULT_SIZES = [10_000, 100_000]
+REPEAT_COUNT = 5
+LOOKUP_COUNT = 1_000
+
+
+def build_properties(property_count: int) -> ApplicationProperties:
+    """
+    Build properties with `property_count` keys.
+    """
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "values": {
+                f"value{value_index}": value_index
+                for value_index in range(property_count)
+            }
+        }
+    )
+    return application_properties
+
+
+def look_up_values(property_values: Mapping[str, Any]) -> int:
+    """
+    Look up some of the values, as third-party code handed the mapping would.
+    """
+    return sum(
+        property_values[f"values.value{value_index}"]
+        for value_index in range(LOOKUP_COUNT)
+    )
+
+
+def main(property_sizes: List[int]) -> None:
+    """
+    Time handing the properties to a function that looks up some of them.
+    """
+    for property_count in property_sizes:
+        application_properties = build_properties(property_count)
+
+        def copy_by_hand(
+            properties: ApplicationProperties = application_properties,
+        ) -> None:
+            copied_values: Dict[str, Any] = {
+                next_name: properties.get_property(next_name, object)
+                for next_name in properties.property_names
+            }
+            look_up_values(copied_values)
+
+        def use_view(
+            properties: ApplicationProperties = application_properties,
+        ) -> None:
+            look_up_values(properties.view())
+
+        copy_time = min(timeit.repeat(copy_by_hand, number=1, repeat=REPEAT_COUNT))
+        view_time = min(timeit.repeat(use_view, number=1, repeat=REPEAT_COUNT))
+        print(
+            f"{property_count:>9} keys: copy {copy_time * 1000:.3f}ms, "
+            + f"view {view_time * 1000:.3f}ms, speedup {copy_time / view_time:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(next_size) for next_size in sys.argv[1:]] or DEFAULT_SIZES)
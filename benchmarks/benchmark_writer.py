@@ -0,0 +1,125 @@
+"""
+Benchmark comparing writing properties out by first building a nested dictionary
+and dumping it against streaming them out with `ApplicationPropertiesWriter`,
+both in time and in peak memory.
+
+Run with `python -m benchmarks.benchmark_writer [size ...]` from the project root.
+"""
+
+import functools
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from application_properties import ApplicationProperties, ApplicationPropertiesWriter
+
+DEFAULT_SIZES = [10_000, 100_000]
+REPEAT_COUNT = 3
+PLUGIN_SIZE = 10
+
+
+def build_properties(property_count: int) -> ApplicationProperties:
+    """
+    Build properties with `property_count` keys, grouped into small plugins.
+    """
+    config_map: Dict[str, Any] = {"plugins": {}}
+    for plugin_index in range(property_count // PLUGIN_SIZE):
+        config_map["plugins"][f"md{plugin_index:07}"] = {
+            f"value{value_index}": f"text{value_index}"
+            for value_index in range(PLUGIN_SIZE)
+        }
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    return application_properties
+
+
+def dump_nested_dictionary(properties: ApplicationProperties, output: Any) -> None:
+    """
+    Write the properties by building a nested dictionary and dumping it.
+    """
+    config_map: Dict[str, Any] = {}
+    for next_name in sorted(properties.property_names_view):
+        *parent_parts, last_part = next_name.split(".")
+        parent_value = config_map
+        for next_part in parent_parts:
+            parent_value = parent_value.setdefault(next_part, {})
+        parent_value[last_part] = properties.get_property(next_name, object)
+    json.dump(config_map, output, indent=2)
+
+
+def stream_properties(properties: ApplicationProperties, output: Any) -> None:
+    """
+    Write the properties by streaming them out.
+    """
+    ApplicationPropertiesWriter.write_json(properties, output)
+
+
+def measure_peak(write_function: Callable[[], None]) -> int:
+    """
+    Measure the peak memory allocated while writing.  The output is discarded,
+    so that only the memory needed to produce it is counted.
+    """
+    tracemalloc.start()
+    try:
+        write_function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_size(property_count: int, null_output: Any) -> None:
+    """
+    Time and measure writing the properties out at one size.
+    """
+    application_properties = build_properties(property_count)
+
+    def dump_once(
+        properties: ApplicationProperties = application_properties,
+    ) -> None:
+        dump_nested_dictionary(properties, null_output)
+
+    def stream_once(
+        properties: ApplicationProperties = application_properties,
+    ) -> None:
+        stream_properties(properties, null_output)
+
+    dump_time = min(timeit.repeat(dump_once, number=1, repeat=REPEAT_COUNT))
+    stream_time = min(timeit.repeat(stream_once, number=1, repeat=REPEAT_COUNT))
+    print(
+        f"{property_count:>9} keys: dump {property_count / dump_time:,.0f} keys/s "
+        + f"peak {measure_peak(dump_once) / 1024:,.0f}KiB, "
+        + f"stream {property_count / stream_time:,.0f} keys/s "
+        + f"peak {measure_peak(stream_once) / 1024:,.0f}KiB"
+    )
+    for write_name in ("write_yaml", "write_toml"):
+        write_time = min(
+            timeit.repeat(
+                functools.partial(
+                    getattr(ApplicationPropertiesWriter, write_name),
+                    application_properties,
+                    null_output,
+                ),
+                number=1,
+                repeat=REPEAT_COUNT,
+            )
+        )
+        print(
+            f"{property_count:>9} keys: {write_name} "
+            + f"{property_count / write_time:,.0f} keys/s"
+        )
+
+
+def main(property_sizes: List[int]) -> None:
+    """
+    Time and measure writing the properties out at each size.
+    """
+    with open(os.devnull, "wt", encoding="utf-8") as null_output:
+        for property_count in property_sizes:
+            measure_size(property_count, null_output)
+
+
+if __name__ == "__main__":
+    main([int(next_size) for next_size in sys.argv[1:]] or DEFAULT_SIZES)
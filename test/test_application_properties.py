@@ -439,3 +439,171 @@ def test_properties_get_generic_with_strict_mode_and_bad_validity() -> None:
         str(raised_exception)
         == "The value for property 'property' is not valid: Value '3' is not '1' or '2'"
     ), "Expected message was not present in exception."
+
+
+def test_properties_number_of_properties_excludes_untyped_copies() -> None:
+    """
+    Test that manually set untyped properties are only counted once.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"feature": {"enabled": True}})
+
+    # Act
+    application_properties.set_manual_property(["feature.other=1", "feature.more=$#2"])
+    actual_property_count = application_properties.number_of_properties
+    found_names = application_properties.property_names
+
+    # Assert
+    assert actual_property_count == 3
+    assert found_names == ["feature.enabled", "feature.other", "feature.more"]
+
+
+def test_properties_property_names_view_reflects_changes() -> None:
+    """
+    Test that the view of the property names follows later changes to the map.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"feature": {"enabled": True}})
+    names_view = application_properties.property_names_view
+
+    # Act
+    names_before = list(names_view)
+    application_properties.set_manual_property("other.enabled=$!true")
+    names_after = list(names_view)
+    application_properties.clear()
+
+    # Assert
+    assert names_before == ["feature.enabled"]
+    assert names_after == ["feature.enabled", "other.enabled"]
+    assert "feature.enabled" not in names_view
+    assert not names_view
+
+
+def test_properties_property_names_view_follows_replaced_storage() -> None:
+    """
+    Test that the view of the property names follows the map after its storage
+    is replaced by a read session, a clear, or a publish.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"a": 1})
+    names_view = application_properties.property_names_view
+    read_session = application_properties.read_session()
+    session_view = read_session.property_names_view
+
+    # Act
+    application_properties.set_property("b", 2)
+    names_after_set = sorted(names_view)
+    application_properties.read_session()
+    application_properties.clear()
+    names_after_clear = list(names_view)
+    staged_properties = application_properties.create_staging()
+    staged_properties.load_from_dict({"c": 3})
+    application_properties.publish(staged_properties)
+    names_after_publish = list(names_view)
+
+    # Assert
+    assert names_after_set == ["a", "b"]
+    assert not names_after_clear
+    assert names_after_publish == ["c"]
+    assert "c" in names_view
+    assert list(session_view) == ["a"]
+
+
+def test_get_properties_under_respects_segment_boundaries() -> None:
+    """
+    Test calling the `property_names_under` function with a key that is a string
+    prefix of other keys, but not a whole segment of them.
+    """
+
+    # Arrange
+    config_map: Dict[str, Dict[str, Any]] = {
+        "plugins": {"md0": {"enabled": True}, "md001": {"enabled": False}}
+    }
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+
+    # Act
+    found_names = application_properties.property_names_under("plugins.md0")
+    found_count = application_properties.number_of_properties_under("Plugins")
+
+    # Assert
+    assert found_names == ["plugins.md0.enabled"]
+    assert found_count == 2
+
+
+def test_properties_load_from_dict_copies_mutable_values() -> None:
+    """
+    Test that loading from a dictionary copies mutable values, so later changes
+    to the dictionary do not affect the properties.
+    """
+
+    # Arrange
+    list_value = ["one", "two"]
+    config_map = {"feature": {"values": list_value}}
+    application_properties = ApplicationProperties()
+
+    # Act
+    application_properties.load_from_dict(config_map)
+    list_value.append("three")
+
+    # Assert
+    assert application_properties.get_property("feature.values", list) == [
+        "one",
+        "two",
+    ]
+
+
+def test_properties_load_from_dict_with_take_ownership() -> None:
+    """
+    Test that loading from a dictionary with `take_ownership` stores the values
+    that were handed over without copying them.
+    """
+
+    # Arrange
+    list_value = ["one", "two"]
+    config_map = {"feature": {"values": list_value, "name": "abc"}}
+    application_properties = ApplicationProperties()
+
+    # Act
+    application_properties.load_from_dict(config_map, take_ownership=True)
+
+    # Assert
+    assert application_properties.get_property("feature.values", list) is list_value
+    assert application_properties.get_string_property("feature.name") == "abc"
+
+
+def test_properties_change_count_follows_changes() -> None:
+    """
+    Test that the change count goes up with each change to the properties, and
+    not when the properties are only read.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    change_counts = [application_properties.change_count]
+
+    # Act
+    application_properties.load_from_dict({"property": 1})
+    change_counts.append(application_properties.change_count)
+    application_properties.get_integer_property("property")
+    change_counts.append(application_properties.change_count)
+    application_properties.set_manual_properties(["other=1"])
+    change_counts.append(application_properties.change_count)
+    application_properties.clear()
+    change_counts.append(application_properties.change_count)
+    application_properties.publish(application_properties.create_staging())
+    change_counts.append(application_properties.change_count)
+
+    # Assert
+    assert change_counts[0] == 0
+    assert change_counts[1] > change_counts[0]
+    assert change_counts[2] == change_counts[1]
+    assert change_counts[3] > change_counts[2]
+    assert change_counts[4] > change_counts[3]
+    assert change_counts[5] > change_counts[4]
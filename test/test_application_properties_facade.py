@@ -272,3 +272,160 @@ def test_properties_facade_get_properties_under_at_sub_level() -> None:
     # Assert
     assert len(found_names) == len(config_map["upper"]["new_top_level"]["feature"])
     assert "new_top_level.feature.enabled" in found_names
+
+
+def test_properties_facade_prefix_not_valid_key() -> None:
+    """
+    Test setting up a facade with a prefix that is not a valid property key.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    raised_exception = None
+    try:
+        ApplicationPropertiesFacade(application_properties, "upper..")
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "Property prefix must not start or end with the '.' character."
+    ), "Expected message was not present in exception."
+
+
+def test_properties_facade_get_property_names_respects_segment_boundaries() -> None:
+    """
+    Test fetching through a configuration facade the property names where another
+    top level key starts with the same characters as the facade's prefix.
+    """
+
+    # Arrange
+    config_map = {"upper": {"property": "2"}, "uppers": {"property": "3"}}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    facade = ApplicationPropertiesFacade(application_properties, "upper.")
+
+    # Act
+    actual_value = facade.property_names
+
+    # Assert
+    assert actual_value == ["property"]
+
+
+def test_properties_facade_get_property_names_after_change() -> None:
+    """
+    Test that the remembered property names of a facade follow changes to the
+    base properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"upper": {"property": "2"}})
+    facade = ApplicationPropertiesFacade(application_properties, "upper.")
+    first_names = facade.property_names
+    first_names.append("not_there")
+
+    # Act
+    second_names = facade.property_names
+    application_properties.set_manual_property("upper.other=3")
+    third_names = facade.property_names
+    application_properties.clear()
+    fourth_names = facade.property_names
+
+    # Assert
+    assert second_names == ["property"]
+    assert third_names == ["property", "other"]
+    assert not fourth_names
+
+
+def test_properties_facade_get_property_names_after_publish() -> None:
+    """
+    Test that the remembered property names of a facade follow newly published
+    base properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"upper": {"property": "2"}})
+    facade = ApplicationPropertiesFacade(application_properties, "upper.")
+    assert facade.property_names == ["property"]
+    staged_properties = application_properties.create_staging()
+    staged_properties.load_from_dict({"upper": {"other": "3"}})
+
+    # Act
+    application_properties.publish(staged_properties)
+
+    # Assert
+    assert facade.property_names == ["other"]
+
+
+def test_properties_facade_sub_facade() -> None:
+    """
+    Test creating a facade relative to another facade.
+    """
+
+    # Arrange
+    config_map = {"plugins": {"first": {"level": 1}, "second": {"level": 2}}}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.")
+
+    # Act
+    sub_facade = facade.sub_facade("second.")
+
+    # Assert
+    assert sub_facade.property_prefix == "plugins.second."
+    assert sub_facade.property_names == ["level"]
+    assert sub_facade.get_integer_property("level") == 2
+
+
+def test_properties_facade_sub_facade_prefix_not_terminated_with_separator() -> None:
+    """
+    Test creating a facade relative to another facade with a prefix that is not
+    terminated with the separator.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.")
+
+    # Act
+    raised_exception = None
+    try:
+        facade.sub_facade("second")
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The property_prefix argument must end with the separator character '.'."
+    ), "Expected message was not present in exception."
+
+
+def test_properties_facade_compile_accessor() -> None:
+    """
+    Test compiling an accessor through a facade and using it after the property changes.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"upper": {"property": 1}})
+    facade = ApplicationPropertiesFacade(application_properties, "upper.")
+    accessor = facade.compile_accessor("property", int, -1)
+
+    # Act
+    first_value = accessor.get()
+    application_properties.set_manual_property("upper.property=$#2")
+    second_value = accessor.get()
+
+    # Assert
+    assert accessor.property_name == "upper.property"
+    assert (first_value, second_value) == (1, 2)
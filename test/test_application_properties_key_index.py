@@ -0,0 +1,227 @@
+"""
+Tests for the ApplicationPropertiesKeyIndex class
+"""
+
+from application_properties.application_properties_key_index import (
+    ApplicationPropertiesKeyIndex,
+)
+
+
+def test_key_index_split_key_simple() -> None:
+    """
+    Test splitting a key without any quoted segments.
+    """
+
+    # Arrange
+    key_to_split = "plugins.md001.enabled"
+
+    # Act
+    split_key = ApplicationPropertiesKeyIndex.split_key(key_to_split)
+
+    # Assert
+    assert split_key == ["plugins", "md001", "enabled"]
+
+
+def test_key_index_split_key_with_quoted_segment() -> None:
+    """
+    Test splitting a key with a quoted segment that contains the separator.
+    """
+
+    # Arrange
+    key_to_split = "tool.'my.plugin'.enabled"
+
+    # Act
+    split_key = ApplicationPropertiesKeyIndex.split_key(key_to_split)
+
+    # Assert
+    assert split_key == ["tool", "'my.plugin'", "enabled"]
+
+
+def test_key_index_split_key_with_apostrophes() -> None:
+    """
+    Test that an apostrophe within a key part does not start a quoted segment.
+    """
+
+    # Arrange
+    keys_to_split = [
+        "plugins.it's.enabled",
+        "don't.'my.plugin'.it's",
+        "plugins.'unclosed.enabled",
+    ]
+
+    # Act
+    split_keys = [
+        ApplicationPropertiesKeyIndex.split_key(next_key) for next_key in keys_to_split
+    ]
+
+    # Assert
+    assert split_keys == [
+        ["plugins", "it's", "enabled"],
+        ["don't", "'my.plugin'", "it's"],
+        ["plugins", "'unclosed", "enabled"],
+    ]
+
+
+def test_key_index_names_and_counts_under_prefix() -> None:
+    """
+    Test that names and counts under a prefix respect the segment boundaries.
+    """
+
+    # Arrange
+    key_index = ApplicationPropertiesKeyIndex()
+    for next_key in [
+        "plugins.md001.enabled",
+        "plugins.md001.level",
+        "plugins.md002.enabled",
+        "plugins.md0.enabled",
+        "other",
+    ]:
+        key_index.add(next_key)
+
+    # Act
+    names_under = key_index.names_under("plugins.md0")
+    count_under = key_index.count_under("plugins")
+    missing_count = key_index.count_under("plugins.md003")
+
+    # Assert
+    assert names_under == ["plugins.md0.enabled"]
+    assert count_under == 4
+    assert missing_count == 0
+    assert len(key_index) == 5
+
+
+def test_key_index_add_twice_counts_once() -> None:
+    """
+    Test that adding the same key twice only counts it once.
+    """
+
+    # Arrange
+    key_index = ApplicationPropertiesKeyIndex()
+
+    # Act
+    key_index.add("feature.enabled")
+    key_index.add("feature.enabled")
+
+    # Assert
+    assert len(key_index) == 1
+    assert key_index.names_under("feature") == ["feature.enabled"]
+
+
+def test_key_index_clear() -> None:
+    """
+    Test that clearing the index removes every key.
+    """
+
+    # Arrange
+    key_index = ApplicationPropertiesKeyIndex()
+    key_index.add("feature.enabled")
+
+    # Act
+    key_index.clear()
+
+    # Assert
+    assert len(key_index) == 0
+    assert not key_index.names_under("feature")
+
+
+def test_key_index_remove_prunes_empty_nodes() -> None:
+    """
+    Test that removing a key updates the counts and prunes nodes left without keys.
+    """
+
+    # Arrange
+    key_index = ApplicationPropertiesKeyIndex()
+    key_index.add("feature.enabled")
+    key_index.add("feature.other.level")
+
+    # Act
+    was_removed = key_index.remove("feature.other.level")
+    was_removed_again = key_index.remove("feature.other.level")
+    was_prefix_removed = key_index.remove("feature")
+
+    # Assert
+    assert was_removed
+    assert not was_removed_again
+    assert not was_prefix_removed
+    assert len(key_index) == 1
+    assert key_index.find_node("feature.other") is None
+    assert key_index.count_under("feature") == 1
+
+
+def test_key_index_remove_under() -> None:
+    """
+    Test removing every key at or under a prefix.
+    """
+
+    # Arrange
+    key_index = ApplicationPropertiesKeyIndex()
+    key_index.add("feature")
+    key_index.add("feature.enabled")
+    key_index.add("feature.other.level")
+    key_index.add("features.enabled")
+
+    # Act
+    removed_names = key_index.remove_under("feature")
+
+    # Assert
+    assert removed_names == ["feature", "feature.enabled", "feature.other.level"]
+    assert len(key_index) == 1
+    assert key_index.find_node("feature") is None
+    assert key_index.names_under("features") == ["features.enabled"]
+    assert not key_index.remove_under("feature")
+
+
+def test_key_index_digest_does_not_depend_on_order() -> None:
+    """
+    Test that the digest of an index only depends on the keys and digests in it.
+    """
+
+    # Arrange
+    first_index = ApplicationPropertiesKeyIndex()
+    second_index = ApplicationPropertiesKeyIndex()
+    property_digests = {"feature.enabled": 1, "feature.level": 2, "other": 4}
+
+    # Act
+    for property_key, property_digest in property_digests.items():
+        first_index.add(property_key, property_digest)
+    for property_key, property_digest in reversed(property_digests.items()):
+        second_index.add(property_key, property_digest)
+
+    # Assert
+    assert first_index.digest_under() == 7
+    assert second_index.digest_under() == 7
+    assert first_index.digest_under("feature") == 3
+    assert first_index.digest_under("missing") == 0
+    assert not first_index.names_differing_under(second_index, None)
+
+
+def test_key_index_digest_follows_changes() -> None:
+    """
+    Test that changing and removing keys keeps the digests of each node up to date.
+    """
+
+    # Arrange
+    key_index = ApplicationPropertiesKeyIndex()
+    key_index.add("feature.enabled", 1)
+    key_index.add("feature.other.level", 2)
+    key_index.add("features.enabled", 4)
+    original_index = key_index.copy()
+
+    # Act
+    key_index.add("feature.enabled", 8)
+    key_index.add("feature.enabled")
+    key_index.remove("features.enabled")
+
+    # Assert
+    assert key_index.digest_under() == 10
+    assert key_index.digest_under("feature") == 10
+    assert original_index.digest_under() == 7
+    assert key_index.names_differing_under(original_index, None) == [
+        "feature.enabled",
+        "features.enabled",
+    ]
+    assert key_index.names_differing_under(original_index, "feature") == [
+        "feature.enabled"
+    ]
+    key_index.remove_under("feature.other")
+    assert key_index.digest_under("feature") == 8
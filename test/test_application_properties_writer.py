@@ -0,0 +1,284 @@
+"""
+Tests for the ApplicationPropertiesWriter class
+"""
+
+import io
+import os
+from test.pytest_helpers import ErrorResults, TestHelpers
+from typing import Any, Callable, Dict, Optional, TextIO, Tuple
+
+import pytest
+
+from application_properties import (
+    ApplicationProperties,
+    ApplicationPropertiesConfigLoader,
+    ApplicationPropertiesJsonLoader,
+    ApplicationPropertiesTomlLoader,
+    ApplicationPropertiesWriter,
+    ApplicationPropertiesYamlLoader,
+)
+
+SAMPLE_PROPERTIES: Dict[str, Any] = {
+    "plugins": {
+        "md001": {"enabled": True, "level": 2, "ratio": 0.5, "names": ["a", "b"]},
+        "md002": {"enabled": False, "style": 'a "quoted"\nvalue\u0001 %s  '},
+        "file.md": {"large": 2.5e30, "small": 1e-07},
+        "it's": {"level": 3},
+    },
+    "log": {"level": "info"},
+}
+
+WriterFunction = Callable[[ApplicationProperties, TextIO, Optional[str]], None]
+LoaderFunction = Callable[..., Tuple[bool, bool]]
+
+
+def __write_and_load(
+    application_properties: ApplicationProperties,
+    write_function: WriterFunction,
+    load_function: LoaderFunction,
+    key_name: Optional[str] = None,
+) -> Tuple[ApplicationProperties, str, Optional[str]]:
+    output_stream = io.StringIO()
+    write_function(application_properties, output_stream, key_name)
+    configuration_file = None
+    try:
+        configuration_file = TestHelpers.write_temporary_configuration(
+            output_stream.getvalue()
+        )
+        loaded_properties = ApplicationProperties(allow_separator_in_keys=True)
+        results = ErrorResults()
+        load_function(
+            loaded_properties, configuration_file, handle_error_fn=results.keep_error
+        )
+        return loaded_properties, output_stream.getvalue(), results.reported_error
+    finally:
+        if configuration_file and os.path.exists(configuration_file):
+            os.remove(configuration_file)
+
+
+@pytest.mark.parametrize(
+    "write_function,load_function",
+    [
+        (
+            ApplicationPropertiesWriter.write_json,
+            ApplicationPropertiesJsonLoader.load_and_set,
+        ),
+        (
+            ApplicationPropertiesWriter.write_yaml,
+            ApplicationPropertiesYamlLoader.load_and_set,
+        ),
+        (
+            ApplicationPropertiesWriter.write_toml,
+            ApplicationPropertiesTomlLoader.load_and_set,
+        ),
+    ],
+)
+def test_writer_round_trips(
+    write_function: WriterFunction, load_function: LoaderFunction
+) -> None:
+    """
+    Test that the written properties load back into the same properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(allow_separator_in_keys=True)
+    application_properties.load_from_dict(SAMPLE_PROPERTIES, allow_periods_in_keys=True)
+
+    # Act
+    loaded_properties, _, reported_error = __write_and_load(
+        application_properties, write_function, load_function
+    )
+
+    # Assert
+    assert reported_error is None
+    assert loaded_properties.get_section() == SAMPLE_PROPERTIES
+    assert not application_properties.diff(loaded_properties)
+
+
+@pytest.mark.parametrize(
+    "write_function,load_function",
+    [
+        (
+            ApplicationPropertiesWriter.write_json,
+            ApplicationPropertiesJsonLoader.load_and_set,
+        ),
+        (
+            ApplicationPropertiesWriter.write_yaml,
+            ApplicationPropertiesYamlLoader.load_and_set,
+        ),
+        (
+            ApplicationPropertiesWriter.write_toml,
+            ApplicationPropertiesTomlLoader.load_and_set,
+        ),
+    ],
+)
+def test_writer_round_trips_under_key(
+    write_function: WriterFunction, load_function: LoaderFunction
+) -> None:
+    """
+    Test that the written properties under a key load back as that section.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(allow_separator_in_keys=True)
+    application_properties.load_from_dict(SAMPLE_PROPERTIES, allow_periods_in_keys=True)
+
+    # Act
+    loaded_properties, _, reported_error = __write_and_load(
+        application_properties, write_function, load_function, "plugins.md001"
+    )
+
+    # Assert
+    assert reported_error is None
+    assert loaded_properties.get_section() == SAMPLE_PROPERTIES["plugins"]["md001"]
+
+
+def test_writer_json_format() -> None:
+    """
+    Test the layout of the JSON that is written, including no properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"b": {"z": 1, "a": {"x": 2}}, "a": "3"})
+    empty_properties = ApplicationProperties()
+    output_stream = io.StringIO()
+    empty_stream = io.StringIO()
+
+    # Act
+    ApplicationPropertiesWriter.write_json(application_properties, output_stream)
+    ApplicationPropertiesWriter.write_json(empty_properties, empty_stream)
+
+    # Assert
+    assert output_stream.getvalue() == (
+        '{\n  "a": "3",\n  "b": {\n    "a": {\n      "x": 2\n    },\n    "z": 1\n  }\n}\n'
+    )
+    assert empty_stream.getvalue() == "{}\n"
+
+
+def test_writer_yaml_format() -> None:
+    """
+    Test the layout of the YAML that is written, including special floats.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"b": {"z": 1e-07, "a": {"x": float("-inf")}}, "a": None}
+    )
+    output_stream = io.StringIO()
+
+    # Act
+    ApplicationPropertiesWriter.write_yaml(application_properties, output_stream)
+
+    # Assert
+    assert output_stream.getvalue() == (
+        '"a": null\n"b":\n  "a":\n    "x": -.inf\n  "z": 1.0e-07\n'
+    )
+
+
+def test_writer_toml_with_none_value() -> None:
+    """
+    Test that a value that TOML cannot hold is reported.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"tool": {"missing": None}})
+
+    # Act
+    raised_exception = None
+    try:
+        ApplicationPropertiesWriter.write_toml(application_properties, io.StringIO())
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The value for property 'tool.missing' cannot be written as TOML."
+    ), "Expected message was not present in exception."
+
+
+def test_writer_ini_round_trips() -> None:
+    """
+    Test that the written ini-type properties load back with the same types.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_manual_properties(
+        [
+            "plugins.md001.enabled=$!true",
+            "plugins.md001.level=$#2",
+            "plugins.md002.style=%percent",
+            "plugins.md002.blank=$$",
+            "plugins.md002.typed=$$$dollar",
+            "plugins.md002.leading=$$  space",
+            "log.level=info",
+        ]
+    )
+
+    # Act
+    loaded_properties, written_text, reported_error = __write_and_load(
+        application_properties,
+        ApplicationPropertiesWriter.write_ini,
+        ApplicationPropertiesConfigLoader.load_and_set,
+    )
+
+    # Assert
+    assert reported_error is None
+    assert written_text.startswith("[log]\nlevel = info\n\n[plugins]\n")
+    assert loaded_properties.get_section() == application_properties.get_section()
+
+
+def test_writer_ini_without_section() -> None:
+    """
+    Test that a property that cannot be an ini section and item is reported.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_property("level", 1)
+
+    # Act
+    raised_exception = None
+    try:
+        ApplicationPropertiesWriter.write_ini(application_properties, io.StringIO())
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The name of property 'level' cannot be written as an ini section and item."
+    ), "Expected message was not present in exception."
+
+
+def test_writer_ini_with_multiline_value() -> None:
+    """
+    Test that a string value that an ini-type file cannot hold is reported.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_property("log.format", "one\ntwo")
+
+    # Act
+    raised_exception = None
+    try:
+        ApplicationPropertiesWriter.write_ini(application_properties, io.StringIO())
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The value for property 'log.format' cannot be written as an ini value."
+    ), "Expected message was not present in exception."
@@ -0,0 +1,197 @@
+"""
+Tests for publishing new generations of properties to an ApplicationProperties instance
+"""
+
+from typing import List, Optional
+
+import pytest
+
+from application_properties import ApplicationProperties, MultisourceConfigurationLoader
+
+
+def test_publish_replaces_all_properties() -> None:
+    """
+    Test that publishing staged properties replaces every property at once.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(strict_mode=True)
+    application_properties.load_from_dict({"old": {"value": 1}})
+    staged_properties = application_properties.create_staging()
+    staged_properties.load_from_dict({"new": {"value": 2}})
+
+    # Act
+    application_properties.publish(staged_properties)
+
+    # Assert
+    assert staged_properties.strict_mode
+    assert staged_properties.is_frozen
+    assert not application_properties.is_frozen
+    assert application_properties.generation == 1
+    assert application_properties.property_names == ["new.value"]
+    assert application_properties.property_names_under("new") == ["new.value"]
+    assert application_properties.get_integer_property("old.value") is None
+    assert application_properties.get_integer_property("new.value") == 2
+
+
+def test_publish_to_self() -> None:
+    """
+    Test that publishing properties to themselves is not allowed.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.publish(application_properties)
+
+    # Assert
+    assert (
+        str(raised_exception.value) == "Properties cannot be published to themselves."
+    )
+
+
+def test_read_session_keeps_its_generation() -> None:
+    """
+    Test that a read session keeps seeing the generation that was current when
+    it was created, even after a new generation is published.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"value": 1})
+    read_session = application_properties.read_session()
+    staged_properties = application_properties.create_staging()
+    staged_properties.load_from_dict({"value": 2})
+
+    # Act
+    application_properties.publish(staged_properties)
+
+    # Assert
+    assert read_session.is_frozen
+    assert read_session.generation == 0
+    assert read_session.get_integer_property("value") == 1
+    assert application_properties.generation == 1
+    assert application_properties.get_integer_property("value") == 2
+
+
+def test_read_session_keeps_its_properties_after_live_changes() -> None:
+    """
+    Test that a read session does not see properties set on, or removed from,
+    the live instance after it was created.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"value": 1, "other": "text"})
+    read_session = application_properties.read_session()
+
+    # Act
+    application_properties.set_property("value", 2)
+    application_properties.remove_property("other")
+
+    # Assert
+    assert read_session.get_integer_property("value") == 1
+    assert read_session.get_string_property("other") == "text"
+    assert sorted(read_session.property_names) == ["other", "value"]
+    assert application_properties.get_integer_property("value") == 2
+    assert application_properties.property_names == ["value"]
+
+
+def test_read_session_keeps_its_properties_after_live_clear() -> None:
+    """
+    Test that a read session keeps its properties after the live instance is
+    cleared or loaded again.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"value": 1})
+    first_session = application_properties.read_session()
+    application_properties.clear()
+    application_properties.set_property("value", 2)
+    second_session = application_properties.read_session()
+
+    # Act
+    application_properties.load_from_dict({"value": 3})
+
+    # Assert
+    assert first_session.property_names == ["value"]
+    assert first_session.get_integer_property("value") == 1
+    assert second_session.get_integer_property("value") == 2
+    assert application_properties.get_integer_property("value") == 3
+    assert application_properties.generation == 0
+
+
+def test_published_properties_are_not_changed_by_live_changes() -> None:
+    """
+    Test that changing the live instance after a publish does not change the
+    frozen staged instance that now shares its storage.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    staged_properties = application_properties.create_staging()
+    staged_properties.load_from_dict({"a": 1})
+    application_properties.publish(staged_properties)
+
+    # Act
+    application_properties.set_property("b", 3)
+    application_properties.set_manual_properties(["a=$#2"])
+
+    # Assert
+    assert staged_properties.property_names == ["a"]
+    assert staged_properties.get_integer_property("a") == 1
+    assert staged_properties.get_integer_property("b") is None
+    assert application_properties.property_names == ["a", "b"]
+    assert application_properties.get_integer_property("a") == 2
+    assert application_properties.generation == 1
+
+
+def test_multisource_reload_publishes_on_success() -> None:
+    """
+    Test that a successful reload publishes the newly loaded configuration.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"value": 1, "other": 1})
+    loader = MultisourceConfigurationLoader().add_manually_set_properties(["value=$#2"])
+
+    # Act
+    did_error = loader.reload(application_properties)
+
+    # Assert
+    assert not did_error
+    assert application_properties.generation == 1
+    assert application_properties.property_names == ["value"]
+    assert application_properties.get_integer_property("value") == 2
+
+
+def test_multisource_reload_keeps_current_configuration_on_error() -> None:
+    """
+    Test that a failed reload leaves the current configuration untouched.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"value": 1})
+    loader = (
+        MultisourceConfigurationLoader()
+        .add_manually_set_properties(["value=$#2"])
+        .add_manually_set_properties(["not valid"])
+    )
+    captured_errors: List[str] = []
+
+    def capture_error(formatted_error: str, _: Optional[Exception]) -> None:
+        captured_errors.append(formatted_error)
+
+    # Act
+    did_error = loader.reload(application_properties, capture_error)
+
+    # Assert
+    assert did_error
+    assert len(captured_errors) == 1
+    assert application_properties.generation == 0
+    assert application_properties.get_integer_property("value") == 1
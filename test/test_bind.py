@@ -0,0 +1,160 @@
+"""
+Tests for the bind function of the ApplicationProperties and
+ApplicationPropertiesFacade classes
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from application_properties import ApplicationProperties, ApplicationPropertiesFacade
+
+
+@dataclass(slots=True)
+class ServerSettings:
+    """
+    Sample settings class to bind to.
+    """
+
+    host: str
+    port: int = 8080
+    debug: Optional[bool] = None
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ApplicationSettings:
+    """
+    Sample settings class with a nested settings class to bind to.
+    """
+
+    name: str
+    server: ServerSettings
+
+
+def test_bind_with_found_and_default_values() -> None:
+    """
+    Test binding a subtree where some of the fields are present and some are not.
+    """
+
+    # Arrange
+    config_map = {"app": {"server": {"host": "localhost", "tags": ["a", "b"]}}}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+
+    # Act
+    bound_settings = application_properties.bind("App.Server", ServerSettings)
+
+    # Assert
+    assert bound_settings == ServerSettings("localhost", 8080, None, ["a", "b"])
+    assert not hasattr(bound_settings, "__dict__")
+
+
+def test_bind_with_nested_dataclass() -> None:
+    """
+    Test binding a subtree to a dataclass that contains another dataclass.
+    """
+
+    # Arrange
+    config_map = {
+        "app": {"name": "sample", "server": {"host": "localhost", "port": 1234}}
+    }
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+
+    # Act
+    bound_settings = application_properties.bind("app", ApplicationSettings)
+
+    # Assert
+    assert bound_settings == ApplicationSettings(
+        "sample", ServerSettings("localhost", 1234)
+    )
+
+
+def test_bind_reports_all_errors_with_full_keys() -> None:
+    """
+    Test binding a subtree with multiple problems, reporting all of them together.
+    """
+
+    # Arrange
+    config_map = {"app": {"server": {"port": "abc", "debug": 1}}}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.bind("app", ApplicationSettings)
+
+    # Assert
+    assert str(raised_exception.value) == (
+        "A value for property 'app.name' must be provided.\n"
+        + "A value for property 'app.server.host' must be provided.\n"
+        + "The value for property 'app.server.port' must be of type 'int'.\n"
+        + "The value for property 'app.server.debug' must be of type 'bool'."
+    )
+
+
+def test_bind_again_after_reload() -> None:
+    """
+    Test binding the same subtree again after new properties are published.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"server": {"host": "first"}})
+    first_settings = application_properties.bind("server", ServerSettings)
+    staged_properties = application_properties.create_staging()
+    staged_properties.load_from_dict({"server": {"host": "second", "port": 2}})
+    application_properties.publish(staged_properties)
+
+    # Act
+    second_settings = application_properties.bind("server", ServerSettings)
+
+    # Assert
+    assert first_settings.host == "first"
+    assert second_settings.host == "second"
+    assert second_settings.port == 2
+
+
+def test_bind_not_dataclass() -> None:
+    """
+    Test binding a subtree to a class that is not a dataclass.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.bind("server", int)
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "The bound_class argument must be a dataclass type."
+    )
+
+
+def test_facade_bind() -> None:
+    """
+    Test binding through a facade, both at and below the facade's prefix.
+    """
+
+    # Arrange
+    config_map = {
+        "plugins": {
+            "app": {"name": "sample", "server": {"host": "localhost", "port": 1}}
+        }
+    }
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.app.")
+
+    # Act
+    root_settings = facade.bind("", ApplicationSettings)
+    server_settings = facade.bind("server", ServerSettings)
+
+    # Assert
+    assert root_settings.name == "sample"
+    assert server_settings == ServerSettings("localhost", 1)
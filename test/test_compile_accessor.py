@@ -0,0 +1,199 @@
+"""
+Tests for the compile_accessor function of the ApplicationProperties class
+"""
+
+import pytest
+
+from application_properties import ApplicationProperties
+
+
+def test_compile_accessor_with_found_value() -> None:
+    """
+    Test fetching a configuration value that is present through a compiled accessor.
+    """
+
+    # Arrange
+    config_map = {"server": {"port": 1234}}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    expected_value = 1234
+
+    # Act
+    accessor = application_properties.compile_accessor("Server.Port", int, 8080)
+    actual_value = accessor.get()
+
+    # Assert
+    assert expected_value == actual_value
+    assert accessor.property_name == "server.port"
+    assert accessor.property_type == int
+
+
+def test_compile_accessor_with_not_found_value() -> None:
+    """
+    Test fetching a configuration value that is not present through a compiled accessor.
+    """
+
+    # Arrange
+    config_map = {"server": {"host": "localhost"}}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    expected_value = 8080
+
+    # Act
+    accessor = application_properties.compile_accessor("server.port", int, 8080)
+    actual_value = accessor.get()
+
+    # Assert
+    assert expected_value == actual_value
+
+
+def test_compile_accessor_reflects_later_changes() -> None:
+    """
+    Test that a compiled accessor reads the current value, not the value present
+    at the time of compilation.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    accessor = application_properties.compile_accessor("server.port", int, 8080)
+    value_before = accessor.get()
+
+    # Act
+    application_properties.set_manual_property("server.port=$#9090")
+    value_after = accessor.get()
+
+    # Assert
+    assert value_before == 8080
+    assert value_after == 9090
+
+
+def test_compile_accessor_with_found_value_but_wrong_type() -> None:
+    """
+    Test fetching a configuration value that is present but is not the right type.
+    """
+
+    # Arrange
+    config_map = {"property": True}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    accessor = application_properties.compile_accessor("property", int, -1)
+
+    # Act
+    actual_value = accessor.get()
+
+    # Assert
+    assert actual_value == -1
+
+
+def test_compile_accessor_with_found_value_but_wrong_type_and_strict() -> None:
+    """
+    Test fetching a configuration value that is present but is not the right type,
+    with strict mode enabled after the accessor was compiled.
+    """
+
+    # Arrange
+    config_map = {"property": True}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    accessor = application_properties.compile_accessor("property", int, -1)
+    application_properties.enable_strict_mode()
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        accessor.get()
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "The value for property 'property' must be of type 'int'."
+    )
+
+
+def test_compile_accessor_with_validator() -> None:
+    """
+    Test fetching a configuration value through an accessor with a validator.
+    """
+
+    # Arrange
+    config_map = {"low": 1, "high": 10}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+
+    def validate_small(value: int) -> None:
+        if value > 5:
+            raise ValueError("Value is too big.")
+
+    low_accessor = application_properties.compile_accessor(
+        "low", int, 3, valid_value_fn=validate_small
+    )
+    high_accessor = application_properties.compile_accessor(
+        "high", int, 3, valid_value_fn=validate_small
+    )
+
+    # Act
+    low_value = low_accessor.get()
+    high_value = high_accessor.get()
+
+    # Assert
+    assert low_value == 1
+    assert high_value == 3
+
+
+def test_compile_accessor_required_and_not_found() -> None:
+    """
+    Test fetching a required configuration value that is not present.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    accessor = application_properties.compile_accessor(
+        "property", str, is_required=True
+    )
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        accessor.get()
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "A value for property 'property' must be provided."
+    )
+
+
+def test_compile_accessor_bad_key_raises_at_compile_time() -> None:
+    """
+    Test that an invalid key is reported when the accessor is compiled.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.compile_accessor("bad..key", int)
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "Full property key cannot contain multiples of the . without any text between them."
+    )
+
+
+def test_compile_accessor_bad_default_raises_at_compile_time() -> None:
+    """
+    Test that a default value of the wrong type is reported when the accessor is compiled.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.compile_accessor("property", int, True)
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "The default value for property 'property' must either be None or a 'int' value."
+    )
@@ -0,0 +1,203 @@
+"""
+Tests for the provenance recorded by the ApplicationProperties class
+"""
+
+import os
+from test.pytest_helpers import TestHelpers
+from typing import List, Optional
+
+import pytest
+
+from application_properties import (
+    ApplicationProperties,
+    ApplicationPropertiesFacade,
+    ApplicationPropertiesJsonLoader,
+    MultisourceConfigurationLoader,
+    PropertyProvenance,
+    PropertySource,
+    PropertySourceKind,
+    PropertySpec,
+    RangeValidator,
+)
+
+
+def test_properties_explain_without_sources() -> None:
+    """
+    Test that properties set directly have no source and nothing overridden.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_property("log.level", "info")
+    application_properties.set_property("log.level", "debug")
+
+    # Act
+    explained_level = application_properties.explain("Log.Level")
+    explained_missing = application_properties.explain("missing")
+
+    # Assert
+    assert explained_level == [PropertyProvenance("debug", None)]
+    assert application_properties.property_source("log.level") is None
+    assert not explained_missing
+
+
+def test_properties_explain_lists_overridden_values() -> None:
+    """
+    Test that each layer that overrides a property keeps the values it overrode,
+    with the most recent first.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    json_source = PropertySource(PropertySourceKind.JSON, "base.json")
+    manual_source = PropertySource(PropertySourceKind.MANUAL)
+
+    # Act
+    with application_properties.recording_source(PropertySourceKind.JSON, "base.json"):
+        application_properties.load_from_dict({"log": {"level": "info", "size": 1}})
+        application_properties.set_property("log.level", "warning")
+    with application_properties.recording_source(PropertySourceKind.MANUAL):
+        application_properties.set_manual_properties(["log.level=debug"])
+    application_properties.set_properties({"log.level": "error"})
+
+    # Assert
+    assert application_properties.explain("log.level") == [
+        PropertyProvenance("error", None),
+        PropertyProvenance("debug", manual_source),
+        PropertyProvenance("warning", json_source),
+    ]
+    assert application_properties.explain("log.size") == [
+        PropertyProvenance(1, json_source)
+    ]
+    assert application_properties.property_source("log.size") == json_source
+    assert application_properties.property_source("log.level") is None
+
+
+def test_properties_explain_after_removal_and_snapshot() -> None:
+    """
+    Test that removing a property drops its provenance, and that a snapshot keeps
+    its own copy.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    with application_properties.recording_source(PropertySourceKind.YAML, "a.yaml"):
+        application_properties.set_property("log.level", "info")
+        application_properties.set_property("log.size", 1)
+    with application_properties.recording_source(PropertySourceKind.MANUAL):
+        application_properties.set_manual_property("log.level=debug")
+    original_properties = application_properties.snapshot()
+
+    # Act
+    application_properties.remove_property("log.level")
+    application_properties.remove_under("log")
+    application_properties.set_property("log.level", "error")
+
+    # Assert
+    assert application_properties.explain("log.level") == [
+        PropertyProvenance("error", None)
+    ]
+    assert not application_properties.explain("log.size")
+    assert original_properties.explain("log.level") == [
+        PropertyProvenance("debug", PropertySource(PropertySourceKind.MANUAL)),
+        PropertyProvenance("info", PropertySource(PropertySourceKind.YAML, "a.yaml")),
+    ]
+
+
+def test_properties_recording_source_with_bad_kind() -> None:
+    """
+    Test that recording a source that is not a source kind is reported.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        with application_properties.recording_source("json"):  # type: ignore
+            pass
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "The source_kind argument must be a PropertySourceKind value."
+    )
+
+
+def test_properties_explain_through_loader_and_facade() -> None:
+    """
+    Test that the loaders record the file that each property came from.
+    """
+
+    # Arrange
+    configuration_file = None
+    try:
+        configuration_file = TestHelpers.write_temporary_configuration(
+            {"plugins": {"md001": {"enabled": True}}}
+        )
+        application_properties = ApplicationProperties()
+        facade = ApplicationPropertiesFacade(application_properties, "plugins.md001.")
+
+        # Act
+        ApplicationPropertiesJsonLoader.load_and_set(
+            application_properties, configuration_file
+        )
+        explained_enabled = facade.explain("enabled")
+
+        # Assert
+        assert explained_enabled == [
+            PropertyProvenance(
+                True, PropertySource(PropertySourceKind.JSON, configuration_file)
+            )
+        ]
+        assert str(explained_enabled[0].source) == f"JSON file '{configuration_file}'"
+    finally:
+        if configuration_file and os.path.exists(configuration_file):
+            os.remove(configuration_file)
+
+
+def test_properties_schema_violation_names_source_file() -> None:
+    """
+    Test that a schema violation in a layered configuration names the file that
+    set the value, and that each layer's overridden values are kept.
+    """
+
+    # Arrange
+    configuration_file = None
+    try:
+        configuration_file = TestHelpers.write_temporary_configuration(
+            {"log": {"size": 500, "level": "info"}}
+        )
+        application_properties = ApplicationProperties()
+        loader = (
+            MultisourceConfigurationLoader()
+            .add_specified_configuration_file(configuration_file)
+            .add_manually_set_properties(["log.level=debug"])
+        )
+        schema = ApplicationProperties.compile_schema(
+            [PropertySpec("log.size", int, valid_value_fn=RangeValidator(1, 100))]
+        )
+        reported_errors: List[str] = []
+
+        def capture_error(formatted_error: str, _: Optional[Exception]) -> None:
+            reported_errors.append(formatted_error)
+
+        # Act
+        did_error = loader.process(application_properties, capture_error, schema)
+
+        # Assert
+        assert did_error
+        assert reported_errors == [
+            "Configuration does not match the schema: The value for property 'log.size' "
+            + "is not valid: Value 500 is greater than the maximum of 100. "
+            + f"(set from JSON file '{configuration_file}')"
+        ]
+        assert application_properties.explain("log.level") == [
+            PropertyProvenance("debug", PropertySource(PropertySourceKind.MANUAL)),
+            PropertyProvenance(
+                "info", PropertySource(PropertySourceKind.JSON, configuration_file)
+            ),
+        ]
+    finally:
+        if configuration_file and os.path.exists(configuration_file):
+            os.remove(configuration_file)
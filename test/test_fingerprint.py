@@ -0,0 +1,165 @@
+"""
+Tests for the fingerprint and diff functions of the ApplicationProperties class
+"""
+
+from application_properties import ApplicationProperties, ApplicationPropertiesFacade
+
+
+def test_properties_fingerprint_does_not_depend_on_order() -> None:
+    """
+    Test that the same properties set in a different order have the same fingerprint.
+    """
+
+    # Arrange
+    first_properties = ApplicationProperties()
+    second_properties = ApplicationProperties()
+
+    # Act
+    first_properties.load_from_dict({"plugins": {"md001": {"enabled": True}}, "a": 1})
+    second_properties.set_property("a", 1)
+    second_properties.set_property("plugins.md001.enabled", True)
+
+    # Assert
+    assert first_properties.fingerprint() == second_properties.fingerprint()
+    assert len(first_properties.fingerprint()) == 16
+    assert first_properties.fingerprint("plugins") == second_properties.fingerprint(
+        "Plugins"
+    )
+    assert first_properties.fingerprint("missing") == "0000000000000000"
+
+
+def test_properties_fingerprint_depends_on_value_type() -> None:
+    """
+    Test that values that are only different in their type have different fingerprints.
+    """
+
+    # Arrange
+    first_properties = ApplicationProperties()
+    second_properties = ApplicationProperties()
+
+    # Act
+    first_properties.set_property("property", 1)
+    second_properties.set_property("property", "1")
+
+    # Assert
+    assert first_properties.fingerprint() != second_properties.fingerprint()
+    assert first_properties.diff(second_properties) == ["property"]
+
+
+def test_properties_fingerprint_of_subtree_only_changes_with_subtree() -> None:
+    """
+    Test that changing a property only changes the fingerprints of its own subtrees.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"plugins": {"md001": {"level": 1}, "md002": {"level": 2}}}
+    )
+    original_md001 = application_properties.fingerprint("plugins.md001")
+    original_md002 = application_properties.fingerprint("plugins.md002")
+    original_plugins = application_properties.fingerprint("plugins")
+
+    # Act
+    application_properties.set_property("plugins.md002.level", 3)
+
+    # Assert
+    assert application_properties.fingerprint("plugins.md001") == original_md001
+    assert application_properties.fingerprint("plugins.md002") != original_md002
+    assert application_properties.fingerprint("plugins") != original_plugins
+    application_properties.set_property("plugins.md002.level", 2)
+    assert application_properties.fingerprint("plugins") == original_plugins
+
+
+def test_properties_fingerprint_after_removal_and_manual_properties() -> None:
+    """
+    Test that removing properties and setting manual properties update the fingerprint.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_manual_properties(["a.b=$#1", "a.c=two"])
+    expected_properties = ApplicationProperties()
+    expected_properties.set_properties({"a.b": 1, "a.c": "two"})
+    assert application_properties.fingerprint() == expected_properties.fingerprint()
+
+    # Act
+    application_properties.set_manual_property("a.d=$!true")
+    application_properties.remove_property("a.d")
+    application_properties.remove_under("a.c")
+    expected_properties.remove_property("a.c")
+
+    # Assert
+    assert application_properties.fingerprint() == expected_properties.fingerprint()
+
+
+def test_properties_diff_with_snapshot() -> None:
+    """
+    Test listing the properties that changed since a snapshot was taken.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"plugins": {"md001": {"level": 1}, "md002": {"level": 2}}, "log": "info"}
+    )
+    original_properties = application_properties.snapshot()
+
+    # Act
+    application_properties.set_property("plugins.md001.level", 5)
+    application_properties.set_property("plugins.md003.level", 1)
+    application_properties.remove_property("log")
+
+    # Assert
+    assert application_properties.diff(original_properties) == [
+        "log",
+        "plugins.md001.level",
+        "plugins.md003.level",
+    ]
+    assert original_properties.diff(application_properties, "plugins.md001") == [
+        "plugins.md001.level"
+    ]
+    assert not application_properties.diff(original_properties, "plugins.md002")
+    assert application_properties.snapshot().diff(application_properties) == []
+
+
+def test_properties_diff_with_bad_argument() -> None:
+    """
+    Test comparing properties with something that is not a properties object.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.diff({})  # type: ignore
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The other_properties argument must be an ApplicationProperties instance."
+    ), "Expected message was not present in exception."
+
+
+def test_properties_fingerprint_through_facade() -> None:
+    """
+    Test getting the fingerprint of the properties under a facade.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"plugins": {"md001": {"level": 1}}})
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.md001.")
+
+    # Act
+    actual_fingerprint = facade.fingerprint()
+
+    # Assert
+    assert actual_fingerprint == application_properties.fingerprint("plugins.md001")
+    assert actual_fingerprint != "0000000000000000"
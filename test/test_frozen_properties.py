@@ -0,0 +1,117 @@
+"""
+Tests for the freeze and snapshot functions of the ApplicationProperties class
+"""
+
+from typing import Callable
+
+import pytest
+
+from application_properties import ApplicationProperties
+
+
+@pytest.mark.parametrize(
+    "change_fn",
+    [
+        lambda properties: properties.clear(),
+        lambda properties: properties.load_from_dict({"other": 2}),
+        lambda properties: properties.set_manual_property("other=2"),
+        lambda properties: properties.set_manual_property(["other=2"]),
+        lambda properties: properties.enable_strict_mode(),
+        lambda properties: properties.enable_convert_untyped_if_possible(),
+    ],
+)
+def test_frozen_properties_cannot_be_changed(
+    change_fn: Callable[[ApplicationProperties], None],
+) -> None:
+    """
+    Test that each of the functions that change the properties fail once frozen.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"property": 1})
+    frozen_properties = application_properties.freeze()
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        change_fn(application_properties)
+
+    # Assert
+    assert frozen_properties is application_properties
+    assert application_properties.is_frozen
+    assert str(raised_exception.value) == "Frozen properties cannot be changed."
+    assert application_properties.get_integer_property("property") == 1
+
+
+def test_snapshot_is_not_affected_by_later_changes() -> None:
+    """
+    Test that a snapshot keeps the values present when it was taken.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"feature": {"enabled": True, "level": 1}})
+
+    # Act
+    snapshot = application_properties.snapshot()
+    application_properties.set_manual_property(["feature.level=$#2", "other=3"])
+
+    # Assert
+    assert snapshot.is_frozen
+    assert not application_properties.is_frozen
+    assert snapshot.get_integer_property("feature.level") == 1
+    assert application_properties.get_integer_property("feature.level") == 2
+    assert snapshot.property_names == ["feature.enabled", "feature.level"]
+    assert snapshot.property_names_under("feature") == [
+        "feature.enabled",
+        "feature.level",
+    ]
+    assert snapshot.number_of_properties == 2
+
+
+def test_snapshot_keeps_settings_and_untyped_values() -> None:
+    """
+    Test that a snapshot keeps the settings of the original and can still
+    convert untyped values.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(
+        strict_mode=True, convert_untyped_if_possible=True
+    )
+    application_properties.set_manual_property("property=12")
+
+    # Act
+    snapshot = application_properties.snapshot()
+
+    # Assert
+    assert snapshot.strict_mode
+    assert snapshot.convert_untyped_if_possible
+    assert snapshot.get_integer_property("property") == 12
+    assert snapshot.get_string_property("property") == "12"
+
+
+def test_snapshot_values_cannot_be_changed_in_place() -> None:
+    """
+    Test that changing a list returned from a snapshot changes neither the
+    snapshot nor the original, and that changing the original's list in place
+    does not change the snapshot.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"names": ["a", "b"], "log": {"level": 1}})
+    snapshot_properties = application_properties.snapshot()
+
+    # Act
+    snapshot_properties.get_property("names", list).append("c")
+    snapshot_properties.get_properties([("names", list)])["names"].append("d")
+    snapshot_properties.compile_accessor("names", list).get().append("e")
+    snapshot_properties.try_get_property("names", list).value.append("f")
+    snapshot_properties.get_section()["names"].append("g")
+    snapshot_properties.view()["names"].append("h")
+    application_properties.get_property("names", list).append("x")
+
+    # Assert
+    assert snapshot_properties.get_property("names", list) == ["a", "b"]
+    assert application_properties.get_property("names", list) == ["a", "b", "x"]
@@ -0,0 +1,176 @@
+"""
+Tests for the get_numeric_array function of the ApplicationProperties class
+"""
+
+from array import array
+
+from application_properties import ApplicationProperties
+
+
+def test_properties_get_numeric_array_under_prefix() -> None:
+    """
+    Test extracting the numbers under a prefix as floating point values.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"weights": {"md001": 1, "md002": 2.5, "md003": {"level": 3}}, "other": 4}
+    )
+
+    # Act
+    actual_array = application_properties.get_numeric_array("Weights")
+
+    # Assert
+    assert actual_array.property_names == (
+        "weights.md001",
+        "weights.md002",
+        "weights.md003.level",
+    )
+    assert actual_array.values == array("d", [1.0, 2.5, 3.0])
+    assert actual_array.valid_mask == array("b", [1, 1, 1])
+    assert actual_array.is_all_valid
+
+
+def test_properties_get_numeric_array_masks_invalid_values() -> None:
+    """
+    Test that values that are not numbers, or do not fit, are masked out.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "table": {
+                "a": 1,
+                "b": True,
+                "c": "2",
+                "d": 1.5,
+                "e": 2**70,
+                "f": None,
+            }
+        }
+    )
+
+    # Act
+    actual_array = application_properties.get_numeric_array("table", "q")
+
+    # Assert
+    assert actual_array.values == array("q", [1, 0, 0, 0, 0, 0])
+    assert actual_array.valid_mask == array("b", [1, 0, 0, 0, 0, 0])
+    assert not actual_array.is_all_valid
+    assert list(actual_array.invalid_property_names()) == [
+        "table.b",
+        "table.c",
+        "table.d",
+        "table.e",
+        "table.f",
+    ]
+
+
+def test_properties_get_numeric_array_masks_float_overflow() -> None:
+    """
+    Test that numbers too large for a single precision array are masked out,
+    while values that are already infinite are kept.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"table": {"a": 1.5, "b": 1e300, "c": -1e300, "d": 2**200, "e": float("inf")}}
+    )
+
+    # Act
+    actual_array = application_properties.get_numeric_array("table", "f")
+
+    # Assert
+    assert actual_array.values == array("f", [1.5, 0, 0, 0, float("inf")])
+    assert actual_array.valid_mask == array("b", [1, 0, 0, 0, 1])
+    assert list(actual_array.invalid_property_names()) == [
+        "table.b",
+        "table.c",
+        "table.d",
+    ]
+
+
+def test_properties_get_numeric_array_from_list() -> None:
+    """
+    Test extracting the elements of a list-valued property.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"thresholds": [10, 20, "thirty", 40]})
+
+    # Act
+    actual_array = application_properties.get_numeric_array("thresholds", "i")
+
+    # Assert
+    assert actual_array.property_names == (
+        "thresholds[0]",
+        "thresholds[1]",
+        "thresholds[2]",
+        "thresholds[3]",
+    )
+    assert actual_array.values == array("i", [10, 20, 0, 40])
+    assert actual_array.valid_mask == array("b", [1, 1, 0, 1])
+
+
+def test_properties_get_numeric_array_with_untyped_values() -> None:
+    """
+    Test that untyped values are converted when that conversion is enabled.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_properties(
+        ["limits.low=5", "limits.high=$#50", "limits.name=wide"]
+    )
+
+    # Act
+    actual_array = application_properties.get_numeric_array("limits", "l")
+
+    # Assert
+    assert actual_array.values == array("l", [5, 50, 0])
+    assert actual_array.valid_mask == array("b", [1, 1, 0])
+
+
+def test_properties_get_numeric_array_missing_prefix() -> None:
+    """
+    Test extracting from a prefix that has no properties under it.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    actual_array = application_properties.get_numeric_array("missing")
+
+    # Assert
+    assert actual_array.property_names == ()
+    assert actual_array.values == array("d")
+    assert actual_array.is_all_valid
+
+
+def test_properties_get_numeric_array_bad_typecode() -> None:
+    """
+    Test extracting with a type code that is not for numbers.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.get_numeric_array("table", "u")
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The typecode argument must be one of the numeric array type codes."
+    ), "Expected message was not present in exception."
@@ -0,0 +1,135 @@
+"""
+Tests for the get_properties function of the ApplicationProperties class
+"""
+
+import pytest
+
+from application_properties import ApplicationProperties, PropertySpec
+
+
+def __validate_small(value: int) -> None:
+    if value > 5:
+        raise ValueError("Value is too big.")
+
+
+def test_get_properties_with_found_and_not_found_values() -> None:
+    """
+    Test fetching multiple properties, some present and some not present.
+    """
+
+    # Arrange
+    config_map = {"server": {"port": 1234, "host": "localhost", "debug": True}}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+
+    # Act
+    found_values = application_properties.get_properties(
+        [
+            PropertySpec("server.port", int, 8080),
+            ("server.host", str),
+            ("server.debug", bool, False),
+            ("server.timeout", int, 30),
+        ]
+    )
+
+    # Assert
+    assert found_values == {
+        "server.port": 1234,
+        "server.host": "localhost",
+        "server.debug": True,
+        "server.timeout": 30,
+    }
+
+
+def test_get_properties_with_bad_values_not_strict() -> None:
+    """
+    Test fetching multiple properties where the values are not usable, falling
+    back to the default values.
+    """
+
+    # Arrange
+    config_map = {"first": "abc", "second": 10}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+
+    # Act
+    found_values = application_properties.get_properties(
+        [("first", int, 1), ("second", int, 2, __validate_small)]
+    )
+
+    # Assert
+    assert found_values == {"first": 1, "second": 2}
+
+
+def test_get_properties_with_bad_values_strict_reports_all() -> None:
+    """
+    Test fetching multiple properties in strict mode where the values are not
+    usable, reporting every problem together.
+    """
+
+    # Arrange
+    config_map = {"first": "abc", "second": 10, "third": 3}
+    application_properties = ApplicationProperties(strict_mode=True)
+    application_properties.load_from_dict(config_map)
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.get_properties(
+            [
+                ("first", int, 1),
+                ("second", int, 2, __validate_small),
+                ("third", int, 3, __validate_small),
+                ("fourth", int, None, None, True),
+            ]
+        )
+
+    # Assert
+    assert str(raised_exception.value) == (
+        "The value for property 'first' must be of type 'int'.\n"
+        + "The value for property 'second' is not valid: Value is too big.\n"
+        + "A value for property 'fourth' must be provided."
+    )
+
+
+def test_get_properties_with_bad_specifications_reports_all() -> None:
+    """
+    Test fetching multiple properties where the specifications are not valid,
+    reporting every problem together even when not in strict mode.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.get_properties(
+            [("bad..key", int), ("property", int, "1"), ("property",)]
+        )
+
+    # Assert
+    assert str(raised_exception.value) == (
+        "Full property key cannot contain multiples of the . without any text between them.\n"
+        + "The default value for property 'property' must either be None or a 'int' value.\n"
+        + "PropertySpec.__new__() missing 1 required positional argument: 'property_type'"
+    )
+
+
+def test_get_properties_with_none_value_strict() -> None:
+    """
+    Test fetching a property whose value is present but None, in strict mode.
+    """
+
+    # Arrange
+    config_map = {"property": None}
+    application_properties = ApplicationProperties(strict_mode=True)
+    application_properties.load_from_dict(config_map)
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.get_properties([("property", int, 1)])
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "The value for property 'property' must be of type 'int'."
+    )
@@ -0,0 +1,227 @@
+"""
+Tests for the get_section function of the ApplicationProperties class
+"""
+
+from typing import Any, Dict
+
+from application_properties import ApplicationProperties, ApplicationPropertiesFacade
+
+SAMPLE_PROPERTIES: Dict[str, Any] = {
+    "plugins": {
+        "md001": {"enabled": True, "options": {"level": 1, "names": ["a", "b"]}},
+        "md002": {"enabled": False},
+    },
+    "log": {"level": "info"},
+}
+
+
+def test_properties_get_section_round_trips() -> None:
+    """
+    Test that the section for every property is the dictionary that was loaded.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(SAMPLE_PROPERTIES)
+
+    # Act
+    actual_section = application_properties.get_section()
+
+    # Assert
+    assert actual_section == SAMPLE_PROPERTIES
+
+
+def test_properties_get_section_under_key() -> None:
+    """
+    Test getting the section under a key.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(SAMPLE_PROPERTIES)
+
+    # Act
+    plugin_section = application_properties.get_section("Plugins.md001")
+    leaf_section = application_properties.get_section("plugins.md001.enabled")
+    missing_section = application_properties.get_section("missing")
+
+    # Assert
+    assert plugin_section == {
+        "enabled": True,
+        "options": {"level": 1, "names": ["a", "b"]},
+    }
+    assert not leaf_section
+    assert not missing_section
+
+
+def test_properties_get_section_unquotes_keys() -> None:
+    """
+    Test that keys containing the separator are unquoted again.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(allow_separator_in_keys=True)
+    application_properties.load_from_dict(
+        {"tool": {"file.md": {"level": 1}, "other": 2}}, allow_periods_in_keys=True
+    )
+
+    # Act
+    actual_section = application_properties.get_section("tool")
+
+    # Assert
+    assert application_properties.property_names_under("tool") == [
+        "tool.'file.md'.level",
+        "tool.other",
+    ]
+    assert actual_section == {"file.md": {"level": 1}, "other": 2}
+
+
+def test_properties_get_section_is_cached_until_changed() -> None:
+    """
+    Test that a section is cached until a property in it changes, and that each
+    call returns a separate copy.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(SAMPLE_PROPERTIES)
+    first_section = application_properties.get_section("plugins")
+    log_section = application_properties.get_section("log")
+    first_section["md002"]["enabled"] = "changed"
+
+    # Act
+    second_section = application_properties.get_section("plugins")
+    application_properties.set_property("plugins.md002.level", 3)
+    application_properties.set_properties({"plugins.md003.level": 1})
+    application_properties.set_manual_properties(["plugins.md004.level=$#2"])
+    third_section = application_properties.get_section("plugins")
+
+    # Assert
+    assert second_section == SAMPLE_PROPERTIES["plugins"]
+    assert second_section is not first_section
+    assert third_section["md002"] == {"enabled": False, "level": 3}
+    assert third_section["md003"] == {"level": 1}
+    assert third_section["md004"] == {"level": 2}
+    assert application_properties.get_section("log") == log_section
+
+
+def test_properties_get_section_after_removal() -> None:
+    """
+    Test that removing properties changes the cached sections they were in.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(SAMPLE_PROPERTIES)
+    assert application_properties.get_section()["log"] == {"level": "info"}
+    assert application_properties.get_section("plugins.md001")
+
+    # Act
+    application_properties.remove_under("log")
+    application_properties.remove_property("plugins.md001.enabled")
+
+    # Assert
+    assert "log" not in application_properties.get_section()
+    assert application_properties.get_section("plugins.md001") == {
+        "options": {"level": 1, "names": ["a", "b"]}
+    }
+
+
+def test_properties_get_section_with_value_and_children() -> None:
+    """
+    Test that a property with both a value and properties under it is reported.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_properties({"feature": True, "feature.level": 1})
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.get_section()
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The property 'feature' has both a value and properties under it, so it cannot be part of a section."
+    ), "Expected message was not present in exception."
+    assert application_properties.get_section("feature") == {"level": 1}
+
+
+def test_properties_get_section_through_facade() -> None:
+    """
+    Test getting the section under a facade.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(SAMPLE_PROPERTIES)
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.md002.")
+
+    # Act
+    actual_section = facade.get_section()
+
+    # Assert
+    assert actual_section == {"enabled": False}
+
+
+def test_properties_iterate_nested_properties_in_sorted_order() -> None:
+    """
+    Test that the nested properties come in sorted order at each level, with
+    the unquoted parts of each name relative to the key.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(allow_separator_in_keys=True)
+    application_properties.load_from_dict(
+        {"b": {"z": 1, "a": {"x": 2}}, "a": 3, "c": {"f.md": {"l": 1}}},
+        allow_periods_in_keys=True,
+    )
+
+    # Act
+    all_properties = list(application_properties.iterate_nested_properties())
+    under_properties = list(application_properties.iterate_nested_properties("B"))
+    missing_properties = list(
+        application_properties.iterate_nested_properties("missing")
+    )
+
+    # Assert
+    assert all_properties == [
+        ("a", ("a",), 3),
+        ("b.a.x", ("b", "a", "x"), 2),
+        ("b.z", ("b", "z"), 1),
+        ("c.'f.md'.l", ("c", "f.md", "l"), 1),
+    ]
+    assert under_properties == [("b.a.x", ("a", "x"), 2), ("b.z", ("z",), 1)]
+    assert not missing_properties
+
+
+def test_properties_iterate_nested_properties_with_value_and_children() -> None:
+    """
+    Test that iterating over a property with both a value and properties under
+    it is reported.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_properties({"feature": True, "feature.level": 1})
+
+    # Act
+    raised_exception = None
+    try:
+        list(application_properties.iterate_nested_properties())
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The property 'feature' has both a value and properties under it, so it cannot be part of a section."
+    ), "Expected message was not present in exception."
@@ -773,3 +773,94 @@ def test_properties_get_string_list_with_is_required_and_default_value() -> None
         str(raised_exception)
         == "The 'is_required' parameter cannot be set to 'True' with the 'default_value' parameter set to a value that is not None."
     ), "Expected message was not present in exception."
+
+
+def test_properties_get_string_list_returns_independent_lists() -> None:
+    """
+    Test fetching a string list twice and making sure that changing the first
+    result does not change the second result.
+    """
+
+    # Arrange
+    config_map = {"property": "me, you"}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    first_value = application_properties.get_string_list_property("property", ",")
+    assert first_value is not None
+    first_value.append("them")
+    expected_value = ["me", "you"]
+
+    # Act
+    actual_value = application_properties.get_string_list_property("property", ",")
+
+    # Assert
+    assert expected_value == actual_value
+
+
+def test_properties_get_string_list_after_property_changed() -> None:
+    """
+    Test fetching a string list, changing the property, and fetching it again.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_manual_property("property=me,you")
+    application_properties.get_string_list_property("property", ",")
+    application_properties.set_manual_property("property=them")
+    expected_value = ["them"]
+
+    # Act
+    actual_value = application_properties.get_string_list_property("property", ",")
+
+    # Assert
+    assert expected_value == actual_value
+
+
+def test_properties_get_string_list_with_different_delimiters() -> None:
+    """
+    Test fetching the same string list property with two different delimiters.
+    """
+
+    # Arrange
+    config_map = {"property": "me,you;them"}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    application_properties.get_string_list_property("property", ",")
+    expected_value = ["me,you", "them"]
+
+    # Act
+    actual_value = application_properties.get_string_list_property("property", ";")
+
+    # Assert
+    assert expected_value == actual_value
+
+
+def test_properties_get_string_list_with_empty_element_strict_twice() -> None:
+    """
+    Test fetching a string list with an empty element in strict mode a second
+    time, making sure the same error is raised again.
+    """
+
+    # Arrange
+    config_map = {"property": "me,,you"}
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(config_map)
+    assert application_properties.get_string_list_property("property", ",") is None
+
+    # Act
+    raised_exception = None
+    for _ in range(2):
+        try:
+            application_properties.get_string_list_property(
+                "property", ",", strict_mode=True
+            )
+            raise AssertionError("Should have raised an exception by now.")
+        except ValueError as this_exception:
+            raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "Configuration item 'property' contains at least one empty element."
+    ), "Expected message was not present in exception."
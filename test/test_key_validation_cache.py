@@ -0,0 +1,78 @@
+"""
+Tests for the memoized key validation of the ApplicationProperties class
+"""
+
+import pytest
+
+from application_properties import ApplicationProperties
+
+
+def test_key_validation_cache_counts_hits_and_misses() -> None:
+    """
+    Test that repeated lookups of the same key are served from the cache.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"feature": {"enabled": True}})
+    ApplicationProperties.clear_key_validation_cache()
+
+    # Act
+    first_value = application_properties.get_boolean_property("Feature.Enabled")
+    second_value = application_properties.get_boolean_property("Feature.Enabled")
+    cache_info = ApplicationProperties.key_validation_cache_info()
+
+    # Assert
+    assert first_value is True
+    assert second_value is True
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+    assert cache_info.currsize == 1
+
+
+def test_key_validation_cache_remembers_errors() -> None:
+    """
+    Test that an invalid key raises the same error when served from the cache.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    ApplicationProperties.clear_key_validation_cache()
+    expected_message = "Each part of the property key cannot contain a whitespace character, a '=' character, or a '.' character."
+
+    # Act
+    with pytest.raises(ValueError) as first_exception:
+        application_properties.get_string_property("bad key")
+    with pytest.raises(ValueError) as second_exception:
+        application_properties.get_string_property("bad key")
+    cache_info = ApplicationProperties.key_validation_cache_info()
+
+    # Assert
+    assert str(first_exception.value) == expected_message
+    assert str(second_exception.value) == expected_message
+    assert cache_info.hits == 1
+
+
+def test_key_validation_cache_keeps_alternate_names_apart() -> None:
+    """
+    Test that the alternate name used in error messages is part of the cache key.
+    """
+
+    # Arrange
+    ApplicationProperties.clear_key_validation_cache()
+
+    # Act
+    with pytest.raises(ValueError) as first_exception:
+        ApplicationProperties.verify_full_key_form(".bad")
+    with pytest.raises(ValueError) as second_exception:
+        ApplicationProperties.verify_full_key_form(".bad", "Configuration item name")
+
+    # Assert
+    assert (
+        str(first_exception.value)
+        == "Full property key must not start or end with the '.' character."
+    )
+    assert (
+        str(second_exception.value)
+        == "Configuration item name must not start or end with the '.' character."
+    )
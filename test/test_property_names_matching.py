@@ -0,0 +1,239 @@
+"""
+Tests for the property_names_matching function of the ApplicationProperties class
+"""
+
+from typing import Any, Dict
+
+from application_properties import (
+    ApplicationProperties,
+    ApplicationPropertiesFacade,
+    ApplicationPropertiesKeyPattern,
+)
+
+SAMPLE_PROPERTIES: Dict[str, Any] = {
+    "plugins": {
+        "md001": {"enabled": True, "level": 1},
+        "md002": {"enabled": False},
+        "md010": {"enabled": True, "options": {"level": 3}},
+        "other": {"value": 1},
+    },
+    "log": {"level": "info"},
+    "level": 2,
+}
+
+
+def build_properties() -> ApplicationProperties:
+    """
+    Build the sample properties used by these tests.
+    """
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(SAMPLE_PROPERTIES)
+    return application_properties
+
+
+def test_properties_names_matching_single_segment() -> None:
+    """
+    Test matching any one segment with `*`.
+    """
+
+    # Arrange
+    application_properties = build_properties()
+
+    # Act
+    actual_names = application_properties.property_names_matching("Plugins.*.Enabled")
+
+    # Assert
+    assert actual_names == [
+        "plugins.md001.enabled",
+        "plugins.md002.enabled",
+        "plugins.md010.enabled",
+    ]
+
+
+def test_properties_names_matching_within_segment() -> None:
+    """
+    Test matching part of a segment, without crossing the separator.
+    """
+
+    # Arrange
+    application_properties = build_properties()
+
+    # Act
+    question_names = application_properties.property_names_matching(
+        "plugins.md00?.enabled"
+    )
+    star_names = application_properties.property_names_matching("plugins.md*")
+    range_names = application_properties.property_names_matching("plugins.md0[1-9]*.*")
+
+    # Assert
+    assert question_names == ["plugins.md001.enabled", "plugins.md002.enabled"]
+    assert not star_names
+    assert range_names == ["plugins.md010.enabled"]
+
+
+def test_properties_names_matching_many_segments() -> None:
+    """
+    Test matching any number of segments, including none, with `**`.
+    """
+
+    # Arrange
+    application_properties = build_properties()
+
+    # Act
+    level_names = application_properties.property_names_matching("**.level")
+    plugin_names = application_properties.property_names_matching("plugins.md010.**")
+    repeated_names = application_properties.property_names_matching("**.md010.**.level")
+    all_names = application_properties.property_names_matching("**.**")
+
+    # Assert
+    assert level_names == [
+        "plugins.md001.level",
+        "plugins.md010.options.level",
+        "log.level",
+        "level",
+    ]
+    assert plugin_names == ["plugins.md010.enabled", "plugins.md010.options.level"]
+    assert repeated_names == ["plugins.md010.options.level"]
+    assert sorted(all_names) == sorted(application_properties.property_names)
+
+
+def test_properties_names_matching_literal_pattern() -> None:
+    """
+    Test that a pattern without wildcards only matches that exact key.
+    """
+
+    # Arrange
+    application_properties = build_properties()
+
+    # Act
+    actual_names = application_properties.property_names_matching("plugins.md001")
+    exact_names = application_properties.property_names_matching("plugins.md001.level")
+
+    # Assert
+    assert not actual_names
+    assert exact_names == ["plugins.md001.level"]
+
+
+def test_properties_names_matching_compiled_pattern() -> None:
+    """
+    Test that compiled patterns are remembered and may be used directly.
+    """
+
+    # Arrange
+    application_properties = build_properties()
+
+    # Act
+    first_pattern = ApplicationPropertiesKeyPattern.compile_pattern("Plugins.*.level")
+    second_pattern = ApplicationPropertiesKeyPattern.compile_pattern("plugins.*.LEVEL")
+    actual_names = application_properties.property_names_matching(first_pattern)
+
+    # Assert
+    assert first_pattern is second_pattern
+    assert first_pattern.pattern == "plugins.*.level"
+    assert actual_names == ["plugins.md001.level"]
+
+
+def test_properties_names_matching_bad_patterns() -> None:
+    """
+    Test that patterns that are not valid are reported.
+    """
+
+    # Arrange
+    application_properties = build_properties()
+    bad_patterns: Any = [None, "", "plugins..level", "plugins.*."]
+
+    # Act
+    raised_messages = []
+    for next_pattern in bad_patterns:
+        try:
+            application_properties.property_names_matching(next_pattern)
+            raise AssertionError("Should have raised an exception by now.")
+        except ValueError as this_exception:
+            raised_messages.append(str(this_exception))
+
+    # Assert
+    assert raised_messages == [
+        "The pattern argument must be a non-empty string.",
+        "The pattern argument must be a non-empty string.",
+        "Pattern 'plugins..level' must not contain an empty segment.",
+        "Pattern 'plugins.*.' must not contain an empty segment.",
+    ]
+
+
+def test_properties_names_matching_through_facade() -> None:
+    """
+    Test matching patterns relative to the prefix of a facade.
+    """
+
+    # Arrange
+    application_properties = build_properties()
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.")
+
+    # Act
+    actual_names = facade.property_names_matching("*.enabled")
+    deep_names = facade.property_names_matching("**.level")
+
+    # Assert
+    assert actual_names == ["md001.enabled", "md002.enabled", "md010.enabled"]
+    assert deep_names == ["md001.level", "md010.options.level"]
+
+
+def test_properties_names_matching_through_facade_with_wildcard_prefix() -> None:
+    """
+    Test that wildcard characters in the prefix of a facade only match themselves.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "rules[1]": {"a": 1},
+            "rules1": {"a": 2},
+            "rules?": {"b": 3},
+            "rulesx": {"b": 4},
+        }
+    )
+    bracket_facade = ApplicationPropertiesFacade(application_properties, "rules[1].")
+    question_facade = ApplicationPropertiesFacade(application_properties, "rules?.")
+
+    # Act
+    bracket_names = bracket_facade.property_names_matching("*")
+    question_names = question_facade.property_names_matching("**")
+
+    # Assert
+    assert bracket_names == ["a"]
+    assert question_names == ["b"]
+
+
+def test_properties_queries_with_apostrophe_keys() -> None:
+    """
+    Test that keys with an apostrophe in a key part are found by the queries
+    that use the key index, and can be removed by prefix.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"plugins": {"it's": {"enabled": True, "level": 1}, "other": {"level": 2}}}
+    )
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.it's.")
+
+    # Act
+    facade_names = facade.property_names
+    names_under = application_properties.property_names_under("plugins.it's")
+    count_under = application_properties.number_of_properties_under("plugins.it's")
+    matching_names = application_properties.property_names_matching("plugins.*.enabled")
+    plugin_section = application_properties.get_section("plugins")
+    removed_count = application_properties.remove_under("plugins.it's")
+
+    # Assert
+    assert facade_names == ["enabled", "level"]
+    assert names_under == ["plugins.it's.enabled", "plugins.it's.level"]
+    assert count_under == 2
+    assert matching_names == ["plugins.it's.enabled"]
+    assert plugin_section == {
+        "it's": {"enabled": True, "level": 1},
+        "other": {"level": 2},
+    }
+    assert removed_count == 2
+    assert application_properties.property_names == ["plugins.other.level"]
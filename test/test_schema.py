@@ -0,0 +1,270 @@
+"""
+Tests for compiling and applying schemas to ApplicationProperties instances
+"""
+
+from typing import List, Optional
+
+import pytest
+
+from application_properties import (
+    ApplicationProperties,
+    MultisourceConfigurationLoader,
+    PropertySpec,
+    RangeValidator,
+)
+
+LOGGING_SCHEMA = ApplicationProperties.compile_schema(
+    [
+        PropertySpec("Log.Level", str, "info"),
+        PropertySpec("log.size", int, valid_value_fn=RangeValidator(1, 100)),
+        ("log.file", str, None, None, True),
+    ]
+)
+
+
+def test_schema_compile() -> None:
+    """
+    Test that compiling a schema normalizes the property names.
+    """
+
+    # Arrange
+
+    # Act
+    property_names = LOGGING_SCHEMA.property_names
+
+    # Assert
+    assert property_names == ["log.level", "log.size", "log.file"]
+    assert len(LOGGING_SCHEMA) == 3
+    assert LOGGING_SCHEMA.find_spec("log.file") == PropertySpec(
+        "log.file", str, None, None, True
+    )
+    assert LOGGING_SCHEMA.find_spec("log.other") is None
+
+
+def test_schema_compile_reports_all_problems() -> None:
+    """
+    Test that compiling a schema reports every problem with its specifications.
+    """
+
+    # Arrange
+
+    # Act
+    with pytest.raises(ValueError) as raised_exception:
+        ApplicationProperties.compile_schema(
+            [
+                ("a..b", int),
+                ("c", "int"),
+                ("d", int, "1"),
+                ("e", int, 1, None, True),
+                ("f", int),
+                ("F", bool),
+            ]
+        )
+
+    # Assert
+    assert str(raised_exception.value) == (
+        "Full property key cannot contain multiples of the . without any text between them.\n"
+        + "The property_type argument for 'c' must be a type.\n"
+        + "The default value for property 'd' must either be None or a 'int' value.\n"
+        + "The property 'e' cannot be required and have a default value.\n"
+        + "The property 'f' is specified more than once."
+    )
+
+
+def test_schema_apply_with_valid_properties() -> None:
+    """
+    Test applying a schema to properties that match it, and getting the declared properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"log": {"size": 10, "file": "out.log"}})
+
+    # Act
+    schema_violations = application_properties.apply_schema(LOGGING_SCHEMA)
+
+    # Assert
+    assert not schema_violations
+    assert application_properties.schema is LOGGING_SCHEMA
+    assert application_properties.get_declared_property("log.level") == "info"
+    assert application_properties.get_declared_property("log.size") == 10
+    assert application_properties.get_declared_property("Log.File") == "out.log"
+
+
+def test_schema_apply_reports_all_violations() -> None:
+    """
+    Test applying a schema to properties that do not match it, making sure every
+    violation is reported and that the schema is not applied.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"log": {"level": 1, "size": 1000}})
+
+    # Act
+    schema_violations = application_properties.apply_schema(LOGGING_SCHEMA)
+
+    # Assert
+    assert schema_violations == [
+        "The value for property 'log.level' must be of type 'str'.",
+        "The value for property 'log.size' is not valid: Value 1000 is greater than the maximum of 100.",
+        "A value for property 'log.file' must be provided.",
+    ]
+    assert application_properties.schema is None
+
+
+def test_schema_get_declared_property_after_change() -> None:
+    """
+    Test that a declared property is checked again after it changes.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"log": {"size": 10, "file": "out.log"}})
+    assert not application_properties.apply_schema(LOGGING_SCHEMA)
+
+    # Act
+    application_properties.set_property("log.size", 20)
+    changed_value = application_properties.get_declared_property("log.size")
+    application_properties.set_property("log.size", 200)
+    with pytest.raises(ValueError) as raised_exception:
+        application_properties.get_declared_property("log.size")
+
+    # Assert
+    assert changed_value == 20
+    assert (
+        str(raised_exception.value)
+        == "The value for property 'log.size' is not valid: Value 200 is greater than the maximum of 100."
+    )
+
+
+def test_schema_get_declared_property_after_set_properties() -> None:
+    """
+    Test that a declared property that was using its default value sees the
+    value set for it with `set_properties`.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"log": {"size": 10, "file": "out.log"}})
+    assert not application_properties.apply_schema(LOGGING_SCHEMA)
+    default_value = application_properties.get_declared_property("log.level")
+
+    # Act
+    application_properties.set_properties({"log.level": "debug"})
+    changed_value = application_properties.get_declared_property("log.level")
+
+    # Assert
+    assert default_value == "info"
+    assert changed_value == "debug"
+
+
+def test_schema_get_declared_property_after_set_manual_properties() -> None:
+    """
+    Test that a declared property that was using its default value sees the
+    value set for it with `set_manual_properties`.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"log": {"size": 10, "file": "out.log"}})
+    assert not application_properties.apply_schema(LOGGING_SCHEMA)
+    default_value = application_properties.get_declared_property("log.level")
+
+    # Act
+    application_properties.set_manual_properties(["log.level=$$warning"])
+    changed_value = application_properties.get_declared_property("log.level")
+
+    # Assert
+    assert default_value == "info"
+    assert changed_value == "warning"
+
+
+def test_schema_get_declared_property_not_declared() -> None:
+    """
+    Test getting a declared property that is not in the schema, and getting one
+    without any schema applied.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"log": {"file": "out.log"}, "other": 1})
+    unchecked_properties = ApplicationProperties()
+
+    # Act
+    assert not application_properties.apply_schema(LOGGING_SCHEMA)
+    with pytest.raises(ValueError) as not_declared_exception:
+        application_properties.get_declared_property("other")
+    with pytest.raises(ValueError) as no_schema_exception:
+        unchecked_properties.get_declared_property("log.file")
+
+    # Assert
+    assert (
+        str(not_declared_exception.value)
+        == "The property 'other' is not declared in the schema."
+    )
+    assert (
+        str(no_schema_exception.value)
+        == "A schema must be applied before getting a declared property."
+    )
+
+
+def test_schema_multisource_process_reports_violations() -> None:
+    """
+    Test that processing configuration sources with a schema reports every violation.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    loader = MultisourceConfigurationLoader().add_manually_set_properties(
+        ["log.size=$#500"]
+    )
+    reported_errors: List[str] = []
+
+    def capture_error(formatted_error: str, _: Optional[Exception]) -> None:
+        reported_errors.append(formatted_error)
+
+    # Act
+    did_error = loader.process(application_properties, capture_error, LOGGING_SCHEMA)
+
+    # Assert
+    assert did_error
+    assert reported_errors == [
+        "Configuration does not match the schema: The value for property 'log.size' is not valid: Value 500 is greater than the maximum of 100. (set from manually set properties)",
+        "Configuration does not match the schema: A value for property 'log.file' must be provided.",
+    ]
+
+
+def test_schema_multisource_reload_uses_applied_schema() -> None:
+    """
+    Test that reloading checks the new configuration against the schema that is
+    already applied, keeping the current configuration if it does not match.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    good_loader = MultisourceConfigurationLoader().add_manually_set_properties(
+        ["log.file=first.log"]
+    )
+    assert not good_loader.process(application_properties, schema=LOGGING_SCHEMA)
+    bad_loader = MultisourceConfigurationLoader().add_manually_set_properties(
+        ["log.size=$#0"]
+    )
+    reported_errors: List[str] = []
+
+    def capture_error(formatted_error: str, _: Optional[Exception]) -> None:
+        reported_errors.append(formatted_error)
+
+    # Act
+    did_error = bad_loader.reload(application_properties, capture_error)
+    second_loader = MultisourceConfigurationLoader().add_manually_set_properties(
+        ["log.file=second.log"]
+    )
+    did_second_error = second_loader.reload(application_properties)
+
+    # Assert
+    assert did_error
+    assert len(reported_errors) == 2
+    assert not did_second_error
+    assert application_properties.schema is LOGGING_SCHEMA
+    assert application_properties.get_declared_property("log.file") == "second.log"
@@ -0,0 +1,146 @@
+"""
+Tests for the set_manual_properties function of the ApplicationProperties class
+"""
+
+from application_properties import ApplicationProperties
+
+
+def test_properties_set_manual_properties_with_typed_and_untyped() -> None:
+    """
+    Test setting a batch of manual properties with both typed and untyped values.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+
+    # Act
+    application_properties.set_manual_properties(
+        ["Feature.Level=1", "feature.name=$$abc", "feature.enabled=$!true"]
+    )
+
+    # Assert
+    assert application_properties.property_names == [
+        "feature.level",
+        "feature.name",
+        "feature.enabled",
+    ]
+    assert application_properties.get_integer_property("feature.level") == 1
+    assert application_properties.get_string_property("feature.name") == "abc"
+    assert application_properties.get_boolean_property("feature.enabled") is True
+
+
+def test_properties_set_manual_properties_with_repeated_key() -> None:
+    """
+    Test setting a batch of manual properties where a later entry replaces an earlier one.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+
+    # Act
+    application_properties.set_manual_properties(["property=1", "property=$#2"])
+
+    # Assert
+    assert application_properties.number_of_properties == 1
+    assert application_properties.get_integer_property("property") == 2
+
+
+def test_properties_set_manual_properties_reports_all_errors() -> None:
+    """
+    Test setting a batch of manual properties with more than one bad entry,
+    making sure that every bad entry is reported and that nothing is set.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_manual_property("existing=1")
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.set_manual_properties(
+            ["good=1", "no_equals", "bad..key=2", "number=$#abc"]
+        )
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert str(raised_exception) == (
+        "Manually set property 'no_equals' was not validly formed: Manual property key and value must be separated by the '=' character.\n"
+        + "Manually set property 'bad..key=2' was not validly formed: Full property key cannot contain multiples of the . without any text between them.\n"
+        + "Manually set property 'number=$#abc' was not validly formed: Manual property value '$#abc' cannot be translated into an integer."
+    ), "Expected message was not present in exception."
+    assert application_properties.property_names == ["existing"]
+
+
+def test_properties_set_manual_properties_with_string() -> None:
+    """
+    Test setting a batch of manual properties with a single string instead of an iterable.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.set_manual_properties("property=1")
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception) == "Manual properties must be an iterable of strings."
+    ), "Expected message was not present in exception."
+
+
+def test_properties_set_manual_properties_with_non_string_entry() -> None:
+    """
+    Test setting a batch of manual properties where one entry is not a string.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.set_manual_properties(["property=1", 2])  # type: ignore
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "Manually set property '2' was not validly formed: Manual property form must be a string."
+    ), "Expected message was not present in exception."
+
+
+def test_properties_set_manual_properties_when_frozen() -> None:
+    """
+    Test setting a batch of manual properties on frozen properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.freeze()
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.set_manual_properties(["property=1"])
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception) == "Frozen properties cannot be changed."
+    ), "Expected message was not present in exception."
@@ -757,3 +757,84 @@ def test_properties_set_manual_property_integer_wrong_type_convert_enabled_stric
 
     # Assert
     assert expected_value == actual_value
+
+
+def test_properties_set_manual_property_converted_value_follows_rewrite() -> None:
+    """
+    Test that a converted untyped value is not reused after the property is set again.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_property("property=1")
+    first_value = application_properties.get_integer_property("property")
+    repeated_value = application_properties.get_integer_property("property")
+
+    # Act
+    application_properties.set_manual_property("property=2")
+    actual_value = application_properties.get_integer_property("property")
+
+    # Assert
+    assert first_value == 1
+    assert repeated_value == 1
+    assert actual_value == 2
+
+
+def test_properties_set_manual_property_failed_conversion_follows_rewrite() -> None:
+    """
+    Test that a failed conversion of an untyped value is not reused after the
+    property is set again.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_property("property=abc")
+    first_value = application_properties.get_integer_property("property", -1)
+    repeated_value = application_properties.get_integer_property("property", -1)
+
+    # Act
+    application_properties.set_manual_property("property=3")
+    actual_value = application_properties.get_integer_property("property", -1)
+
+    # Assert
+    assert first_value == -1
+    assert repeated_value == -1
+    assert actual_value == 3
+
+
+def test_properties_set_manual_property_typed_value_replaces_untyped_value() -> None:
+    """
+    Test that setting a typed value removes the untyped value it replaces, so that
+    the old value is no longer eligible for conversion.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_property("property=1")
+
+    # Act
+    application_properties.set_manual_property("property=$!true")
+    actual_value = application_properties.get_integer_property("property", -1)
+
+    # Assert
+    assert actual_value == -1
+
+
+def test_properties_set_manual_property_untyped_value_not_listed() -> None:
+    """
+    Test that the untyped copy of a manually set property is not listed as a property.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+
+    # Act
+    application_properties.set_manual_property(["feature.level=1", "feature.name=abc"])
+
+    # Assert
+    assert application_properties.property_names == ["feature.level", "feature.name"]
+    assert application_properties.property_names_under("feature") == [
+        "feature.level",
+        "feature.name",
+    ]
+    assert application_properties.get_integer_property("feature.level") == 1
@@ -0,0 +1,288 @@
+"""
+Tests for the set_property, set_properties, remove_property, and remove_under
+functions of the ApplicationProperties class
+"""
+
+from typing import Any, Callable, Dict, List
+
+from application_properties import ApplicationProperties
+
+
+def test_properties_set_property_with_typed_values() -> None:
+    """
+    Test setting properties with values of different types.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    application_properties.set_property("Feature.Level", 3)
+    application_properties.set_property("feature.enabled", True)
+    application_properties.set_property("feature.name", "$#1")
+    application_properties.set_property("feature.ratio", 0.5)
+
+    # Assert
+    assert application_properties.get_integer_property("feature.level") == 3
+    assert application_properties.get_boolean_property("feature.enabled") is True
+    assert application_properties.get_string_property("feature.name") == "$#1"
+    assert application_properties.get_property("feature.ratio", float) == 0.5
+    assert application_properties.property_names_under("feature") == [
+        "feature.level",
+        "feature.enabled",
+        "feature.name",
+        "feature.ratio",
+    ]
+
+
+def test_properties_set_property_replaces_untyped_value() -> None:
+    """
+    Test that setting a property discards the untyped value that it replaces.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_property("property=1")
+    assert application_properties.get_integer_property("property") == 1
+
+    # Act
+    application_properties.set_property("property", "2")
+
+    # Assert
+    assert application_properties.get_integer_property("property", -1) == -1
+    assert application_properties.get_string_property("property") == "2"
+
+
+def test_properties_set_property_copies_mutable_value() -> None:
+    """
+    Test that setting a property to a mutable value stores a copy of that value.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    property_value = ["a", "b"]
+
+    # Act
+    application_properties.set_property("property", property_value)
+    property_value.append("c")
+
+    # Assert
+    assert application_properties.get_property("property", list) == ["a", "b"]
+
+
+def test_properties_set_property_with_bad_name() -> None:
+    """
+    Test setting a property with a name that is not a valid key.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.set_property("feature..level", 1)
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "Property name 'feature..level' is not valid: Full property key cannot contain multiples of the . without any text between them."
+    ), "Expected message was not present in exception."
+
+
+def test_properties_set_property_with_dictionary_value() -> None:
+    """
+    Test setting a property to a dictionary, which must be loaded with `load_from_dict` instead.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.set_property("feature", {"level": 1})
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The value for property 'feature' cannot be a dictionary."
+    ), "Expected message was not present in exception."
+
+
+def test_properties_set_properties_reports_all_errors() -> None:
+    """
+    Test setting many properties where more than one is not valid, making sure
+    that every problem is reported and that nothing is set.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    property_values: Dict[Any, Any] = {
+        "good": 1,
+        ".bad": 2,
+        "worse": {"a": 1},
+        3: 4,
+    }
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.set_properties(property_values)
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert str(raised_exception) == (
+        "Property name '.bad' is not valid: Full property key must not start or end with the '.' character.\n"
+        + "The value for property 'worse' cannot be a dictionary.\n"
+        + "The propertyName argument must be a string."
+    ), "Expected message was not present in exception."
+    assert not application_properties.property_names
+
+
+def test_properties_set_properties_with_mapping() -> None:
+    """
+    Test setting many properties at once.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    application_properties.set_properties({"a.b": 1, "a.c": "two", "d": False})
+
+    # Assert
+    assert application_properties.property_names == ["a.b", "a.c", "d"]
+    assert application_properties.get_boolean_property("d") is False
+
+
+def test_properties_set_properties_not_mapping() -> None:
+    """
+    Test setting many properties with something that is not a mapping.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.set_properties([("a", 1)])  # type: ignore
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception) == "The property_values argument must be a mapping."
+    ), "Expected message was not present in exception."
+
+
+def test_properties_set_property_when_frozen() -> None:
+    """
+    Test setting and removing properties on frozen properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_property("property", 1)
+    application_properties.freeze()
+    raised_messages: List[str] = []
+
+    property_changes: List[Callable[[], Any]] = [
+        lambda: application_properties.set_property("property", 2),
+        lambda: application_properties.set_properties({"property": 2}),
+        lambda: application_properties.remove_property("property"),
+        lambda: application_properties.remove_under("property"),
+    ]
+
+    # Act
+    for next_change in property_changes:
+        try:
+            next_change()
+            raise AssertionError("Should have raised an exception by now.")
+        except ValueError as this_exception:
+            raised_messages.append(str(this_exception))
+
+    # Assert
+    assert raised_messages == ["Frozen properties cannot be changed."] * 4
+    assert application_properties.get_integer_property("property") == 1
+
+
+def test_properties_remove_property() -> None:
+    """
+    Test removing a property that is present and one that is not.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_properties(["feature.level=1", "feature.name=a"])
+    change_count = application_properties.change_count
+
+    # Act
+    was_removed = application_properties.remove_property("Feature.Level")
+    was_removed_again = application_properties.remove_property("feature.level")
+
+    # Assert
+    assert was_removed
+    assert not was_removed_again
+    assert application_properties.change_count == change_count + 1
+    assert application_properties.property_names == ["feature.name"]
+    assert application_properties.property_names_under("feature") == ["feature.name"]
+    assert application_properties.get_integer_property("feature.level", -1) == -1
+
+
+def test_properties_remove_property_leaves_other_keys() -> None:
+    """
+    Test removing a property that has other properties under it.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.set_properties({"feature": 1, "feature.level": 2})
+
+    # Act
+    was_removed = application_properties.remove_property("feature")
+
+    # Assert
+    assert was_removed
+    assert application_properties.property_names_under("feature") == ["feature.level"]
+    assert application_properties.number_of_properties_under("feature") == 1
+
+
+def test_properties_remove_under() -> None:
+    """
+    Test removing all of the properties under a key.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "plugins": {"first": {"a": 1, "b": 2}, "firsts": {"a": 3}},
+            "other": 4,
+        }
+    )
+
+    # Act
+    removed_count = application_properties.remove_under("plugins.first")
+    removed_again_count = application_properties.remove_under("plugins.first")
+
+    # Assert
+    assert removed_count == 2
+    assert removed_again_count == 0
+    assert application_properties.property_names == ["plugins.firsts.a", "other"]
+    assert application_properties.number_of_properties_under("plugins") == 1
+    assert application_properties.property_names_under("plugins.first") == []
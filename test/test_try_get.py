@@ -0,0 +1,327 @@
+"""
+Tests for the try_get_* functions of the ApplicationProperties class
+"""
+
+from typing import Any
+
+from application_properties import (
+    ApplicationProperties,
+    ApplicationPropertiesFacade,
+    PropertyLookupStatus,
+    RangeValidator,
+)
+
+
+def check_positive(value: int) -> None:
+    """
+    Validation function that only accepts positive values.
+    """
+    if value <= 0:
+        raise ValueError("Value must be positive.")
+
+
+def test_properties_try_get_found() -> None:
+    """
+    Test trying to get properties that are present and valid.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {"property": {"int": 1, "bool": True, "str": "me", "float": 1.5}}
+    )
+
+    # Act
+    integer_result = application_properties.try_get_integer_property(
+        "property.int", valid_value_fn=check_positive
+    )
+    boolean_result = application_properties.try_get_boolean_property("property.bool")
+    string_result = application_properties.try_get_string_property("Property.Str")
+    float_result = application_properties.try_get_property("property.float", float)
+
+    # Assert
+    assert integer_result.status == PropertyLookupStatus.FOUND
+    assert integer_result.value == 1
+    assert integer_result.is_found
+    assert integer_result.reason is None
+    assert boolean_result.value is True
+    assert string_result.value == "me"
+    assert string_result.property_name == "property.str"
+    assert float_result.value == 1.5
+
+
+def test_properties_try_get_missing() -> None:
+    """
+    Test trying to get a property that is not present.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+
+    # Act
+    actual_result = application_properties.try_get_integer_property("property", 3)
+
+    # Assert
+    assert actual_result.status == PropertyLookupStatus.MISSING
+    assert actual_result.value == 3
+    assert not actual_result.is_found
+    assert actual_result.reason == "A value for property 'property' was not found."
+
+
+def test_properties_try_get_wrong_type() -> None:
+    """
+    Test trying to get a property that is present with a different type.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"property": True})
+
+    # Act
+    actual_result = application_properties.try_get_integer_property("property", 3)
+
+    # Assert
+    assert actual_result.status == PropertyLookupStatus.WRONG_TYPE
+    assert actual_result.value == 3
+    assert (
+        actual_result.reason
+        == "The value for property 'property' must be of type 'int'."
+    )
+
+
+def test_properties_try_get_untyped_conversion() -> None:
+    """
+    Test trying to get a property that is converted from an untyped value.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_properties(["property=12", "other=twelve"])
+
+    # Act
+    integer_result = application_properties.try_get_integer_property("property")
+    other_result = application_properties.try_get_integer_property("other")
+
+    # Assert
+    assert integer_result.status == PropertyLookupStatus.FOUND
+    assert integer_result.value == 12
+    assert other_result.status == PropertyLookupStatus.WRONG_TYPE
+    assert other_result.value is None
+
+
+def test_properties_try_get_not_valid_with_function() -> None:
+    """
+    Test trying to get a property that its validation function rejects.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"property": -1})
+
+    # Act
+    actual_result = application_properties.try_get_integer_property(
+        "property", 5, valid_value_fn=check_positive
+    )
+
+    # Assert
+    assert actual_result.status == PropertyLookupStatus.NOT_VALID
+    assert actual_result.value == 5
+    assert actual_result.rejected_value == -1
+    assert isinstance(actual_result.detail, ValueError)
+    assert (
+        actual_result.reason
+        == "The value for property 'property' is not valid: Value must be positive."
+    )
+
+
+def test_properties_try_get_not_valid_with_validator() -> None:
+    """
+    Test trying to get a property that its declarative validator rejects, with
+    the reason matching the one raised in strict mode.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"property": 0})
+    validator = RangeValidator(1, 10)
+
+    # Act
+    actual_result = application_properties.try_get_integer_property(
+        "property", valid_value_fn=validator
+    )
+    raised_exception = None
+    try:
+        application_properties.get_integer_property(
+            "property", valid_value_fn=validator, strict_mode=True
+        )
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert actual_result.status == PropertyLookupStatus.NOT_VALID
+    assert actual_result.detail is validator
+    assert actual_result.reason == str(raised_exception)
+    assert (
+        actual_result.reason
+        == "The value for property 'property' is not valid: Value 0 is less than the minimum of 1."
+    )
+
+
+def test_properties_try_get_does_not_use_strict_mode() -> None:
+    """
+    Test that trying to get a property does not raise, even in strict mode.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(strict_mode=True)
+    application_properties.load_from_dict({"property": "1"})
+
+    # Act
+    actual_result = application_properties.try_get_integer_property("property")
+
+    # Assert
+    assert actual_result.status == PropertyLookupStatus.WRONG_TYPE
+
+
+def test_properties_try_get_bad_arguments_still_raise() -> None:
+    """
+    Test that problems with the arguments themselves still raise an exception.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    bad_calls: Any = [
+        (lambda: application_properties.try_get_property(1, int)),  # type: ignore
+        (lambda: application_properties.try_get_property("property", 1)),  # type: ignore
+        (lambda: application_properties.try_get_integer_property("property", "1")),  # type: ignore
+    ]
+
+    # Act
+    raised_messages = []
+    for next_call in bad_calls:
+        try:
+            next_call()
+            raise AssertionError("Should have raised an exception by now.")
+        except ValueError as this_exception:
+            raised_messages.append(str(this_exception))
+
+    # Assert
+    assert raised_messages == [
+        "The propertyName argument must be a string.",
+        "The property_type argument for 'property' must be a type.",
+        "The default value for property 'property' must either be None or a 'int' value.",
+    ]
+
+
+def test_properties_try_get_string_list() -> None:
+    """
+    Test trying to get list of strings properties in each of the possible states.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "good": "a, b",
+            "good_list": ["a", "b"],
+            "empty": "a,,b",
+            "non_string": ["a", 1],
+            "wrong": 1,
+        }
+    )
+
+    # Act
+    good_result = application_properties.try_get_string_list_property("good", ",")
+    good_list_result = application_properties.try_get_string_list_property("good_list")
+    missing_result = application_properties.try_get_string_list_property(
+        "missing", ",", ["c"]
+    )
+    empty_result = application_properties.try_get_string_list_property("empty", ",")
+    non_string_result = application_properties.try_get_string_list_property(
+        "non_string"
+    )
+    wrong_result = application_properties.try_get_string_list_property("wrong", ",")
+
+    # Assert
+    assert good_result.value == ["a", "b"]
+    assert good_list_result.value == ["a", "b"]
+    assert missing_result.status == PropertyLookupStatus.MISSING
+    assert missing_result.value == ["c"]
+    assert empty_result.status == PropertyLookupStatus.NOT_VALID
+    assert (
+        empty_result.reason
+        == "The value for property 'empty' is not valid: Configuration item 'empty' contains at least one empty element."
+    )
+    assert non_string_result.status == PropertyLookupStatus.NOT_VALID
+    assert wrong_result.status == PropertyLookupStatus.WRONG_TYPE
+    assert (
+        wrong_result.reason
+        == "The value for property 'wrong' must be of type 'str' or type 'List[str]'."
+    )
+
+
+def test_properties_try_get_string_list_returns_copies() -> None:
+    """
+    Test that changing a list that was returned does not change later results.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"property": "a,b"})
+    first_result = application_properties.try_get_string_list_property("property", ",")
+
+    # Act
+    first_result.value.append("c")
+    second_result = application_properties.try_get_string_list_property("property", ",")
+
+    # Assert
+    assert second_result.value == ["a", "b"]
+
+
+def test_properties_try_get_string_list_not_valid_with_function() -> None:
+    """
+    Test trying to get a list of strings that its validation function rejects.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"property": "a,b,c"})
+
+    def check_short(value: Any) -> None:
+        if len(value) > 2:
+            raise ValueError("Too many elements.")
+
+    # Act
+    actual_result = application_properties.try_get_string_list_property(
+        "property", ",", valid_value_fn=check_short
+    )
+
+    # Assert
+    assert actual_result.status == PropertyLookupStatus.NOT_VALID
+    assert actual_result.rejected_value == ["a", "b", "c"]
+    assert (
+        actual_result.reason
+        == "The value for property 'property' is not valid: Too many elements."
+    )
+
+
+def test_properties_try_get_through_facade() -> None:
+    """
+    Test trying to get properties through a facade.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"plugins": {"md001": {"level": 2}}})
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.md001.")
+
+    # Act
+    found_result = facade.try_get_integer_property("level")
+    missing_result = facade.try_get_string_property("name", "default")
+
+    # Assert
+    assert found_result.value == 2
+    assert missing_result.status == PropertyLookupStatus.MISSING
+    assert missing_result.property_name == "plugins.md001.name"
+    assert missing_result.value == "default"
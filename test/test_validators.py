@@ -0,0 +1,378 @@
+"""
+Tests for the declarative validators used with the ApplicationProperties class
+"""
+
+from typing import List
+
+from application_properties import (
+    AllOfValidator,
+    AnyOfValidator,
+    ApplicationProperties,
+    ApplicationPropertiesValidator,
+    ChoicesValidator,
+    LengthValidator,
+    PredicateValidator,
+    RangeValidator,
+    RegexValidator,
+)
+
+
+def test_validators_equal_validators_have_equal_hashes() -> None:
+    """
+    Test that validators created with the same arguments are equal and hash the same.
+    """
+
+    # Arrange
+    first_validator = RangeValidator(1, 10) & ChoicesValidator((1, 2, 3))
+    second_validator = RangeValidator(1, 10) & ChoicesValidator((1, 2, 3))
+
+    # Act
+    validator_set = {first_validator, second_validator}
+
+    # Assert
+    assert first_validator == second_validator
+    assert len(validator_set) == 1
+    assert RegexValidator("a+") == RegexValidator("a+")
+    assert RegexValidator("a+") != RegexValidator("a+", 2)
+
+
+def test_validators_range() -> None:
+    """
+    Test the range validator with values inside and outside of its range.
+    """
+
+    # Arrange
+    validator = RangeValidator(1, 10)
+
+    # Act
+    found_errors = [
+        validator.find_error(next_value) for next_value in [1, 10, 0, 11, "a"]
+    ]
+
+    # Assert
+    assert found_errors == [
+        None,
+        None,
+        "Value 0 is less than the minimum of 1.",
+        "Value 11 is greater than the maximum of 10.",
+        "Value 'a' cannot be compared to the range.",
+    ]
+
+
+def test_validators_choices() -> None:
+    """
+    Test the choices validator with a valid choice, a missing choice, and an unhashable value.
+    """
+
+    # Arrange
+    validator = ChoicesValidator(("red", "green"))
+
+    # Act
+    found_errors = [
+        validator.find_error(next_value) for next_value in ["red", "blue", []]
+    ]
+
+    # Assert
+    assert found_errors == [
+        None,
+        "Value 'blue' is not one of: 'red', 'green'.",
+        "Value [] is not one of: 'red', 'green'.",
+    ]
+
+
+def test_validators_regex() -> None:
+    """
+    Test the regex validator with a matching, a partially matching, and a non-string value.
+    """
+
+    # Arrange
+    validator = RegexValidator("[a-z]+")
+
+    # Act
+    found_errors = [
+        validator.find_error(next_value) for next_value in ["abc", "abc1", 1]
+    ]
+
+    # Assert
+    assert found_errors == [
+        None,
+        "Value 'abc1' does not match the pattern '[a-z]+'.",
+        "Value 1 must be a string to match the pattern '[a-z]+'.",
+    ]
+
+
+def test_validators_length() -> None:
+    """
+    Test the length validator with values of different lengths.
+    """
+
+    # Arrange
+    validator = LengthValidator(1, 2)
+
+    # Act
+    found_errors = [
+        validator.find_error(next_value) for next_value in ["a", "", "abc", 1]
+    ]
+
+    # Assert
+    assert found_errors == [
+        None,
+        "Value '' is shorter than the minimum length of 1.",
+        "Value 'abc' is longer than the maximum length of 2.",
+        "Value 1 does not have a length.",
+    ]
+
+
+def test_validators_composition() -> None:
+    """
+    Test composing validators with the `&` and `|` operators.
+    """
+
+    # Arrange
+    even_validator = PredicateValidator(lambda value: value % 2 == 0, "an even number")
+    validator = (RangeValidator(0, 10) & even_validator) | ChoicesValidator((99,))
+
+    # Act
+    found_errors = [validator.find_error(next_value) for next_value in [4, 99, 5]]
+
+    # Assert
+    assert isinstance(validator, AnyOfValidator)
+    assert isinstance(validator.validators[0], AllOfValidator)
+    assert found_errors == [
+        None,
+        None,
+        "Value 5 is not an even number. Value 5 is not one of: 99.",
+    ]
+
+
+def test_validators_call_raises_value_error() -> None:
+    """
+    Test that calling a validator directly raises a ValueError for a value that is not valid.
+    """
+
+    # Arrange
+    validator = RangeValidator(maximum=1)
+
+    # Act
+    raised_exception = None
+    try:
+        validator(2)
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception) == "Value 2 is greater than the maximum of 1."
+    ), "Expected message was not present in exception."
+
+
+def test_validators_base_class_cannot_be_created() -> None:
+    """
+    Test that the base validator class cannot be created without a `find_error`.
+    """
+
+    # Arrange
+    validator_class = ApplicationPropertiesValidator
+
+    # Act
+    raised_exception = None
+    try:
+        # pylint: disable=abstract-class-instantiated
+        validator_class()  # type: ignore[abstract]
+        # pylint: enable=abstract-class-instantiated
+        raise AssertionError("Should have raised an exception by now.")
+    except TypeError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert "find_error" in str(
+        raised_exception
+    ), "Expected message was not present in exception."
+
+
+def test_validators_get_property_strict_mode() -> None:
+    """
+    Test getting a property with a validator in strict mode.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(strict_mode=True)
+    application_properties.load_from_dict({"property": 20})
+
+    # Act
+    raised_exception = None
+    try:
+        application_properties.get_integer_property(
+            "property", valid_value_fn=RangeValidator(1, 10)
+        )
+        raise AssertionError("Should have raised an exception by now.")
+    except ValueError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+    assert (
+        str(raised_exception)
+        == "The value for property 'property' is not valid: Value 20 is greater than the maximum of 10."
+    ), "Expected message was not present in exception."
+
+
+def test_validators_get_property_result_is_remembered() -> None:
+    """
+    Test that the result of a validator is remembered until the property changes.
+    """
+
+    # Arrange
+    checked_values: List[int] = []
+
+    def record_value(value: int) -> bool:
+        checked_values.append(value)
+        return value > 0
+
+    validator = PredicateValidator(record_value, "a positive number")
+    application_properties = ApplicationProperties()
+    application_properties.set_manual_property("property=$#1")
+
+    # Act
+    first_value = application_properties.get_integer_property(
+        "property", -1, valid_value_fn=validator
+    )
+    second_value = application_properties.get_integer_property(
+        "property", -1, valid_value_fn=validator
+    )
+    application_properties.set_manual_property("property=$#-2")
+    third_value = application_properties.get_integer_property(
+        "property", -1, valid_value_fn=validator
+    )
+
+    # Assert
+    assert (first_value, second_value, third_value) == (1, 1, -1)
+    assert checked_values == [1, -2]
+
+
+def test_validators_get_property_result_is_remembered_for_equal_validator() -> None:
+    """
+    Test that the result of a validator created again for each call is still
+    remembered, as equal validators share the remembered result.
+    """
+
+    # Arrange
+    checked_values: List[str] = []
+
+    def record_value(value: str) -> bool:
+        checked_values.append(value)
+        return value.startswith("x")
+
+    application_properties = ApplicationProperties()
+    application_properties.set_manual_property("a.b=xyz")
+
+    # Act
+    found_values = [
+        application_properties.get_string_property(
+            "a.b",
+            valid_value_fn=PredicateValidator(record_value, "starting with x")
+            & RegexValidator("x.*"),
+        )
+        for _ in range(1000)
+    ]
+
+    # Assert
+    assert found_values == ["xyz"] * 1000
+    assert checked_values == ["xyz"]
+    # pylint: disable=protected-access
+    validation_results = (
+        application_properties._ApplicationProperties__store.validation_results  # type: ignore[attr-defined]
+    )
+    # pylint: enable=protected-access
+    assert len(validation_results["a.b"]) == 1
+
+
+def test_validators_get_property_with_converted_types() -> None:
+    """
+    Test that the remembered result of a validator depends on the type asked for.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_property("property=5")
+    validator = LengthValidator(1, 1)
+
+    # Act
+    string_value = application_properties.get_string_property(
+        "property", "x", valid_value_fn=validator
+    )
+    integer_value = application_properties.get_integer_property(
+        "property", -1, valid_value_fn=validator
+    )
+
+    # Assert
+    assert string_value == "5"
+    assert integer_value == -1
+
+
+def test_validators_get_string_list_property() -> None:
+    """
+    Test getting a string list property with a validator for its length.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"property": "a,b,c"})
+
+    # Act
+    comma_value = application_properties.get_string_list_property(
+        "property", ",", ["default"], valid_value_fn=LengthValidator(maximum=2)
+    )
+    semicolon_value = application_properties.get_string_list_property(
+        "property", ";", ["default"], valid_value_fn=LengthValidator(maximum=2)
+    )
+
+    # Assert
+    assert comma_value == ["default"]
+    assert semicolon_value == ["a,b,c"]
+
+
+def test_validators_is_valid_matches_find_error() -> None:
+    """
+    Test that the quicker `is_valid` check agrees with `find_error`.
+    """
+
+    # Arrange
+    validators = [
+        RangeValidator(1, 10),
+        ChoicesValidator((1, 2)),
+        LengthValidator(1, 2),
+        RegexValidator("[0-9]"),
+    ]
+    test_values = [0, 1, 11, "1", "", [], [1, 2, 3]]
+
+    # Act
+    mismatches = [
+        (next_validator, next_value)
+        for next_validator in validators
+        for next_value in test_values
+        if next_validator.is_valid(next_value)
+        != (next_validator.find_error(next_value) is None)
+    ]
+
+    # Assert
+    assert not mismatches
+
+
+def test_validators_remembers_results_for_composition() -> None:
+    """
+    Test that a composed validator is only remembered if one of its parts is.
+    """
+
+    # Arrange
+    simple_validator = RangeValidator(1, 10) & LengthValidator(1)
+
+    # Act
+    composed_validator = simple_validator | RegexValidator("a")
+
+    # Assert
+    assert not simple_validator.remembers_results
+    assert composed_validator.remembers_results
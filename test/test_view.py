@@ -0,0 +1,199 @@
+"""
+Tests for the view function of the ApplicationProperties class
+"""
+
+from collections.abc import Mapping
+
+from application_properties import (
+    ApplicationProperties,
+    ApplicationPropertiesFacade,
+    ApplicationPropertiesView,
+)
+
+
+def test_properties_view_is_a_mapping() -> None:
+    """
+    Test that the view behaves as a read-only mapping of the properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"Feature": {"enabled": True}, "level": 1})
+
+    # Act
+    properties_view = application_properties.view()
+
+    # Assert
+    assert isinstance(properties_view, Mapping)
+    assert isinstance(properties_view, ApplicationPropertiesView)
+    assert len(properties_view) == 2
+    assert list(properties_view) == ["feature.enabled", "level"]
+    assert properties_view["level"] == 1
+    assert "feature.enabled" in properties_view
+    assert "Feature.enabled" not in properties_view
+    assert properties_view.get("missing", "default") == "default"
+    assert dict(properties_view) == {"feature.enabled": True, "level": 1}
+    assert properties_view == {"feature.enabled": True, "level": 1}
+    assert (
+        repr(properties_view)
+        == "ApplicationPropertiesView({'feature.enabled': True, 'level': 1})"
+    )
+
+
+def test_properties_view_missing_key() -> None:
+    """
+    Test that getting a missing key from the view raises a KeyError.
+    """
+
+    # Arrange
+    properties_view = ApplicationProperties().view()
+
+    # Act
+    raised_exception = None
+    try:
+        _ = properties_view["missing"]
+        raise AssertionError("Should have raised an exception by now.")
+    except KeyError as this_exception:
+        raised_exception = this_exception
+
+    # Assert
+    assert raised_exception, "Expected exception was not raised."
+
+
+def test_properties_view_hides_untyped_values() -> None:
+    """
+    Test that the untyped copies of manually set values are not seen in the view.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties(convert_untyped_if_possible=True)
+    application_properties.set_manual_properties(["level=1", "name=$$me"])
+
+    # Act
+    properties_view = application_properties.view()
+
+    # Assert
+    assert dict(properties_view) == {"level": "1", "name": "me"}
+
+
+def test_properties_view_is_live() -> None:
+    """
+    Test that a live view sees later changes, including published properties.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"level": 1})
+    properties_view = application_properties.view()
+
+    # Act
+    application_properties.set_property("other", 2)
+    application_properties.remove_property("level")
+    staged_properties = application_properties.create_staging()
+    staged_properties.load_from_dict({"published": True})
+    application_properties.publish(staged_properties)
+
+    # Assert
+    assert dict(properties_view) == {"published": True}
+
+
+def test_properties_view_snapshot_is_not_live() -> None:
+    """
+    Test that a snapshot view does not see later changes.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"level": 1})
+    properties_view = application_properties.view(snapshot=True)
+
+    # Act
+    application_properties.set_property("level", 2)
+    application_properties.set_property("other", 3)
+
+    # Assert
+    assert dict(properties_view) == {"level": 1}
+    assert dict(application_properties.view()) == {"level": 2, "other": 3}
+
+
+def test_properties_view_snapshot_of_frozen_properties() -> None:
+    """
+    Test taking a snapshot view of properties that are already frozen.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"level": 1})
+    frozen_properties = application_properties.snapshot()
+
+    # Act
+    properties_view = frozen_properties.view(snapshot=True)
+
+    # Assert
+    assert dict(properties_view) == {"level": 1}
+
+
+def test_properties_view_snapshot_of_read_session() -> None:
+    """
+    Test that a snapshot view of a read session does not see the live instance
+    being changed or cleared.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"level": 1, "items": [1, 2]})
+    properties_view = application_properties.read_session().view(snapshot=True)
+
+    # Act
+    application_properties.set_property("level", 2)
+    application_properties.clear()
+
+    # Assert
+    assert dict(properties_view) == {"level": 1, "items": [1, 2]}
+    assert not dict(application_properties.view())
+
+
+def test_properties_view_under_key() -> None:
+    """
+    Test a view of the properties under a key, relative to that key.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict(
+        {
+            "plugins": {"md001": {"enabled": True, "options": {"level": 2}}},
+            "plugins2": 1,
+        }
+    )
+    application_properties.set_property("plugins.md001", "itself")
+
+    # Act
+    properties_view = application_properties.view(key_name="Plugins.md001")
+
+    # Assert
+    assert len(properties_view) == 2
+    assert list(properties_view) == ["enabled", "options.level"]
+    assert properties_view["options.level"] == 2
+    assert "enabled" in properties_view
+    assert "md001" not in properties_view
+
+
+def test_properties_view_through_facade() -> None:
+    """
+    Test a view of the properties under a facade.
+    """
+
+    # Arrange
+    application_properties = ApplicationProperties()
+    application_properties.load_from_dict({"plugins": {"md001": {"level": 2}}})
+    facade = ApplicationPropertiesFacade(application_properties, "plugins.")
+
+    # Act
+    live_view = facade.view()
+    snapshot_view = facade.view(snapshot=True)
+    application_properties.set_property("plugins.md002.level", 3)
+
+    # Assert
+    assert dict(live_view) == {"md001.level": 2, "md002.level": 3}
+    assert dict(snapshot_view) == {"md001.level": 2}